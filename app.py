@@ -1,96 +1,417 @@
+# Imported first so the startup timeline starts before any heavy import
+from gesture_racer.utils.startup import timeline
+
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING
+
 import cv2
-from gesture_racer.core.camera import Camera
+import numpy as np
+from gesture_racer.core.controls import Controls
+from gesture_racer.core.parallel_tracking import CONTINUITY_DETECT, CONTINUITY_TRACK, ParallelPoseTracker
+from gesture_racer.core.pipeline import BLOCK, DROP_OLDEST, END_OF_STREAM, Pipeline, Stage
 from gesture_racer.core.pose_tracking import PoseTracker
-from gesture_racer.gestures.gun_pose import GunPoseStrategy
-from gesture_racer.gestures.bend_motion import BendMotionStrategy
-from gesture_racer.gestures.composite import CompositeStrategy
-from gesture_racer.gestures.hand_pan import HandPanStrategy
-from gesture_racer.gestures.hand_turn import HandTurnStrategy
-from gesture_racer.gestures.panic import PanicGestureStrategy
-from gesture_racer.input.pynput_backend import PynputInput
+from gesture_racer.core.sources import PACING_FAST, PACING_REALTIME, open_source
+from gesture_racer.gestures.presets import DEFAULT_STACK, build_strategy
+from gesture_racer.input.base import parse_key_map
+from gesture_racer.input.factory import build_sink
+from gesture_racer.overlay.renderer import OverlayRenderer
+from gesture_racer.overlay.sprites import text_cache
 from gesture_racer.overlay.visualization import draw_pose
+from gesture_racer.utils.kalman import CONSTANT_ACCELERATION, CONSTANT_VELOCITY
+from gesture_racer.utils.tracing import DEFAULT_MAX_FRAMES, enable_tracing, tracer
+from gesture_racer.utils.types import X, Z, FramePacket
+
+if TYPE_CHECKING:
+    from gesture_racer.gestures.composite import CompositeStrategy
+    from gesture_racer.utils.filters import OneEuroFilterBank
+
+
+def build_tracker(args, warm_up: bool = True):
+    """Construct the tracker selected on the command line (this is where mediapipe gets imported).
+
+    With warm_up, one blank-frame inference also runs so the first camera frame does not pay
+    for graph setup.
+    """
+    # The preview is mirrored (selfie view); landmarks are mirrored to match instead of the frames
+    tracker_kwargs = dict(roi=args.roi, max_input_width=args.max_input_width, mirror=True)
+    with timeline.span('build_tracker'):
+        if args.workers > 1:
+            tracker = ParallelPoseTracker(num_workers=args.workers, continuity=args.continuity,
+                                          model_complexity=args.model_complexity, **tracker_kwargs)
+        elif args.governor:
+            from gesture_racer.core.governor import DEFAULT_LEVELS, QualityGovernor
+            # Start from the best level at the requested complexity
+            start_level = next(i for i, lv in enumerate(DEFAULT_LEVELS) if lv.model_complexity == args.model_complexity)
+            tracker = QualityGovernor(target_fps=args.target_fps, max_latency_ms=args.max_latency_ms,
+                                      start_level=start_level, **tracker_kwargs)
+        else:
+            tracker = PoseTracker(model_complexity=args.model_complexity, **tracker_kwargs)
+        if args.gate:
+            from gesture_racer.core.gating import GatedPoseTracker
+            tracker = GatedPoseTracker(tracker, idle_after_sec=args.idle_after)
+    if warm_up:
+        with timeline.span('warm_up'):
+            tracker.warm_up()
+    return tracker
+
+
+def calibrate_neutral(strategy: 'CompositeStrategy', pose) -> bool:
+    """Calibrate HandPan neutral center using the current wrist average."""
+    from gesture_racer.gestures.hand_pan import HandPanStrategy
+    mid = pose.features['wrist_mid']
+    if mid is None:
+        return False
+    neutral_x, neutral_y = mid
+    # Update hand pan neutral
+    for s in strategy.strategies:
+        if isinstance(s, HandPanStrategy):
+            s._neutral_x = neutral_x
+            s._neutral_y = neutral_y
+    return True
+
+
+def draw_status(frame, pose, cmd):
+    status = []
+    if cmd.forward: status.append('Forward')
+    if cmd.backward: status.append('Backward')
+    if cmd.left: status.append('Left')
+    if cmd.right: status.append('Right')
+    if cmd.brake: status.append('Brake')
+    if cmd.fire: status.append('Fire')
+    # Key combinations come from a small set and are cached; the pan readout changes every frame,
+    # so it is drawn directly after them
+    panning = abs(cmd.mouse_dx) > 0.01 or abs(cmd.mouse_dy) > 0.01
+    x = 20
+    if status or not panning:
+        text = ' | '.join(status) if status else 'Idle'
+        text_cache.put_text(frame, text, (x, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 1, cv2.LINE_AA)
+        x += cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 1)[0][0]
+    if panning:
+        pan = f'Pan dx={cmd.mouse_dx:.1f}, dy={cmd.mouse_dy:.1f}'
+        cv2.putText(frame, f' | {pan}' if status else pan, (x if status else 20, 60),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 1, cv2.LINE_AA)
+
+    text_cache.put_text(frame, "Press 'q' to quit | 'c' to calibrate", (20, pose.height - 20),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1, cv2.LINE_AA)
+
+
+def smooth_pose(smoother: 'OneEuroFilterBank', pose):
+    """Filter x, y and z of every landmark in one call; z is scaled to pixels so one beta fits all."""
+    if pose.landmarks is None:
+        smoother.reset()
+        return pose
+    scale = np.array([1.0, 1.0, float(pose.width)])
+    smoothed = pose.landmarks.copy()
+    smoothed[:, X:Z + 1] = smoother.update(pose.landmarks[:, X:Z + 1] * scale, pose.timestamp) / scale
+    return replace(pose, landmarks=smoothed)
+
+
+def print_stats(pipeline: Pipeline):
+    print('Pipeline stage stats:')
+    for name, st in pipeline.stats().items():
+        print(f"  {name:<8} depth={st['depth']} max_depth={st['max_depth']} dropped={st['dropped']} "
+              f"processed={st['processed']} mean={st['mean_ms']:.2f}ms")
 
 
-def main():
-    cam = Camera()
-    if not cam.open():
-        print('Error: Could not open camera.')
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Gesture Racer - body pose game control')
+    parser.add_argument('--source', default='0',
+                        help='Camera index, video file or image directory (default: camera 0)')
+    parser.add_argument('--pacing', default=PACING_REALTIME, choices=(PACING_REALTIME, PACING_FAST),
+                        help='Playback pacing for recorded sources; fast is lossless and deterministic')
+    parser.add_argument('--loop', action='store_true', help='Loop recorded sources')
+    parser.add_argument('--max-frames', type=int, default=0, help='Stop after this many frames (0 = no limit)')
+    parser.add_argument('--headless', action='store_true',
+                        help="Run without the OpenCV preview window; control via stdin ('q'/'c') or signals")
+    parser.add_argument('--overlay-fps', type=float, default=15.0,
+                        help='Maximum preview refresh rate; the preview never slows the control path')
+    parser.add_argument('--input', default='pynput', choices=('pynput', 'null'),
+                        help='Input sink; null discards events')
+    parser.add_argument('--keys', default='wasd', type=parse_key_map,
+                        help="Key profile (wasd, arrows) or intent=key pairs, e.g. 'forward=up,backward=down,brake=space'")
+    parser.add_argument('--log-commands', metavar='PATH',
+                        help='Write one JSON line per frame with the evaluated Command')
+    parser.add_argument('--record', metavar='PATH',
+                        help='Record every detected pose to a landmark log for offline replay')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='Trace every stage per frame; writes a Chrome/Perfetto trace JSON and prints p50/p95/p99')
+    parser.add_argument('--trace-frames', type=int, default=DEFAULT_MAX_FRAMES,
+                        help='With --trace, keep only the last N frames in memory')
+    parser.add_argument('--model-complexity', type=int, default=1, choices=(0, 1, 2),
+                        help='MediaPipe Pose model complexity')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of pose inference processes; frames are spread round-robin across them')
+    parser.add_argument('--continuity', default=CONTINUITY_TRACK, choices=(CONTINUITY_TRACK, CONTINUITY_DETECT),
+                        help='Per-worker tracking mode when --workers > 1')
+    parser.add_argument('--roi', action='store_true',
+                        help="Crop and downscale inference input to the previous frame's pose region")
+    parser.add_argument('--max-input-width', type=int, default=None, metavar='PX',
+                        help='Downscale full frames to at most this width before inference '
+                             '(costs extra preprocessing; benchmark detect before enabling)')
+    parser.add_argument('--governor', action='store_true',
+                        help='Adapt model complexity, inference resolution and stride to hold --target-fps')
+    parser.add_argument('--target-fps', type=float, default=30.0, help='Frame-rate target for --governor')
+    parser.add_argument('--max-latency-ms', type=float, default=None,
+                        help='Also step quality down when a single inference takes longer than this')
+    parser.add_argument('--gate', action='store_true',
+                        help='Skip inference on static frames and idle at a low detection rate when nobody is present')
+    parser.add_argument('--idle-after', type=float, default=5.0,
+                        help='Seconds without a detected person before --gate goes idle')
+    parser.add_argument('--predict-ms', type=float, default=None,
+                        help='Kalman-filter landmarks and predict them this far past capture (plus measured '
+                             'pipeline delay for live sources) before evaluating gestures')
+    parser.add_argument('--predict-model', default=CONSTANT_VELOCITY, choices=(CONSTANT_VELOCITY, CONSTANT_ACCELERATION),
+                        help='Motion model for --predict-ms')
+    parser.add_argument('--smooth', default='none', choices=('none', 'one-euro'),
+                        help='Smooth all landmarks once after tracking (replaces the HandPan EMA)')
+    parser.add_argument('--smooth-min-cutoff', type=float, default=1.0,
+                        help='One Euro minimum cutoff in Hz: lower removes more jitter at rest')
+    parser.add_argument('--smooth-beta', type=float, default=0.01,
+                        help='One Euro speed coefficient: higher reduces lag during fast motion')
+    parser.add_argument('--change-epsilon', type=float, default=0.0, metavar='PX',
+                        help='Reuse a stateless strategy\'s last result while its landmarks moved at most this '
+                             'many pixels (0 = only for identical poses, e.g. repeated by --gate)')
+    parser.add_argument('--input-dispatch', default='async', choices=('async', 'sync'),
+                        help='async injects input on its own thread so a slow display server never '
+                             'backs up the pipeline; sync calls the backend from the input stage')
+    parser.add_argument('--output-rate', type=float, default=0.0, metavar='HZ',
+                        help='Move the mouse from a dedicated thread at this rate using strategy velocities '
+                             '(e.g. 500); 0 moves once per camera frame')
+    parser.add_argument('--sequential-startup', action='store_true',
+                        help='Open the source first and build the pose graph afterwards, without warm-up '
+                             '(the old startup order, for comparison)')
+    parser.add_argument('--startup-report', metavar='PATH',
+                        help='Write the startup timeline as JSON (see benchmarks/bench_startup.py)')
+    args = parser.parse_args(argv)
+    if args.trace_frames < 1:
+        parser.error('--trace-frames must be at least 1')
+    if args.workers > 1 and (args.governor or args.gate):
+        parser.error('--governor and --gate cannot be combined with --workers > 1')
+    return args
+
+
+def main(argv=None):
+    timeline.mark('main')
+    args = parse_args(argv)
+    if args.trace:
+        enable_tracing(max_frames=args.trace_frames)
+    pending_tracker = None
+    if not args.sequential_startup:
+        # Graph construction and warm-up overlap with opening the camera and the rest of setup
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='startup')
+        pending_tracker = executor.submit(build_tracker, args)
+        executor.shutdown(wait=False)
+    with timeline.span('open_source'):
+        source = open_source(args.source, pacing=args.pacing, loop=args.loop)
+    if source is None:
+        print(f'Error: Could not open source {args.source!r}.')
+        if pending_tracker is not None:
+            pending_tracker.result().close()
         return
 
-    tracker = PoseTracker(model_complexity=1)
-    input_backend = PynputInput()
+    with timeline.span('build_sink'):
+        input_backend = build_sink(args.input, async_dispatch=args.input_dispatch == 'async', key_map=args.keys)
+    output = None
+    if args.output_rate > 0:
+        from gesture_racer.input.output_thread import HighRateOutput
+        output = HighRateOutput(input_backend, rate_hz=args.output_rate)
+    # With landmark smoothing upstream, HandPan's own EMA would only add lag
+    with timeline.span('build_strategy'):
+        strategy = build_strategy([dict(entry, ema_alpha=1.0) if entry['type'] == 'hand_pan' else entry
+                                   for entry in DEFAULT_STACK] if args.smooth != 'none' else None,
+                                  epsilon=args.change_epsilon)
+    command_log = open(args.log_commands, 'w') if args.log_commands else None
+    recorder = None
+    if args.record:
+        from gesture_racer.core.landmark_log import LandmarkLogWriter
+        recorder = LandmarkLogWriter(args.record)
+    smoother = None
+    if args.smooth == 'one-euro':
+        from gesture_racer.utils.filters import OneEuroFilterBank
+        smoother = OneEuroFilterBank(min_cutoff=args.smooth_min_cutoff, beta=args.smooth_beta)
+    predictor = None
+    if args.predict_ms is not None:
+        from gesture_racer.utils.kalman import LandmarkKalman
+        predictor = LandmarkKalman(model=args.predict_model, forecast_horizon_sec=args.predict_ms / 1000.0)
 
-    # Combine strategies: bend motion (forward/back) + gun pose (fire)
-    strategy = CompositeStrategy([
-        BendMotionStrategy(lean_threshold=0.10),
-        GunPoseStrategy(elbow_bent_threshold_deg=70.0, wrist_distance_px=120),
-        HandTurnStrategy(dead_zone_px=40, invert_x=False, hysteresis_px=20),
-        PanicGestureStrategy(duration_sec=0.8),
-        HandPanStrategy(sensitivity=0.6, dead_zone_px=25, max_px_per_frame=30.0, invert_y=False,
-                        use_velocity=False, ema_alpha=0.35, neutral_center=True),
-    ])
+    controls = Controls()
+    frame_ids = count()
+    source_frames = [0]
 
-    try:
+    def capture():
+        if args.max_frames and source_frames[0] >= args.max_frames:
+            return END_OF_STREAM
+        with tracer.span('capture'):
+            ok, frame, frame_time = source.read_stamped()
+        if not ok:
+            return END_OF_STREAM if source.finished else None
+        source_frames[0] += 1
+        timeline.mark('first_frame')
+        ts = frame_time if source.monotonic_clock else monotonic()
+        return FramePacket(seq=next(frame_ids), timestamp=ts, frame=frame, frame_time=frame_time)
+
+    def track(pkt: FramePacket) -> FramePacket:
+        tracer.set_frame(pkt.seq)
+        if isinstance(tracker, ParallelPoseTracker):
+            # Returns an earlier packet, in order, once its worker has finished
+            with tracer.span('track'):
+                pkt = tracker.process(pkt)
+            if pkt is None:
+                return None
+        else:
+            pkt.pose = tracker.detect(pkt.frame)
+        return finish_track(pkt)
+
+    def flush_tracker():
+        if not isinstance(tracker, ParallelPoseTracker):
+            return []
+        return [finish_track(pkt) for pkt in tracker.flush()]
+
+    def finish_track(pkt: FramePacket) -> FramePacket:
+        # Runs on frames in order: record the raw pose, then smooth it once for every strategy
+        pkt.pose.timestamp = pkt.frame_time
+        timeline.mark('first_pose')
+        if recorder is not None:
+            recorder.write(pkt.pose)
+        if smoother is not None:
+            with tracer.span('smooth', pkt.seq):
+                pkt.pose = smooth_pose(smoother, pkt.pose)
+        return pkt
+
+    def gesture(pkt: FramePacket) -> FramePacket:
+        tracer.set_frame(pkt.seq)
+        # Calibrate on the gesture thread so strategy state is only touched from one thread
+        if controls.take_calibrate() and calibrate_neutral(strategy, pkt.pose):
+            controls.calibrated_at = monotonic()
+            print('Calibrated neutral center')
+        pose = pkt.pose
+        if predictor is not None:
+            with tracer.span('predict'):
+                predictor.update(pose.landmarks, pkt.frame_time)
+                # Recorded sources only add the fixed horizon so fast-paced runs stay deterministic
+                horizon = args.predict_ms / 1000.0
+                if source.live:
+                    horizon += monotonic() - pkt.timestamp
+                pose = replace(pose, landmarks=predictor.predict_at(pkt.frame_time + horizon))
+        pkt.cmd = strategy.evaluate(pose)
+        return pkt
+
+    def dispatch(pkt: FramePacket) -> FramePacket:
+        # Apply input state changes
+        with tracer.span('set_state', pkt.seq):
+            if output is not None:
+                output.submit(pkt.cmd, now=pkt.frame_time)
+            else:
+                input_backend.set_state(pkt.cmd, now=pkt.frame_time)
+        tracer.frame_done(pkt.seq, pkt.timestamp)
+        if not timeline.seen('first_command'):
+            timeline.mark('first_command')
+            print(timeline.format_report())
+        if command_log is not None:
+            command_log.write(json.dumps({'seq': pkt.seq, 'time': pkt.frame_time, **pkt.cmd.as_dict()}) + '\n')
+        return pkt
+
+    if pending_tracker is not None:
+        with timeline.span('wait_tracker'):
+            tracker = pending_tracker.result()
+    else:
+        tracker = build_tracker(args, warm_up=False)
+
+    # Each stage runs on its own worker. For live sources inference only ever sees the newest
+    # frame. Recorded sources in fast pacing run lossless up to input dispatch so every run gives
+    # identical results. The output slot only feeds the preview and is always latest-wins, so a
+    # slow GUI never holds back input dispatch.
+    live = source.live
+    pipeline = Pipeline(capture, [
+        Stage('track', track, queue_size=1, drop_policy=DROP_OLDEST if live else BLOCK, flush=flush_tracker),
+        Stage('gesture', gesture, queue_size=2, drop_policy=BLOCK),
+        Stage('input', dispatch, queue_size=2, drop_policy=BLOCK),
+    ], output_size=1, output_drop_policy=DROP_OLDEST)
+
+    def latest_output():
+        # The output slot is latest-wins; drain it without waiting
+        pkt = None
         while True:
-            ok, frame = cam.read()
-            if not ok:
-                continue
-
-            flipped = cv2.flip(frame, 1)
-            pose = tracker.detect(flipped)
-            cmd = strategy.evaluate(pose)
-
-            # Apply input state changes
-            input_backend.set_state(cmd)
-
-            # Visualize
-            draw_pose(flipped, pose)
-            status = []
-            if cmd.forward: status.append('Forward')
-            if cmd.backward: status.append('Backward')
-            if cmd.left: status.append('Left')
-            if cmd.right: status.append('Right')
-            if cmd.brake: status.append('Brake')
-            if cmd.fire: status.append('Fire')
-            if abs(cmd.mouse_dx) > 0.01 or abs(cmd.mouse_dy) > 0.01:
-                status.append(f'Pan dx={cmd.mouse_dx:.1f}, dy={cmd.mouse_dy:.1f}')
-            cv2.putText(flipped, ' | '.join(status) if status else 'Idle', (20, 60),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 1, cv2.LINE_AA)
-
-            cv2.putText(flipped, "Press 'q' to quit | 'c' to calibrate", (20, pose.height - 20), cv2.FONT_HERSHEY_SIMPLEX,
-                        0.6, (255, 255, 255), 1, cv2.LINE_AA)
-            cv2.imshow('Gesture Racer - Body Control', flipped)
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-            elif key == ord('c'):
-                # Calibrate neutral center using current wrist avg
-                pose_points = pose.points
-                lw = pose_points.get('left_wrist')
-                rw = pose_points.get('right_wrist')
-                xs, ys = [], []
-                if lw:
-                    xs.append(lw.x)
-                    ys.append(lw.y)
-                if rw:
-                    xs.append(rw.x)
-                    ys.append(rw.y)
-                if xs and ys:
-                    neutral_x = sum(xs) / len(xs)
-                    neutral_y = sum(ys) / len(ys)
-                    # Update hand pan neutral
-                    for s in strategy.strategies:
-                        if isinstance(s, HandPanStrategy):
-                            s._neutral_x = neutral_x
-                            s._neutral_y = neutral_y
-                    cv2.putText(flipped, 'Calibrated', (20, 90), cv2.FONT_HERSHEY_SIMPLEX,
-                                0.7, (0, 255, 0), 2, cv2.LINE_AA)
-                    cv2.imshow('Gesture Racer - Body Control', flipped)
+            item = pipeline.get_output(timeout=0)
+            if item is None:
+                return pkt
+            pkt = item
+
+    def render(frame, pkt: FramePacket):
+        with tracer.span('overlay', pkt.seq):
+            draw_pose(frame, pkt.pose)
+            draw_status(frame, pkt.pose, pkt.cmd)
+            if controls.calibrated_at is not None and monotonic() - controls.calibrated_at < 1.0:
+                cv2.putText(frame, 'Calibrated', (20, 90), cv2.FONT_HERSHEY_SIMPLEX,
+                            0.7, (0, 255, 0), 2, cv2.LINE_AA)
+
+    controls.install_signal_handlers()
+    renderer = None
+    if args.headless:
+        controls.start_stdin()
+        print("Headless: type 'q' + Enter (or send SIGINT/SIGTERM) to quit, 'c' + Enter (or SIGUSR1) to calibrate")
+    else:
+        renderer = OverlayRenderer('Gesture Racer - Body Control', render, max_fps=args.overlay_fps, mirror=True)
+
+    try:
+        if output is not None:
+            output.start()
+        pipeline.start()
+        if renderer is not None:
+            renderer.run(latest_output, controls, lambda: pipeline.running)
+        else:
+            while pipeline.running and not controls.quit_requested:
+                pipeline.get_output(timeout=0.1)
 
     finally:
+        pipeline.stop()
+        if output is not None:
+            output.stop()
+        print_stats(pipeline)
+        print('Strategy calls: ' + ', '.join(
+            f"{name}={c['calls']}" + (f" (unchanged {c['skipped_unchanged']})" if c['skipped_unchanged'] else '')
+            + (f" (overridden {c['skipped_override']})" if c['skipped_override'] else '')
+            for name, c in strategy.counters().items()))
+        # The flags that built these objects stand in for isinstance checks, so their modules
+        # are only imported when they are used
+        if args.gate:
+            print(f'Inference gate: {tracker.inferences} inferences, {tracker.skipped_static} static frames '
+                  f'and {tracker.skipped_idle} idle frames skipped')
+        if predictor is not None:
+            print('Landmark prediction: ' + ', '.join(f'{k}={v:.2f}' if isinstance(v, float) else f'{k}={v}'
+                                                      for k, v in predictor.error_stats().items()))
+        if isinstance(tracker, ParallelPoseTracker):
+            print(f'Frame handoff: {tracker.frames_shared} frames through shared memory, '
+                  f'{tracker.frames_pickled} pickled')
+        if args.governor:
+            governor = tracker.tracker if args.gate else tracker
+            print(f'Quality governor: final level {governor.current} after {governor.switches} switches')
         tracker.close()
-        cam.release()
-        cv2.destroyAllWindows()
+        input_backend.release_all()
+        input_backend.close()
+        if args.input_dispatch == 'async':
+            st = input_backend.stats()
+            print(f"Input dispatch: {st['dispatched']} calls ({st['coalesced']} moves coalesced), "
+                  f"latency p50={st['latency_p50_ms']:.2f}ms p95={st['latency_p95_ms']:.2f}ms, "
+                  f"failures={sum(st['failures'].values())}")
+        source.release()
+        if command_log is not None:
+            command_log.close()
+        if recorder is not None:
+            recorder.close()
+        if renderer is not None:
+            renderer.close()
+        if args.startup_report:
+            timeline.export_json(args.startup_report)
+        if args.trace:
+            tracer.export_chrome(args.trace)
+            print(tracer.format_summary())
+            print(f'Trace written to {args.trace}')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,126 @@
+"""Lag and jitter of landmark smoothing filters on recorded sessions.
+
+    python -m benchmarks.bench_smoothing_lag session.lmlog [more.lmlog ...]
+    python -m benchmarks.bench_smoothing_lag --beta 0.005 0.01 0.02
+
+Every log is split into runs of frames where the player was detected, and each filter is run
+over the x/y pixel coordinates of all detected landmarks in each run:
+
+- ema: EmaFilter at HandPan's default alpha (the smoothing the app has used so far)
+- one-euro: OneEuroFilterBank for every --min-cutoff x --beta combination
+
+lag_ms is the time shift of the raw signal that best matches the filtered one (sub-frame, by
+interpolating the raw timestamps); jitter_px is the RMS second difference of the output per
+frame, which is dominated by detection noise while the player holds still. Without logs a
+synthetic session from benchmarks/doubles.py is used.
+"""
+import argparse
+import json
+import sys
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from benchmarks.doubles import synthetic_landmarks
+from gesture_racer.core.landmark_log import LandmarkLogReader
+from gesture_racer.utils.filters import EmaFilter, OneEuroFilterBank
+
+MAX_LAG_MS = 250
+
+
+def detected_runs(landmarks: np.ndarray, timestamps: np.ndarray, min_frames: int = 15
+                  ) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Split a session into (timestamps, frames x coords) runs where the same landmarks are all present."""
+    xy = np.asarray(landmarks[:, :, :2], dtype=np.float64).reshape(len(landmarks), -1)
+    columns = ~np.isnan(xy).all(axis=0)
+    xy = xy[:, columns]
+    present = ~np.isnan(xy).any(axis=1) & ~np.isnan(timestamps)
+    runs = []
+    start = None
+    for i, ok in enumerate(list(present) + [False]):
+        if ok and start is None:
+            start = i
+        elif not ok and start is not None:
+            if i - start >= min_frames:
+                runs.append((np.asarray(timestamps[start:i], dtype=np.float64), xy[start:i]))
+            start = None
+    return runs
+
+
+def run_filter(make: Callable, times: np.ndarray, signal: np.ndarray) -> np.ndarray:
+    filt = make()
+    if isinstance(filt, EmaFilter):
+        return np.array([filt.update(row) for row in signal])
+    return np.array([filt.update(row, t) for t, row in zip(times, signal)])
+
+
+def lag_and_jitter(runs, make: Callable) -> Dict[str, float]:
+    shifts = np.arange(0, MAX_LAG_MS + 1) / 1000.0
+    sq_err = np.zeros(len(shifts))
+    counts = np.zeros(len(shifts))
+    jitter_sq, jitter_n = 0.0, 0
+    for times, signal in runs:
+        out = signal if make is None else run_filter(make, times, signal)
+        for k, shift in enumerate(shifts):
+            valid = times - shift >= times[0]
+            if not valid.any():
+                continue
+            delayed = np.column_stack([np.interp(times[valid] - shift, times, col) for col in signal.T])
+            sq_err[k] += np.sum((out[valid] - delayed) ** 2)
+            counts[k] += delayed.size
+        second = np.diff(out, n=2, axis=0)
+        jitter_sq += float(np.sum(second ** 2))
+        jitter_n += second.size
+    rms = np.sqrt(sq_err / np.maximum(counts, 1))
+    best = int(np.argmin(rms))
+    return {
+        'lag_ms': float(shifts[best] * 1000.0),
+        'residual_px': float(rms[best]),
+        'jitter_px': float(np.sqrt(jitter_sq / jitter_n)) if jitter_n else 0.0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Landmark smoothing lag/jitter benchmark')
+    parser.add_argument('logs', nargs='*', help='Landmark logs recorded with app.py --record')
+    parser.add_argument('--ema-alpha', type=float, default=0.35, help='EMA alpha to compare against')
+    parser.add_argument('--min-cutoff', type=float, nargs='+', default=[1.0])
+    parser.add_argument('--beta', type=float, nargs='+', default=[0.01])
+    parser.add_argument('--d-cutoff', type=float, default=1.0)
+    parser.add_argument('--output', help='Write results JSON here')
+    args = parser.parse_args(argv)
+
+    runs = []
+    if args.logs:
+        for path in args.logs:
+            reader = LandmarkLogReader(path)
+            runs.extend(detected_runs(reader.landmarks, reader.timestamps))
+            reader.close()
+    else:
+        lm = synthetic_landmarks(1800)
+        runs = detected_runs(lm, np.arange(len(lm)) / 30.0)
+    if not runs:
+        print('No runs with a detected player long enough to measure')
+        return 1
+
+    filters = {'raw': None, f'ema(alpha={args.ema_alpha})': lambda: EmaFilter(alpha=args.ema_alpha)}
+    for min_cutoff in args.min_cutoff:
+        for beta in args.beta:
+            filters[f'one-euro(min_cutoff={min_cutoff}, beta={beta})'] = (
+                lambda mc=min_cutoff, b=beta: OneEuroFilterBank(min_cutoff=mc, beta=b, d_cutoff=args.d_cutoff))
+
+    frames = sum(len(times) for times, _ in runs)
+    print(f'{len(runs)} runs, {frames} frames')
+    results = {}
+    for name, make in filters.items():
+        results[name] = row = lag_and_jitter(runs, make)
+        print(f"{name:<44} lag={row['lag_ms']:>6.1f}ms  jitter={row['jitter_px']:>6.2f}px  "
+              f"residual={row['residual_px']:>6.2f}px")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
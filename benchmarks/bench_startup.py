@@ -0,0 +1,112 @@
+"""Time from launching app.py to its first dispatched command.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --source 0 --runs 5 --output startup.json
+
+Each run starts a fresh interpreter on `app.py --headless --input null` with --startup-report,
+once with the default startup (pose graph built and warmed up while the source opens) and once
+with --sequential-startup (source first, then the graph, no warm-up). time_to_first_command_ms
+is measured from just before the process is spawned, so interpreter start and imports count;
+the other columns come from the app's own startup timeline. Without --source a short synthetic
+clip from benchmarks/doubles.py is written to a temporary image directory; a camera source
+shows the overlap better, since opening a camera is slow.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from time import time
+from typing import Dict, List, Optional
+
+import cv2
+
+from benchmarks.doubles import FakeCamera
+from gesture_racer.utils.stats import percentile
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+MODES = {'parallel': [], 'sequential': ['--sequential-startup']}
+# Timeline entries reported per mode: marks use their start, spans their duration
+COLUMNS = [('main', 'start_ms'), ('open_source', 'duration_ms'), ('build_tracker', 'duration_ms'),
+           ('warm_up', 'duration_ms'), ('wait_tracker', 'duration_ms'), ('first_frame', 'start_ms'),
+           ('first_command', 'start_ms')]
+
+
+def write_clip(directory: str, num_frames: int = 30):
+    cam = FakeCamera(640, 480)
+    for i in range(num_frames):
+        cv2.imwrite(os.path.join(directory, f'{i:04d}.png'), cam.read()[1])
+
+
+def run_once(source: str, extra: List[str], max_frames: int) -> Dict[str, float]:
+    """Launch the app once; returns the per-run numbers or raises RuntimeError if it failed."""
+    with tempfile.TemporaryDirectory() as tmp:
+        report = os.path.join(tmp, 'startup.json')
+        cmd = [sys.executable, APP, '--source', source, '--headless', '--input', 'null',
+               '--max-frames', str(max_frames), '--startup-report', report] + extra
+        spawned_at = time()
+        proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+        if proc.returncode != 0 or not os.path.exists(report):
+            lines = (proc.stderr or proc.stdout).strip().splitlines()
+            raise RuntimeError(lines[-1] if lines else 'no startup report')
+        with open(report) as f:
+            timeline = json.load(f)
+    events = {ev['name']: ev for ev in timeline['events']}
+    if 'first_command' not in events:
+        raise RuntimeError('no command was dispatched')
+    row = {'time_to_first_command_ms': (timeline['origin_wall'] - spawned_at) * 1000.0
+           + events['first_command']['start_ms']}
+    for name, key in COLUMNS:
+        if name in events:
+            row[f'{name}_ms'] = events[name][key]
+    return row
+
+
+def summarize(rows: List[Dict[str, float]]) -> Dict[str, float]:
+    keys = sorted({k for row in rows for k in row})
+    return {k: percentile([row[k] for row in rows if k in row], 50) for k in keys}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Gesture Racer startup benchmark')
+    parser.add_argument('--source', help='Camera index, video file or image directory (default: synthetic clip)')
+    parser.add_argument('--runs', type=int, default=3, help='Launches per mode; medians are reported')
+    parser.add_argument('--max-frames', type=int, default=5)
+    parser.add_argument('--output', help='Write results JSON here')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as clip:
+        source: Optional[str] = args.source
+        if source is None:
+            write_clip(clip)
+            source = clip
+        results = {}
+        for mode, extra in MODES.items():
+            try:
+                rows = [run_once(source, extra, args.max_frames) for _ in range(args.runs)]
+            except RuntimeError as exc:
+                results[mode] = {'skipped': str(exc)}
+                continue
+            results[mode] = summarize(rows)
+
+    for mode, row in results.items():
+        if 'skipped' in row:
+            print(f'{mode:<12} skipped ({row["skipped"]})')
+            continue
+        print(f'{mode:<12} time to first command p50={row["time_to_first_command_ms"]:8.1f}ms')
+        for name, _ in COLUMNS:
+            if f'{name}_ms' in row:
+                print(f'{"":<14}{name:<16}{row[f"{name}_ms"]:8.1f}ms')
+    if 'skipped' not in results['parallel'] and 'skipped' not in results['sequential']:
+        saved = results['sequential']['time_to_first_command_ms'] - results['parallel']['time_to_first_command_ms']
+        print(f'Parallel startup saves {saved:.1f}ms to the first command')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
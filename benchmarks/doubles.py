@@ -0,0 +1,121 @@
+"""Headless test doubles for benchmarks: a synthetic camera, a recording input backend and pose streams."""
+import math
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from gesture_racer.core.sources import FrameSource
+from gesture_racer.input.base import KeyboardMouseInput
+from gesture_racer.utils.types import LANDMARK_INDEX, NUM_LANDMARKS, PoseData
+
+# Rough standing pose in a 640x480 frame: (x, y, z)
+_BASE_POSE = {
+    'nose': (320, 120, -0.40),
+    'left_shoulder': (250, 200, -0.30), 'right_shoulder': (390, 200, -0.30),
+    'left_elbow': (230, 300, -0.20), 'right_elbow': (410, 300, -0.20),
+    'left_wrist': (290, 230, -0.10), 'right_wrist': (350, 230, -0.10),
+    'left_hip': (270, 400, 0.00), 'right_hip': (370, 400, 0.00),
+}
+
+
+class FakeCamera(FrameSource):
+    """Deterministic synthetic frames (a moving stick figure on a noisy background)."""
+
+    live = False
+
+    def __init__(self, width: int = 640, height: int = 480, num_frames: int = 0, seed: int = 0):
+        self.width = width
+        self.height = height
+        self.num_frames = num_frames
+        self._rng = np.random.default_rng(seed)
+        self._background = self._rng.integers(0, 64, (height, width, 3), dtype=np.uint8)
+        self._index = 0
+
+    def open(self) -> bool:
+        return True
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.num_frames) and self._index >= self.num_frames
+
+    def read_stamped(self):
+        if self.finished:
+            return False, None, 0.0
+        frame = self._background.copy()
+        sx, sy = self.width / 640.0, self.height / 480.0
+        shift = 40.0 * math.sin(self._index / 15.0)
+        pts = {name: (int((x + shift) * sx), int(y * sy)) for name, (x, y, _) in _BASE_POSE.items()}
+        for a, b in [('left_shoulder', 'right_shoulder'), ('left_shoulder', 'left_elbow'),
+                     ('left_elbow', 'left_wrist'), ('right_shoulder', 'right_elbow'),
+                     ('right_elbow', 'right_wrist'), ('left_shoulder', 'left_hip'),
+                     ('right_shoulder', 'right_hip'), ('left_hip', 'right_hip')]:
+            cv2.line(frame, pts[a], pts[b], (200, 180, 160), max(2, int(12 * sx)))
+        cv2.circle(frame, pts['nose'], int(40 * sx), (180, 170, 200), -1)
+        frame_time = self._index / 30.0
+        self._index += 1
+        return True, frame, frame_time
+
+    def release(self):
+        pass
+
+
+class RecordingInput(KeyboardMouseInput):
+    """Records backend calls instead of injecting input."""
+
+    def __init__(self):
+        super().__init__()
+        self.events: List[Tuple] = []
+
+    def press(self, key: str):
+        self.events.append(('press', key))
+
+    def release(self, key: str):
+        self.events.append(('release', key))
+
+    def click_mouse(self, button: str = 'left'):
+        self.events.append(('click', button))
+
+    def move_mouse(self, dx: float, dy: float):
+        self.events.append(('move', dx, dy))
+
+
+def synthetic_landmarks(num_frames: int, width: int = 640, height: int = 480, seed: int = 0,
+                        missing_rate: float = 0.03) -> np.ndarray:
+    """A (frames x 33 x 4) landmark stream that sweeps through every gesture's active region.
+
+    Covers leaning, turning, panning, hands together and hands above the head, with occasional
+    frames where nobody is detected.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(num_frames) / 30.0
+    lm = np.full((num_frames, NUM_LANDMARKS, 4), np.nan)
+    sx, sy = width / 640.0, height / 480.0
+    sway = 160.0 * np.sin(t * 0.9)
+    lean = 0.25 * np.sin(t * 0.5)
+    raise_hands = np.clip(np.sin(t * 0.3) * 3.0 - 2.0, 0.0, 1.0)
+    for name, (x, y, z) in _BASE_POSE.items():
+        idx = LANDMARK_INDEX[name]
+        px = np.full(num_frames, float(x))
+        py = np.full(num_frames, float(y))
+        pz = np.full(num_frames, float(z))
+        if 'wrist' in name:
+            px = px + sway
+            py = py - raise_hands * 180.0
+        if 'shoulder' in name:
+            pz = pz + lean
+        lm[:, idx, 0] = px * sx + rng.normal(0, 2.0, num_frames)
+        lm[:, idx, 1] = py * sy + rng.normal(0, 2.0, num_frames)
+        lm[:, idx, 2] = pz + rng.normal(0, 0.01, num_frames)
+        lm[:, idx, 3] = 0.9
+    lm[rng.random(num_frames) < missing_rate] = np.nan
+    return lm
+
+
+def synthetic_poses(num_frames: int, width: int = 640, height: int = 480, seed: int = 0) -> List[PoseData]:
+    lm = synthetic_landmarks(num_frames, width, height, seed)
+    poses = []
+    for i in range(num_frames):
+        block: Optional[np.ndarray] = None if np.isnan(lm[i, :, 0]).all() else lm[i]
+        poses.append(PoseData(width=width, height=height, landmarks=block, timestamp=i / 30.0))
+    return poses
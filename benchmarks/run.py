@@ -0,0 +1,257 @@
+"""Frame-time benchmark suite.
+
+Runs headless on a CPU-only box using the doubles in benchmarks/doubles.py:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline --tolerance 0.15
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+
+With --baseline, cases whose p50 regressed by more than the tolerance are listed and the exit
+status is 1, so the suite can gate CI. A bare --baseline compares against the committed
+benchmarks/baseline.json; refresh that file with --save-baseline on the reference machine
+whenever a change is meant to move the numbers, and commit it with that change.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from dataclasses import replace
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from benchmarks.doubles import FakeCamera, RecordingInput, synthetic_poses
+from gesture_racer.core.preprocess import FramePreprocessor
+from gesture_racer.gestures.presets import STRATEGY_TYPES, build_strategy, strategy_class
+from gesture_racer.overlay.visualization import draw_pose
+from gesture_racer.utils.stats import percentile
+from gesture_racer.utils.types import PoseData
+
+# Committed results from the reference machine, used by a bare --baseline
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+RESOLUTIONS = [(320, 240), (640, 480), (1280, 720)]
+MODEL_COMPLEXITIES = [0, 1, 2]
+
+
+def measure(fn: Callable[[int], None], iterations: int, warmup: int = 5) -> Dict[str, float]:
+    """Time fn(i) per call; returns mean/p50/p95 in microseconds."""
+    for i in range(warmup):
+        fn(i)
+    samples = []
+    for i in range(iterations):
+        start = perf_counter_ns()
+        fn(i)
+        samples.append((perf_counter_ns() - start) / 1000.0)
+    return {
+        'iterations': iterations,
+        'mean_us': sum(samples) / len(samples),
+        'p50_us': percentile(samples, 50),
+        'p95_us': percentile(samples, 95),
+    }
+
+
+def bench_tracker(results: Dict[str, dict], iterations: int, video: Optional[str]):
+    try:
+        from gesture_racer.core.pose_tracking import PoseTracker
+        tracker_probe = PoseTracker(model_complexity=0)
+        tracker_probe.close()
+    except Exception as exc:  # mediapipe missing or without the solutions API
+        results['tracker'] = {'skipped': f'{type(exc).__name__}: {exc}'}
+        return
+
+    clip = []
+    if video:
+        cap = cv2.VideoCapture(video)
+        while len(clip) < iterations:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            clip.append(frame)
+        cap.release()
+
+    for width, height in RESOLUTIONS:
+        if clip:
+            frames = [cv2.resize(f, (width, height)) for f in clip]
+        else:
+            cam = FakeCamera(width, height)
+            frames = [cam.read()[1] for _ in range(min(iterations, 60))]
+        for complexity in MODEL_COMPLEXITIES:
+            tracker = PoseTracker(model_complexity=complexity)
+            try:
+                results[f'tracker.detect[c{complexity},{width}x{height}]'] = measure(
+                    lambda i: tracker.detect(frames[i % len(frames)]), iterations)
+            finally:
+                tracker.close()
+
+
+def peak_allocation(fn: Callable[[int], None], calls: int = 10) -> int:
+    """Largest number of bytes held in new allocations during one fn(i) call, via tracemalloc.
+
+    NumPy (and OpenCV's NumPy-backed outputs) report their buffers to tracemalloc. Call after
+    measure(), so one-time warm-up allocations are not counted.
+    """
+    tracemalloc.start()
+    try:
+        peak = 0
+        for i in range(calls):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            fn(i)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        return peak
+    finally:
+        tracemalloc.stop()
+
+
+def bench_preprocess(results: Dict[str, dict], iterations: int):
+    """Frame to model input: the old flip + full-frame cvtColor copies against FramePreprocessor.
+
+    bytes_allocated is the peak of new allocations during one frame, measured with tracemalloc;
+    buffer_allocations counts FramePreprocessor buffer growth during the timed frames (0 once warm).
+    """
+    for width, height in RESOLUTIONS:
+        frame = FakeCamera(width, height).read()[1]
+        name = f'preprocess.flip+cvt_color[{width}x{height}]'
+        old = lambda i: cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)  # noqa: E731
+        results[name] = measure(old, iterations)
+        results[name]['bytes_allocated'] = peak_allocation(old)
+        for max_width in (None, 320):
+            pre = FramePreprocessor()
+            name = f'preprocess.prepare[{width}x{height}' + (f',max{max_width}]' if max_width else ']')
+            pre.prepare(frame, max_width=max_width)
+            warm = pre.allocations
+            results[name] = measure(lambda i: pre.prepare(frame, max_width=max_width), iterations)
+            results[name]['buffer_allocations'] = pre.allocations - warm
+            results[name]['bytes_allocated'] = peak_allocation(lambda i: pre.prepare(frame, max_width=max_width))
+
+
+def fresh(poses: List[PoseData]) -> List[PoseData]:
+    """Copies of poses without memoized features, so each benchmark computes them like a live frame."""
+    return [replace(p) for p in poses]
+
+
+def bench_strategies(results: Dict[str, dict], iterations: int):
+    poses = synthetic_poses(max(iterations, 300))
+    for name in STRATEGY_TYPES:
+        strategy = strategy_class(name)()
+        frames = fresh(poses)
+        results[f'strategy.{name}.evaluate'] = measure(lambda i: strategy.evaluate(frames[i % len(frames)]), iterations)
+    composite = build_strategy()
+    frames = fresh(poses)
+    results['strategy.composite[app].evaluate'] = measure(
+        lambda i: composite.evaluate(frames[i % len(frames)]), iterations)
+    # A held pose (as repeated by the inference gate): stateless strategies reuse their last result
+    held = [replace(poses[0]) for _ in range(len(poses))]
+    composite = build_strategy()
+    results['strategy.composite[app,held].evaluate'] = measure(
+        lambda i: composite.evaluate(held[i % len(held)]), iterations)
+
+
+def bench_input(results: Dict[str, dict], iterations: int):
+    composite = build_strategy()
+    commands = [composite.evaluate(p) for p in synthetic_poses(max(iterations, 300))]
+    backend = RecordingInput()
+    results['input.set_state'] = measure(
+        lambda i: backend.set_state(commands[i % len(commands)], now=i / 30.0), iterations)
+    results['input.set_state']['events_per_frame'] = len(backend.events) / max(1, iterations + 5)
+
+
+def bench_overlay(results: Dict[str, dict], iterations: int):
+    poses = synthetic_poses(max(iterations, 300))
+    canvas = FakeCamera(640, 480).read()[1]
+    frame = canvas.copy()
+
+    def run(i):
+        np.copyto(frame, canvas)
+        draw_pose(frame, poses[i % len(poses)])
+
+    results['overlay.draw_pose'] = measure(run, iterations)
+
+
+SUITES = {
+    'tracker': bench_tracker,
+    'preprocess': bench_preprocess,
+    'strategies': bench_strategies,
+    'input': bench_input,
+    'overlay': bench_overlay,
+}
+
+
+def environment() -> dict:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'opencv': cv2.__version__,
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Return a line per case whose p50 exceeds the baseline p50 by more than tolerance."""
+    regressions = []
+    for name, row in results.items():
+        base = baseline.get(name)
+        if not base or 'p50_us' not in row or 'p50_us' not in base:
+            continue
+        ratio = row['p50_us'] / base['p50_us'] if base['p50_us'] else 1.0
+        if ratio > 1.0 + tolerance:
+            regressions.append(f'{name}: p50 {row["p50_us"]:.1f}us vs baseline {base["p50_us"]:.1f}us '
+                               f'(+{(ratio - 1.0) * 100:.0f}%)')
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Gesture Racer frame-time benchmarks')
+    parser.add_argument('--suites', nargs='+', default=list(SUITES), choices=list(SUITES))
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--tracker-iterations', type=int, default=30)
+    parser.add_argument('--video', help='Optional clip to feed the tracker instead of synthetic frames')
+    parser.add_argument('--output', help='Write results JSON here')
+    parser.add_argument('--baseline', nargs='?', const=DEFAULT_BASELINE,
+                        help='Compare against this results JSON (default: benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', metavar='PATH', help='Write results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='Allowed p50 regression ratio')
+    args = parser.parse_args(argv)
+
+    cv2.setNumThreads(1)
+    results: Dict[str, dict] = {}
+    for suite in args.suites:
+        if suite == 'tracker':
+            bench_tracker(results, args.tracker_iterations, args.video)
+        else:
+            SUITES[suite](results, args.iterations)
+
+    for name, row in results.items():
+        if 'skipped' in row:
+            print(f'{name:<44} skipped ({row["skipped"]})')
+        else:
+            print(f'{name:<44} p50={row["p50_us"]:>10.1f}us  p95={row["p95_us"]:>10.1f}us')
+
+    report = {'environment': environment(), 'results': results}
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('Regressions:')
+            for line in regressions:
+                print(f'  {line}')
+            return 1
+        print(f'No regressions beyond {args.tolerance * 100:.0f}% against {args.baseline}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
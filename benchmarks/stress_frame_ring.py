@@ -0,0 +1,138 @@
+"""Stress test for SharedFrameRing: one producer, several consumer processes, camera-sized frames.
+
+    python -m benchmarks.stress_frame_ring
+    python -m benchmarks.stress_frame_ring --fps 60 --seconds 10 --consumers 3 --work-ms 25
+
+The producer fills a slot in place at --fps and hands (slot, seq) round-robin to consumer
+processes, which hold the frame for --work-ms (like an inference) before checking and releasing
+it. (ParallelPoseTracker instead copies each camera frame in with SharedFrameRing.write, since
+the main process keeps the original.) Every frame carries its seq in the first 8 bytes and a
+seq-derived fill everywhere else, so a frame overwritten while a consumer held it shows up as
+torn. Consumers also check that what they got is a view into the shared block (zero-copy).
+Exits 1 on any torn frame or copy.
+"""
+import argparse
+import multiprocessing as mp
+import pickle
+import sys
+from time import perf_counter, sleep
+
+import numpy as np
+
+from gesture_racer.core.frame_ring import SharedFrameRing
+
+
+def fill_value(seq: int) -> int:
+    return (seq * 7 + 3) % 256
+
+
+def write_frame(frame: np.ndarray, seq: int):
+    flat = frame.reshape(-1)
+    flat[:] = fill_value(seq)
+    flat[:8] = np.frombuffer(np.int64(seq).tobytes(), dtype=np.uint8)
+
+
+def frame_ok(frame: np.ndarray, seq: int) -> bool:
+    flat = frame.reshape(-1)
+    if int(flat[:8].view(np.int64)[0]) != seq:
+        return False
+    rest = flat[8:]
+    value = fill_value(seq)
+    return int(rest.min()) == value and int(rest.max()) == value
+
+
+def consumer(spec, tasks, results, work_sec: float):
+    ring = SharedFrameRing.attach(spec)
+    checked = torn = copies = stale = 0
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            slot, seq = task
+            view = ring.view(slot, seq)
+            if view is None:
+                stale += 1
+                continue
+            if not ring.contains(view) or view.flags.owndata:
+                copies += 1
+            sleep(work_sec)
+            # Check after the simulated inference, then confirm the stamp never changed meanwhile
+            if not frame_ok(view, seq) or not ring.valid(slot, seq):
+                torn += 1
+            checked += 1
+            del view
+            ring.release(slot, seq)
+    finally:
+        ring.close()
+        results.put({'checked': checked, 'torn': torn, 'copies': copies, 'stale': stale})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='SharedFrameRing stress test')
+    parser.add_argument('--fps', type=float, default=60.0)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--consumers', type=int, default=2)
+    parser.add_argument('--slots', type=int, default=8)
+    parser.add_argument('--work-ms', type=float, default=20.0, help='Time each consumer holds a frame')
+    parser.add_argument('--width', type=int, default=640)
+    parser.add_argument('--height', type=int, default=480)
+    args = parser.parse_args(argv)
+
+    shape = (args.height, args.width, 3)
+    ctx = mp.get_context('spawn')
+    ring = SharedFrameRing(shape, args.slots)
+    results = ctx.Queue()
+    queues = [ctx.Queue() for _ in range(args.consumers)]
+    procs = [ctx.Process(target=consumer, args=(ring.spec, q, results, args.work_ms / 1000.0), daemon=True)
+             for q in queues]
+    for p in procs:
+        p.start()
+
+    total = int(args.fps * args.seconds)
+    produced = full = 0
+    period = 1.0 / args.fps
+    start = next_tick = perf_counter()
+    try:
+        for i in range(total):
+            delay = next_tick - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            next_tick += period
+            slot = ring.try_acquire()
+            if slot is None:
+                # Every slot is still held: a live camera would drop this frame
+                full += 1
+                continue
+            seq = ring.next_seq
+            write_frame(ring.slot(slot), seq)
+            ring.publish(slot)
+            queues[produced % args.consumers].put((slot, seq))
+            produced += 1
+        elapsed = perf_counter() - start
+        for q in queues:
+            q.put(None)
+        stats = [results.get(timeout=30) for _ in procs]
+        for p in procs:
+            p.join(timeout=5)
+    finally:
+        ring.close()
+        ring.unlink()
+
+    checked = sum(s['checked'] for s in stats)
+    torn = sum(s['torn'] for s in stats)
+    copies = sum(s['copies'] for s in stats)
+    stale = sum(s['stale'] for s in stats)
+    frame = np.zeros(shape, dtype=np.uint8)
+    print(f'Produced {produced}/{total} frames of {frame.nbytes / 1024:.0f} KB at {produced / elapsed:.1f} fps '
+          f'({full} dropped on a full ring), {args.consumers} consumers holding each for {args.work_ms:.0f} ms')
+    print(f'Checked {checked}: torn={torn} copies={copies} stale={stale}')
+    print(f'Queue message per frame: {len(pickle.dumps((0, (0, 0))))} bytes via the ring, '
+          f'{len(pickle.dumps((0, frame), protocol=pickle.HIGHEST_PROTOCOL))} bytes pickled')
+    ok = torn == 0 and copies == 0 and stale == 0 and checked == produced
+    print('OK' if ok else 'FAILED')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
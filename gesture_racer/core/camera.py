@@ -1,12 +1,27 @@
+from time import monotonic
+
 import cv2
 
+from gesture_racer.core.frame_grabber import FrameGrabber
+from gesture_racer.core.sources import FrameSource
+
+
+class Camera(FrameSource):
+    """OpenCV camera wrapper.
+
+    With threaded=True frames are grabbed on a background thread and read() returns the
+    freshest frame instead of the oldest one queued in the driver buffer.
+    """
 
-class Camera:
-    def __init__(self, device_index: int = 0, width: int = 640, height: int = 480):
+    monotonic_clock = True
+
+    def __init__(self, device_index: int = 0, width: int = 640, height: int = 480, threaded: bool = False):
         self.device_index = device_index
         self.width = width
         self.height = height
+        self.threaded = threaded
         self.cap = None
+        self.grabber = None
 
     def open(self) -> bool:
         self.cap = cv2.VideoCapture(self.device_index)
@@ -15,14 +30,36 @@ class Camera:
         # Try to set resolution for performance
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        if self.threaded:
+            # Keep the driver queue as short as possible; the grabber drains it anyway
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.grabber = FrameGrabber(self.cap.read, name=f'camera-{self.device_index}')
+            self.grabber.start()
         return True
 
-    def read(self):
+    def read_stamped(self):
+        """Return (ok, frame, capture_timestamp) with a monotonic timestamp."""
         if self.cap is None:
-            return False, None
-        return self.cap.read()
+            return False, None, 0.0
+        if self.grabber is not None:
+            ok, frame, ts, _ = self.grabber.latest()
+            return ok, frame, ts
+        ok, frame = self.cap.read()
+        return ok, frame, monotonic()
+
+    @property
+    def finished(self) -> bool:
+        """True once the grab thread gave up on a camera that kept failing (threaded=True)."""
+        return self.grabber is not None and self.grabber.ended
+
+    @property
+    def frames_dropped(self) -> int:
+        return self.grabber.frames_dropped if self.grabber is not None else 0
 
     def release(self):
+        if self.grabber is not None:
+            self.grabber.stop()
+            self.grabber = None
         if self.cap is not None:
             self.cap.release()
             self.cap = None
\ No newline at end of file
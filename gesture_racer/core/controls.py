@@ -0,0 +1,64 @@
+import signal
+import sys
+import threading
+from typing import Optional, TextIO
+
+QUIT = 'quit'
+CALIBRATE = 'calibrate'
+
+# stdin lines understood by Controls.start_stdin()
+_STDIN_COMMANDS = {'q': QUIT, 'quit': QUIT, 'c': CALIBRATE, 'calibrate': CALIBRATE}
+
+
+class Controls:
+    """Quit/calibrate requests that do not depend on an OpenCV window having focus.
+
+    Requests can come from any thread: the overlay window's keys, a stdin reader thread
+    ('q' / 'c' lines), or signals (SIGINT/SIGTERM quit, SIGUSR1 calibrates where available).
+    The control path polls them without blocking; nothing here waits on GUI event pumping.
+    """
+
+    def __init__(self):
+        self._quit = threading.Event()
+        self._calibrate = threading.Event()
+        # monotonic() time of the last successful calibration, for on-screen feedback
+        self.calibrated_at: Optional[float] = None
+
+    def request(self, action: str):
+        if action == QUIT:
+            self._quit.set()
+        elif action == CALIBRATE:
+            self._calibrate.set()
+        else:
+            raise ValueError(f'Unknown control action: {action}')
+
+    @property
+    def quit_requested(self) -> bool:
+        return self._quit.is_set()
+
+    def wait_quit(self, timeout: Optional[float] = None) -> bool:
+        return self._quit.wait(timeout)
+
+    def take_calibrate(self) -> bool:
+        """Return True once per pending calibration request."""
+        if not self._calibrate.is_set():
+            return False
+        self._calibrate.clear()
+        return True
+
+    def install_signal_handlers(self):
+        """Route termination and calibration signals here (call from the main thread)."""
+        signal.signal(signal.SIGINT, lambda *_: self.request(QUIT))
+        signal.signal(signal.SIGTERM, lambda *_: self.request(QUIT))
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda *_: self.request(CALIBRATE))
+
+    def start_stdin(self, stream: TextIO = sys.stdin):
+        """Read 'q' / 'c' commands, one per line, on a daemon thread until EOF."""
+        def run():
+            for line in stream:
+                action = _STDIN_COMMANDS.get(line.strip().lower())
+                if action is not None:
+                    self.request(action)
+
+        threading.Thread(target=run, name='controls-stdin', daemon=True).start()
@@ -0,0 +1,94 @@
+import threading
+from time import monotonic
+from typing import Callable, Optional, Tuple
+
+
+class FrameGrabber:
+    """Runs a blocking frame reader on a dedicated thread into a single latest-wins slot.
+
+    - The grab thread reads as fast as the source delivers, so the driver buffer never backs up.
+    - Consumers always get the freshest frame; frames overwritten before being read are counted as dropped.
+    - Each frame is stamped with a monotonic capture timestamp and a sequence number.
+    - A failed read is retried after retry_interval_sec. After max_consecutive_failures failed reads
+      in a row (e.g. the camera was unplugged) the thread stops and ended becomes True.
+    """
+
+    def __init__(self, read_fn: Callable[[], Tuple[bool, object]], name: str = 'frame-grabber',
+                 retry_interval_sec: float = 1.0 / 30.0, max_consecutive_failures: int = 90):
+        self._read_fn = read_fn
+        self._name = name
+        self.retry_interval_sec = retry_interval_sec
+        self.max_consecutive_failures = max_consecutive_failures
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._frame = None
+        self._timestamp = 0.0
+        self._seq = 0
+        self._last_read_seq = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.read_failures = 0
+        # True once the source kept failing and the grab thread gave up
+        self.ended = False
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self.ended = False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running = False
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        failures_in_row = 0
+        while self._running:
+            ok, frame = self._read_fn()
+            ts = monotonic()
+            if not ok or frame is None:
+                self.read_failures += 1
+                failures_in_row += 1
+                if failures_in_row >= self.max_consecutive_failures:
+                    with self._cond:
+                        self.ended = True
+                        self._running = False
+                        self._cond.notify_all()
+                    return
+                # A disconnected camera fails immediately; don't spin on it
+                self._stop_event.wait(self.retry_interval_sec)
+                continue
+            failures_in_row = 0
+            with self._cond:
+                # Previous frame was never consumed -> it is superseded
+                if self._seq > self._last_read_seq:
+                    self.frames_dropped += 1
+                self._frame = frame
+                self._timestamp = ts
+                self._seq += 1
+                self.frames_captured += 1
+                self._cond.notify_all()
+
+    def latest(self, timeout: float = 1.0) -> Tuple[bool, object, float, int]:
+        """Return (ok, frame, timestamp, seq) for the newest frame not yet returned.
+
+        Waits only when the consumer has already seen the newest frame, i.e. it is running
+        faster than the camera. Returns ok=False on timeout, after stop() or once ended.
+        """
+        with self._cond:
+            if self._seq <= self._last_read_seq:
+                self._cond.wait_for(lambda: self._seq > self._last_read_seq or not self._running, timeout)
+            if self._seq <= self._last_read_seq:
+                return False, None, 0.0, self._seq
+            self._last_read_seq = self._seq
+            return True, self._frame, self._timestamp, self._seq
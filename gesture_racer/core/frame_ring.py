@@ -0,0 +1,157 @@
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Frame slots start on a cache-line boundary
+_ALIGN = 64
+
+# Picklable description of a ring, handed to other processes to attach: (name, shape, num_slots, dtype)
+RingSpec = Tuple[str, Tuple[int, ...], int, str]
+
+
+class SharedFrameRing:
+    """Fixed-size frame slots in one multiprocessing.shared_memory block, shared between processes.
+
+    One producer writes frames, consumers read them as NumPy views straight out of shared memory
+    (no copy, no pickling). Frames are handed over as (slot, seq) pairs, e.g. through a Queue.
+    Coordination is lock-free; every header field has exactly one writer:
+
+    - stamps[slot] (producer): -seq while the slot is being written, seq once it is published
+    - released[slot] (the consumer holding the slot): seq once that frame is no longer needed
+
+    The producer only reuses a slot whose current frame has been released, so a frame can never
+    change under a consumer that holds it. view() and valid() compare the stamp with the expected
+    seq, seqlock style: checking valid() after using a view proves the frame was not torn. Consumers
+    that learn about a frame through a Queue or Pipe get the needed memory ordering from the
+    system call that delivers the message.
+
+    The creating process owns the block and must unlink() it; attach() from other processes.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], num_slots: int = 8, dtype=np.uint8, name: Optional[str] = None):
+        self.shape = tuple(int(d) for d in shape)
+        self.num_slots = num_slots
+        self.dtype = np.dtype(dtype)
+        self.frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        header_bytes = -(-2 * num_slots * 8 // _ALIGN) * _ALIGN
+        slot_bytes = -(-self.frame_bytes // _ALIGN) * _ALIGN
+        self.owner = name is None
+        if self.owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=header_bytes + num_slots * slot_bytes)
+        else:
+            try:
+                # Only the owner unlinks, so attaching processes must not track the block
+                self._shm = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                # Before Python 3.13 attaching always registers the block with the resource
+                # tracker; child processes share the owner's tracker, so its unlink() clears that
+                self._shm = shared_memory.SharedMemory(name=name)
+        header = np.ndarray((2, num_slots), dtype=np.int64, buffer=self._shm.buf)
+        if self.owner:
+            header[:] = 0
+        self._stamps = header[0]
+        self._released = header[1]
+        self._slots = np.ndarray((num_slots,) + self.shape, dtype=self.dtype, buffer=self._shm.buf,
+                                 offset=header_bytes, strides=(slot_bytes,) + self._frame_strides())
+        # Producer-side state; only meaningful in the producing process
+        self._next_seq = 1
+        self._next_slot = 0
+
+    def _frame_strides(self) -> Tuple[int, ...]:
+        """C-contiguous strides of one frame."""
+        strides = []
+        step = self.dtype.itemsize
+        for dim in reversed(self.shape):
+            strides.append(step)
+            step *= dim
+        return tuple(reversed(strides))
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def spec(self) -> RingSpec:
+        return self.name, self.shape, self.num_slots, self.dtype.str
+
+    @classmethod
+    def attach(cls, spec: RingSpec) -> 'SharedFrameRing':
+        name, shape, num_slots, dtype = spec
+        return cls(shape, num_slots, dtype, name=name)
+
+    def contains(self, array: np.ndarray) -> bool:
+        """True if array is a view into this ring's shared memory (i.e. no copy was made)."""
+        start = self._slots.ctypes.data
+        return start <= array.ctypes.data < start + self.num_slots * self._slots.strides[0]
+
+    # Producer
+
+    def try_acquire(self) -> Optional[int]:
+        """Claim a slot whose previous frame has been released; None if every slot is still in use."""
+        for i in range(self.num_slots):
+            slot = (self._next_slot + i) % self.num_slots
+            if self._stamps[slot] <= self._released[slot]:
+                self._stamps[slot] = -self._next_seq
+                return slot
+        return None
+
+    @property
+    def next_seq(self) -> int:
+        """seq the next publish() will assign, for producers that stamp it into the frame."""
+        return self._next_seq
+
+    def slot(self, slot: int) -> np.ndarray:
+        """Writable view of an acquired slot, e.g. for cv2.VideoCapture.read(image)."""
+        return self._slots[slot]
+
+    def publish(self, slot: int) -> int:
+        """Make the frame written into slot visible to consumers; returns its seq."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._stamps[slot] = seq
+        self._next_slot = (slot + 1) % self.num_slots
+        return seq
+
+    def abandon(self, slot: int):
+        """Give back an acquired slot without publishing anything."""
+        self._stamps[slot] = self._released[slot]
+
+    def write(self, frame: np.ndarray) -> Optional[Tuple[int, int]]:
+        """Copy frame into a free slot and publish it; returns (slot, seq), or None if the ring is full."""
+        slot = self.try_acquire()
+        if slot is None:
+            return None
+        np.copyto(self._slots[slot], frame)
+        return slot, self.publish(slot)
+
+    # Consumer
+
+    def view(self, slot: int, seq: int) -> Optional[np.ndarray]:
+        """Read-only view of frame seq, or None if the slot no longer (or not yet) holds it."""
+        if self._stamps[slot] != seq:
+            return None
+        frame = self._slots[slot]
+        frame.flags.writeable = False
+        return frame
+
+    def valid(self, slot: int, seq: int) -> bool:
+        return self._stamps[slot] == seq
+
+    def release(self, slot: int, seq: int):
+        """Let the producer reuse slot once frame seq is no longer needed."""
+        self._released[slot] = seq
+
+    @property
+    def in_use(self) -> int:
+        """Slots holding a frame that has not been released yet."""
+        return int(np.count_nonzero(self._stamps > self._released)) + int(np.count_nonzero(self._stamps < 0))
+
+    def close(self):
+        """Unmap the block in this process; views obtained from it must no longer be used."""
+        self._slots = self._stamps = self._released = None
+        self._shm.close()
+
+    def unlink(self):
+        if self.owner:
+            self._shm.unlink()
@@ -0,0 +1,105 @@
+from dataclasses import replace
+from time import monotonic
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from gesture_racer.utils.types import PoseData
+
+
+class GatedPoseTracker:
+    """Puts a cheap motion/presence gate in front of a tracker's detect().
+
+    Each frame is shrunk to a small grayscale thumbnail and compared with the thumbnail of the
+    last frame that was actually inferred. If fewer than motion_fraction of its pixels changed by
+    more than pixel_threshold, inference is skipped and the last pose is reused (at most
+    max_reuse frames in a row, so slow drift is still picked up).
+
+    When nobody has been detected for idle_after_sec the gate goes idle: static frames only get a
+    detection pass every idle_interval_sec, while any motion wakes it on that same frame.
+    Wraps anything with detect()/warm_up()/close() (PoseTracker, QualityGovernor); call from one thread.
+    """
+
+    def __init__(self,
+                 tracker,
+                 thumb_width: int = 80,
+                 pixel_threshold: int = 16,
+                 motion_fraction: float = 0.01,
+                 max_reuse: int = 15,
+                 idle_after_sec: float = 5.0,
+                 idle_interval_sec: float = 1.0,
+                 clock=monotonic):
+        self.tracker = tracker
+        self.thumb_width = thumb_width
+        self.pixel_threshold = pixel_threshold
+        self.motion_fraction = motion_fraction
+        self.max_reuse = max_reuse
+        self.idle_after_sec = idle_after_sec
+        self.idle_interval_sec = idle_interval_sec
+        self.clock = clock
+
+        self.inferences = 0
+        self.skipped_static = 0
+        self.skipped_idle = 0
+
+        self._reference: Optional[np.ndarray] = None
+        self._thumb: Optional[np.ndarray] = None
+        self._diff: Optional[np.ndarray] = None
+        self._last_pose: Optional[PoseData] = None
+        self._reused = 0
+        self._last_inference = float('-inf')
+        # Time a person was last detected; the first inference counts, so an empty scene idles too
+        self._last_seen: Optional[float] = None
+
+    @property
+    def idle(self) -> bool:
+        """True while nobody has been seen for idle_after_sec."""
+        return self._last_seen is not None and self.clock() - self._last_seen >= self.idle_after_sec
+
+    def _thumbnail(self, bgr_frame) -> np.ndarray:
+        h, w = bgr_frame.shape[:2]
+        size = (self.thumb_width, max(1, round(h * self.thumb_width / w)))
+        if self._thumb is None or self._thumb.shape != size[::-1]:
+            self._thumb = np.empty(size[::-1], dtype=np.uint8)
+            self._diff = np.empty_like(self._thumb)
+        small = cv2.resize(bgr_frame, size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=self._thumb)
+
+    def _moved(self, thumb: np.ndarray) -> bool:
+        if self._reference is None or self._reference.shape != thumb.shape:
+            return True
+        cv2.absdiff(thumb, self._reference, dst=self._diff)
+        changed = np.count_nonzero(self._diff > self.pixel_threshold)
+        return changed > self.motion_fraction * thumb.size
+
+    def detect(self, bgr_frame) -> PoseData:
+        now = self.clock()
+        thumb = self._thumbnail(bgr_frame)
+        moved = self._moved(thumb)
+
+        if not moved and self._last_pose is not None:
+            if self.idle:
+                if now - self._last_inference < self.idle_interval_sec:
+                    self.skipped_idle += 1
+                    return replace(self._last_pose)
+            elif self._reused < self.max_reuse:
+                self._reused += 1
+                self.skipped_static += 1
+                return replace(self._last_pose)
+
+        pose = self.tracker.detect(bgr_frame)
+        self.inferences += 1
+        self._last_inference = now
+        self._reused = 0
+        self._last_pose = pose
+        self._reference = thumb.copy()
+        if pose.landmarks is not None or self._last_seen is None:
+            self._last_seen = now
+        return pose
+
+    def warm_up(self, width: int = 640, height: int = 480):
+        self.tracker.warm_up(width, height)
+
+    def close(self):
+        self.tracker.close()
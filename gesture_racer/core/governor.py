@@ -0,0 +1,181 @@
+import threading
+from dataclasses import replace
+from time import monotonic
+from typing import Callable, List, NamedTuple, Optional
+
+from gesture_racer.core.pose_tracking import PoseTracker
+from gesture_racer.utils.types import PoseData
+
+
+class QualityLevel(NamedTuple):
+    model_complexity: int
+    # Inference input scale relative to the camera frame
+    input_scale: float
+    # Run inference on every stride-th frame; frames in between reuse the last pose
+    stride: int
+
+
+# Best quality first
+DEFAULT_LEVELS: List[QualityLevel] = [
+    QualityLevel(2, 1.0, 1),
+    QualityLevel(1, 1.0, 1),
+    QualityLevel(1, 0.75, 1),
+    QualityLevel(0, 0.75, 1),
+    QualityLevel(0, 0.5, 1),
+    QualityLevel(0, 0.5, 2),
+    QualityLevel(0, 0.5, 3),
+]
+
+
+class QualityGovernor:
+    """Drop-in PoseTracker replacement that adapts quality to hold a frame-rate target.
+
+    Every inference is timed and folded into an EMA of per-frame cost (inference time / stride).
+    When the cost exceeds the frame budget (1 / target_fps), or a single inference exceeds
+    max_latency_ms, the governor steps down one level; after hold_sec comfortably under
+    upgrade_headroom of the budget it steps back up. A level whose last measured cost was over
+    budget is not re-entered until retry_sec has passed, which keeps it from oscillating.
+
+    Input scale and stride apply on the next frame. A model complexity change builds the new
+    MediaPipe graph on a background thread while the current one keeps serving frames, then swaps
+    it in, so switching never stalls the pipeline. detect() must be called from a single thread.
+    """
+
+    def __init__(self,
+                 target_fps: float = 30.0,
+                 max_latency_ms: Optional[float] = None,
+                 levels: Optional[List[QualityLevel]] = None,
+                 start_level: int = 1,
+                 ema_alpha: float = 0.1,
+                 upgrade_headroom: float = 0.6,
+                 hold_sec: float = 2.0,
+                 retry_sec: float = 30.0,
+                 warmup_frames: int = 5,
+                 tracker_factory: Callable = PoseTracker,
+                 **tracker_kwargs):
+        self.levels = list(levels or DEFAULT_LEVELS)
+        self.target_fps = target_fps
+        self.max_latency_ms = max_latency_ms
+        self.ema_alpha = ema_alpha
+        self.upgrade_headroom = upgrade_headroom
+        self.hold_sec = hold_sec
+        self.retry_sec = retry_sec
+        self.warmup_frames = warmup_frames
+        self.tracker_factory = tracker_factory
+        self.tracker_kwargs = tracker_kwargs
+
+        self.level = max(0, min(start_level, len(self.levels) - 1))
+        current = self.levels[self.level]
+        self.tracker = tracker_factory(model_complexity=current.model_complexity,
+                                       input_scale=current.input_scale, **tracker_kwargs)
+        # Last measured per-frame cost (seconds) of each level, used to avoid oscillation
+        self.level_cost: List[Optional[float]] = [None] * len(self.levels)
+        self._level_cost_at: List[float] = [0.0] * len(self.levels)
+        self.cost_ema: Optional[float] = None
+        self.switches = 0
+
+        self._frame_index = 0
+        self._last_pose: Optional[PoseData] = None
+        self._samples = 0
+        self._stable_since = monotonic()
+        self._pending: Optional[PoseTracker] = None
+        self._pending_level: Optional[int] = None
+        self._builder: Optional[threading.Thread] = None
+
+    @property
+    def budget_sec(self) -> float:
+        return 1.0 / self.target_fps
+
+    @property
+    def current(self) -> QualityLevel:
+        return self.levels[self.level]
+
+    def detect(self, bgr_frame) -> PoseData:
+        self._swap_if_ready()
+        level = self.current
+        index = self._frame_index
+        self._frame_index += 1
+        if self._last_pose is not None and index % level.stride:
+            h, w = bgr_frame.shape[:2]
+            if (w, h) == (self._last_pose.width, self._last_pose.height):
+                return replace(self._last_pose)
+
+        start = monotonic()
+        pose = self.tracker.detect(bgr_frame)
+        self._observe(monotonic() - start, level)
+        self._last_pose = pose
+        return pose
+
+    def _observe(self, infer_sec: float, level: QualityLevel):
+        self._samples += 1
+        if self._samples <= self.warmup_frames or self._builder is not None:
+            # First inferences on a fresh graph are not representative; nor is anything measured
+            # while a new graph is being built next to this one
+            return
+        cost = infer_sec / level.stride
+        self.cost_ema = cost if self.cost_ema is None else \
+            self.ema_alpha * cost + (1.0 - self.ema_alpha) * self.cost_ema
+        now = monotonic()
+        self.level_cost[self.level] = self.cost_ema
+        self._level_cost_at[self.level] = now
+
+        over_latency = self.max_latency_ms is not None and infer_sec * 1000.0 > self.max_latency_ms
+        if self.cost_ema > self.budget_sec or over_latency:
+            if self.level + 1 < len(self.levels):
+                self._set_level(self.level + 1)
+            self._stable_since = now
+        elif self.cost_ema > self.upgrade_headroom * self.budget_sec:
+            self._stable_since = now
+        elif now - self._stable_since >= self.hold_sec and self.level > 0:
+            above = self.level - 1
+            known = self.level_cost[above]
+            if known is None or known <= self.budget_sec or now - self._level_cost_at[above] >= self.retry_sec:
+                self._set_level(self.level - 1)
+            self._stable_since = now
+
+    def _set_level(self, new_level: int):
+        old, new = self.levels[self.level], self.levels[new_level]
+        self.switches += 1
+        self._samples = 0
+        self.cost_ema = None
+        if new.model_complexity == old.model_complexity:
+            self.level = new_level
+            self.tracker.input_scale = new.input_scale
+            return
+        self._pending_level = new_level
+        self._builder = threading.Thread(target=self._build, args=(new,), name='governor-build', daemon=True)
+        self._builder.start()
+
+    def warm_up(self, width: int = 640, height: int = 480):
+        self.tracker.warm_up(width, height)
+
+    def _build(self, level: QualityLevel):
+        pending = self.tracker_factory(model_complexity=level.model_complexity,
+                                       input_scale=level.input_scale, **self.tracker_kwargs)
+        # Pay the new graph's first-inference setup here rather than on the frame after the swap
+        h, w = (self._last_pose.height, self._last_pose.width) if self._last_pose is not None else (480, 640)
+        pending.warm_up(w, h)
+        self._pending = pending
+
+    def _swap_if_ready(self):
+        if self._builder is None or self._builder.is_alive():
+            return
+        self._builder = None
+        if self._pending is None:
+            # Building the graph failed; stay where we are
+            self._pending_level = None
+            return
+        old = self.tracker
+        self.tracker, self._pending = self._pending, None
+        self.level, self._pending_level = self._pending_level, None
+        self._samples = 0
+        old.close()
+
+    def close(self):
+        if self._builder is not None:
+            self._builder.join()
+            self._builder = None
+            if self._pending is not None:
+                self._pending.close()
+                self._pending = None
+        self.tracker.close()
@@ -0,0 +1,141 @@
+import os
+import queue
+import struct
+import threading
+from typing import Iterator, Optional
+
+import numpy as np
+
+from gesture_racer.utils.types import NUM_LANDMARKS, PoseData
+
+# File layout: fixed 32-byte header followed by fixed-size little-endian records
+#   header: magic, version, num_landmarks, width, height (padded to HEADER_SIZE)
+#   record: float64 timestamp + float32[num_landmarks, 4] of (x_px, y_px, z, visibility)
+# Landmarks that were not detected (or frames without a person) are stored as NaN.
+MAGIC = b'GRLM'
+VERSION = 1
+HEADER_SIZE = 32
+_HEADER = struct.Struct('<4sHHII')
+
+
+def record_dtype(num_landmarks: int = NUM_LANDMARKS) -> np.dtype:
+    return np.dtype([('timestamp', '<f8'), ('landmarks', '<f4', (num_landmarks, 4))])
+
+
+def pose_to_record(pose: PoseData, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Pack a PoseData into a single log record (a 0-d structured array)."""
+    rec = out if out is not None else np.zeros((), dtype=record_dtype())
+    rec['timestamp'] = pose.timestamp if pose.timestamp is not None else np.nan
+    if pose.landmarks is None:
+        rec['landmarks'] = np.nan
+    else:
+        rec['landmarks'] = pose.landmarks
+    return rec
+
+
+class LandmarkLogWriter:
+    """Appends one record per PoseData to a landmark log from a background writer thread.
+
+    write() only packs the pose and enqueues it, so the tracking stage does not wait on disk I/O
+    unless the disk falls max_pending records behind; then write() blocks (the log stays lossless
+    and memory stays bounded). The header is written with the frame size of the first pose, or
+    as 0x0 on close() if no pose was written.
+    """
+
+    def __init__(self, path: str, batch_size: int = 64, max_pending: int = 4096):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.records_written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._file = open(path, 'wb')
+        self._header_written = False
+        self._thread = threading.Thread(target=self._run, name='landmark-log-writer', daemon=True)
+        self._thread.start()
+
+    def _write_header(self, width: int, height: int):
+        self._file.write(_HEADER.pack(MAGIC, VERSION, NUM_LANDMARKS, width, height).ljust(HEADER_SIZE, b'\0'))
+        self._header_written = True
+
+    def write(self, pose: PoseData):
+        if not self._header_written:
+            self._write_header(pose.width, pose.height)
+        self._queue.put(pose_to_record(pose).tobytes())
+
+    def _run(self):
+        pending = []
+        while True:
+            item = self._queue.get()
+            if item is not None:
+                pending.append(item)
+            if pending and (item is None or len(pending) >= self.batch_size or self._queue.empty()):
+                self._file.write(b''.join(pending))
+                self.records_written += len(pending)
+                pending = []
+            if item is None:
+                break
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if not self._header_written:
+            # Nothing was recorded: still leave a valid (empty) log
+            self._write_header(0, 0)
+        self._file.close()
+
+
+class LandmarkLogReader:
+    """Memory-maps a landmark log.
+
+    - landmarks: zero-copy (frames x landmarks x 4) float32 view of the whole session
+    - timestamps: zero-copy (frames,) float64 view
+    - iterating yields PoseData frame by frame, like PoseTracker.detect would have
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f'{path} is not a landmark log: {len(header)} bytes, shorter than the '
+                             f'{HEADER_SIZE}-byte header (empty or truncated file)')
+        magic, version, num_landmarks, width, height = _HEADER.unpack_from(header)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a landmark log')
+        if version != VERSION:
+            raise ValueError(f'Unsupported landmark log version {version}')
+        self.num_landmarks = num_landmarks
+        self.width = width
+        self.height = height
+        dtype = record_dtype(num_landmarks)
+        # Ignore a trailing partial record left by an interrupted writer
+        count = (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize
+        if count > 0:
+            self.records = np.memmap(path, dtype=dtype, mode='r', offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=dtype)
+
+    @property
+    def landmarks(self) -> np.ndarray:
+        return self.records['landmarks']
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.records['timestamp']
+
+    def __len__(self):
+        return len(self.records)
+
+    def pose_at(self, i: int) -> PoseData:
+        block = self.landmarks[i]
+        ts = float(self.timestamps[i])
+        landmarks = None if np.isnan(block[:, 0]).all() else block.astype(np.float64)
+        return PoseData(width=self.width, height=self.height, landmarks=landmarks,
+                        timestamp=None if np.isnan(ts) else ts)
+
+    def __iter__(self) -> Iterator[PoseData]:
+        for i in range(len(self)):
+            yield self.pose_at(i)
+
+    def close(self):
+        # The mapping is released once no views into it remain
+        self.records = np.zeros(0, dtype=self.records.dtype)
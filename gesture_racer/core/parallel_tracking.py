@@ -0,0 +1,252 @@
+import multiprocessing as mp
+import queue
+import traceback
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from gesture_racer.core.frame_ring import SharedFrameRing
+from gesture_racer.core.pose_tracking import PoseTracker
+from gesture_racer.utils.types import FramePacket
+
+# Per-worker tracking continuity modes
+CONTINUITY_TRACK = 'track'    # each worker tracks its own every-Nth-frame subsequence
+CONTINUITY_DETECT = 'detect'  # each worker runs full detection on every frame (no temporal state)
+
+# Task index announcing a new SharedFrameRing spec to a worker
+_RING_TASK = -1
+
+
+def _worker_main(worker_id: int, tracker_factory: Callable, tracker_kwargs: dict, tasks, results):
+    try:
+        tracker = tracker_factory(**tracker_kwargs)
+        # Workers start before the first frame exists; set up the graph while they wait for it
+        tracker.warm_up()
+    except Exception:
+        results.put(('error', worker_id, -1, traceback.format_exc()))
+        return
+    ring = None
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            idx, frame = task
+            if idx == _RING_TASK:
+                # A new frame ring (first frame, or the frame size changed); frames before this
+                # message came through the previous one
+                if ring is not None:
+                    ring.close()
+                ring = SharedFrameRing.attach(frame)
+                # Tell the parent this worker is done with every older ring
+                results.put(('ring', worker_id, _RING_TASK, ring.name))
+                continue
+            try:
+                if isinstance(frame, tuple):
+                    # (slot, seq) in the shared frame ring: run on a view, release once done
+                    slot, seq = frame
+                    view = ring.view(slot, seq)
+                    if view is None:
+                        raise RuntimeError(f'Frame {seq} is no longer in ring slot {slot}')
+                    try:
+                        pose = tracker.detect(view)
+                    finally:
+                        # Even a failed frame must give its slot back, or the ring fills up for good
+                        del view
+                        ring.release(slot, seq)
+                else:
+                    pose = tracker.detect(frame)
+                results.put(('ok', worker_id, idx, pose))
+            except Exception:
+                results.put(('error', worker_id, idx, traceback.format_exc()))
+    finally:
+        tracker.close()
+        if ring is not None:
+            ring.close()
+
+
+class ReorderBuffer:
+    """Collects results that arrive out of order and releases them strictly by index."""
+
+    def __init__(self, start: int = 0):
+        self.next_index = start
+        self._pending: Dict[int, object] = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+    def push(self, index: int, item):
+        if index >= self.next_index:
+            self._pending[index] = item
+
+    def pop_ready(self) -> List[object]:
+        ready = []
+        while self.next_index in self._pending:
+            ready.append(self._pending.pop(self.next_index))
+            self.next_index += 1
+        return ready
+
+
+class ParallelPoseTracker:
+    """Spreads consecutive frames round-robin across N PoseTracker worker processes.
+
+    Results are put back into submission order by a ReorderBuffer, so downstream gesture
+    strategies see the same frame order as with a single tracker. Throughput scales with the
+    number of workers at the cost of roughly N frames of extra pipeline latency.
+
+    Tracking continuity: with N workers each MediaPipe graph only sees every Nth frame.
+    - 'track' keeps MediaPipe's tracking mode per worker (landmark smoothing disabled since frames
+      are not contiguous); the graph re-detects on its own when the subject moved too far.
+    - 'detect' runs every worker in static image mode, trading CPU for no temporal dependency.
+
+    With shared_frames (the default) each frame is copied once into a SharedFrameRing (the caller
+    keeps its own frame, e.g. for the preview) and workers get only (slot, seq), running inference
+    on a view of shared memory instead of unpickling a copy. If every ring slot is still in use the frame is sent through the queue as before
+    (frames_pickled counts those).
+    """
+
+    def __init__(self,
+                 num_workers: int = 2,
+                 continuity: str = CONTINUITY_TRACK,
+                 result_timeout_sec: float = 5.0,
+                 tracker_factory: Callable = PoseTracker,
+                 start_method: str = 'spawn',
+                 shared_frames: bool = True,
+                 ring_slots: Optional[int] = None,
+                 **tracker_kwargs):
+        if continuity not in (CONTINUITY_TRACK, CONTINUITY_DETECT):
+            raise ValueError(f'Unknown continuity mode: {continuity}')
+        self.num_workers = max(1, num_workers)
+        self.continuity = continuity
+        self.result_timeout_sec = result_timeout_sec
+        if continuity == CONTINUITY_DETECT:
+            tracker_kwargs['static_image_mode'] = True
+        elif self.num_workers > 1:
+            tracker_kwargs.setdefault('smooth_landmarks', False)
+        self._ctx = mp.get_context(start_method)
+        self._results = self._ctx.Queue()
+        self._tasks = [self._ctx.Queue() for _ in range(self.num_workers)]
+        self._workers = [
+            self._ctx.Process(target=_worker_main, args=(i, tracker_factory, tracker_kwargs, self._tasks[i], self._results),
+                              name=f'pose-worker-{i}', daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for w in self._workers:
+            w.start()
+        self.shared_frames = shared_frames
+        # In flight frames are bounded by the worker count; the rest covers queued submissions
+        self.ring_slots = ring_slots or 2 * self.num_workers + 2
+        self.frames_shared = 0
+        self.frames_pickled = 0
+        self._ring: Optional[SharedFrameRing] = None
+        # Rings replaced after a frame size change; unlinked once every worker has attached the
+        # current ring (workers handle tasks in order, so they are done with the older ones by then)
+        self._retired_rings: List[SharedFrameRing] = []
+        self._ring_acks = 0
+        self._submitted = 0
+        self._in_flight: deque = deque()
+        self._reorder = ReorderBuffer()
+        self._ready: deque = deque()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def _share(self, frame) -> Optional[tuple]:
+        """Copy frame into the shared ring; returns (slot, seq), or None if it has to be pickled."""
+        ring = self._ring
+        if ring is None or ring.shape != frame.shape or ring.dtype != frame.dtype:
+            if ring is not None:
+                self._retired_rings.append(ring)
+            ring = self._ring = SharedFrameRing(frame.shape, self.ring_slots, frame.dtype)
+            self._ring_acks = 0
+            for q in self._tasks:
+                q.put((_RING_TASK, ring.spec))
+        return ring.write(frame)
+
+    def _ring_attached(self, name: str):
+        """A worker attached ring name; free the retired rings once every worker is on the current one."""
+        if self._ring is None or name != self._ring.name:
+            # Ack for a ring that has been replaced since; the current ring's acks cover it
+            return
+        self._ring_acks += 1
+        if self._ring_acks == self.num_workers:
+            for ring in self._retired_rings:
+                ring.close()
+                ring.unlink()
+            self._retired_rings = []
+
+    def submit(self, pkt: FramePacket):
+        """Send a packet's frame to the next worker in round-robin order."""
+        idx = self._submitted
+        self._submitted += 1
+        ref = self._share(pkt.frame) if self.shared_frames else None
+        if ref is not None:
+            self.frames_shared += 1
+        else:
+            self.frames_pickled += 1
+        self._tasks[idx % self.num_workers].put((idx, ref if ref is not None else pkt.frame))
+        self._in_flight.append(pkt)
+
+    def _drain(self, block: bool):
+        """Move finished results into the ready queue.
+
+        Non-blocking mode takes whatever has arrived; blocking mode waits until at least one
+        packet is ready in order.
+        """
+        while True:
+            try:
+                if block:
+                    status, worker_id, idx, payload = self._results.get(timeout=self.result_timeout_sec)
+                else:
+                    status, worker_id, idx, payload = self._results.get_nowait()
+            except queue.Empty:
+                if block:
+                    dead = [w.name for w in self._workers if not w.is_alive()]
+                    raise RuntimeError(f'No pose result within {self.result_timeout_sec}s (dead workers: {dead})')
+                return
+            if status == 'ring':
+                self._ring_attached(payload)
+                continue
+            if status == 'error':
+                raise RuntimeError(f'Pose worker {worker_id} failed:\n{payload}')
+            self._reorder.push(idx, payload)
+            for pose in self._reorder.pop_ready():
+                pkt = self._in_flight.popleft()
+                pkt.pose = pose
+                self._ready.append(pkt)
+            if block and self._ready:
+                return
+
+    def process(self, pkt: FramePacket) -> Optional[FramePacket]:
+        """Pipeline stage entry: submit pkt and return the oldest completed packet, if any.
+
+        Blocks only once every worker is busy, so one packet comes out per packet going in.
+        """
+        self.submit(pkt)
+        if not self._ready:
+            self._drain(block=self.in_flight >= self.num_workers)
+        return self._ready.popleft() if self._ready else None
+
+    def flush(self) -> List[FramePacket]:
+        """Wait for all in-flight frames and return them in order."""
+        while self._in_flight:
+            self._drain(block=True)
+        out = list(self._ready)
+        self._ready.clear()
+        return out
+
+    def warm_up(self, width: int = 640, height: int = 480):
+        """No-op: each worker warms up its own graph as soon as it starts."""
+
+    def close(self):
+        for q in self._tasks:
+            q.put(None)
+        for w in self._workers:
+            w.join(timeout=2.0)
+            if w.is_alive():
+                w.terminate()
+        for ring in self._retired_rings + ([self._ring] if self._ring is not None else []):
+            ring.close()
+            ring.unlink()
+        self._ring = None
+        self._retired_rings = []
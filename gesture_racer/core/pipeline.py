@@ -0,0 +1,215 @@
+import threading
+from collections import deque
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+
+# Queue drop policies applied when a stage's input queue is full
+BLOCK = 'block'              # producer waits for space (lossless)
+DROP_OLDEST = 'drop_oldest'  # evict the queued item, keep the new one (latest wins)
+DROP_NEWEST = 'drop_newest'  # discard the incoming item, keep what is queued
+
+_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+# Returned by a source when a finite stream is exhausted; flows through every stage, then stops the pipeline
+END_OF_STREAM = object()
+
+
+class StageQueue:
+    """Bounded queue with a drop policy and depth/drop counters."""
+
+    def __init__(self, maxsize: int = 1, drop_policy: str = BLOCK):
+        if drop_policy not in _POLICIES:
+            raise ValueError(f'Unknown drop policy: {drop_policy}')
+        self.maxsize = max(1, maxsize)
+        self.drop_policy = drop_policy
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self.put_count = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    def put(self, item, force: bool = False) -> bool:
+        """Enqueue an item; returns False if it was dropped or the queue is closed.
+
+        force=True never drops the incoming item (non-blocking queues evict the oldest instead).
+        """
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._items) >= self.maxsize:
+                if self.drop_policy == DROP_NEWEST and not force:
+                    self.dropped += 1
+                    return False
+                if self.drop_policy != BLOCK:
+                    self._items.popleft()
+                    self.dropped += 1
+                else:
+                    self._cond.wait_for(lambda: len(self._items) < self.maxsize or self._closed)
+                    if self._closed:
+                        return False
+            self._items.append(item)
+            self.put_count += 1
+            if len(self._items) > self.max_depth:
+                self.max_depth = len(self._items)
+            self._cond.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None):
+        """Dequeue the oldest item, or return None on timeout / when closed and empty."""
+        with self._cond:
+            if not self._items:
+                self._cond.wait_for(lambda: self._items or self._closed, timeout)
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class Stage:
+    """A pipeline stage: fn(item) -> item to forward, or None to stop propagating it.
+
+    queue_size and drop_policy describe the stage's *input* queue. flush() is called at end of
+    stream and returns any items the stage still holds (e.g. frames in flight on workers).
+    """
+
+    def __init__(self, name: str, fn: Callable, queue_size: int = 1, drop_policy: str = BLOCK,
+                 flush: Optional[Callable[[], List[object]]] = None):
+        self.name = name
+        self.fn = fn
+        self.flush = flush
+        self.queue = StageQueue(queue_size, drop_policy)
+        self.processed = 0
+        self.busy_sec = 0.0
+
+
+class Pipeline:
+    """Runs a frame source and a chain of stages, each on its own worker thread.
+
+    Stages hand items over through bounded queues, so throughput is limited by the slowest
+    stage rather than by the sum of all stages. Items leaving the last stage land in an
+    output queue that the caller drains with get_output() (e.g. on the GUI thread).
+    """
+
+    def __init__(self,
+                 source: Callable[[], Optional[object]],
+                 stages: List[Stage],
+                 output_size: int = 1,
+                 output_drop_policy: str = DROP_OLDEST):
+        self.source = source
+        self.stages = stages
+        self.output = StageQueue(output_size, output_drop_policy)
+        self.source_count = 0
+        self.finished = False
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self._error: Optional[BaseException] = None
+
+    def start(self):
+        self._running = True
+        self._threads = [threading.Thread(target=self._run_source, name='pipeline-source', daemon=True)]
+        for i, stage in enumerate(self.stages):
+            downstream = self.stages[i + 1].queue if i + 1 < len(self.stages) else self.output
+            self._threads.append(threading.Thread(target=self._run_stage, args=(stage, downstream),
+                                                  name=f'pipeline-{stage.name}', daemon=True))
+        for t in self._threads:
+            t.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running = False
+        for stage in self.stages:
+            stage.queue.close()
+        self.output.close()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def get_output(self, timeout: Optional[float] = None):
+        """Return the next item from the last stage, or None on timeout / end of stream.
+
+        Re-raises any exception that stopped a worker.
+        """
+        item = self.output.get(timeout)
+        if self._error is not None:
+            raise self._error
+        if item is END_OF_STREAM:
+            self.finished = True
+            self._running = False
+            return None
+        return item
+
+    def _fail(self, exc: BaseException):
+        if self._error is None:
+            self._error = exc
+        self._running = False
+        self.output.close()
+
+    def _run_source(self):
+        first = self.stages[0].queue if self.stages else self.output
+        try:
+            while self._running:
+                item = self.source()
+                if item is None:
+                    continue
+                if item is END_OF_STREAM:
+                    first.put(item, force=True)
+                    return
+                self.source_count += 1
+                first.put(item)
+        except BaseException as exc:
+            self._fail(exc)
+
+    def _run_stage(self, stage: Stage, downstream: StageQueue):
+        try:
+            while self._running:
+                item = stage.queue.get(timeout=0.1)
+                if item is None:
+                    continue
+                if item is END_OF_STREAM:
+                    for out in (stage.flush() if stage.flush is not None else []):
+                        downstream.put(out)
+                    downstream.put(item, force=True)
+                    return
+                start = monotonic()
+                out = stage.fn(item)
+                stage.busy_sec += monotonic() - start
+                stage.processed += 1
+                if out is not None:
+                    downstream.put(out)
+        except BaseException as exc:
+            self._fail(exc)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage queue depth, peak depth, drops, processed count and mean service time (ms)."""
+        report = {}
+        for stage in self.stages:
+            q = stage.queue
+            report[stage.name] = {
+                'depth': q.depth,
+                'max_depth': q.max_depth,
+                'dropped': q.dropped,
+                'processed': stage.processed,
+                'mean_ms': (stage.busy_sec / stage.processed * 1000.0) if stage.processed else 0.0,
+            }
+        report['output'] = {
+            'depth': self.output.depth,
+            'max_depth': self.output.max_depth,
+            'dropped': self.output.dropped,
+            'processed': self.output.put_count,
+            'mean_ms': 0.0,
+        }
+        return report
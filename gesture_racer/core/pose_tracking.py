@@ -1,56 +1,157 @@
-import cv2
-import mediapipe as mp
-from typing import Dict
+from typing import Optional, Tuple
 
-from gesture_racer.utils.types import PoseData, PosePoint
+import numpy as np
+
+from gesture_racer.core.preprocess import FramePreprocessor, mirror_landmarks
+from gesture_racer.utils.tracing import tracer
+from gesture_racer.utils.types import VISIBILITY, X, Y, Z, PoseData
+
+# Landmarks below this visibility do not count towards the tracking ROI
+ROI_VISIBILITY = 0.5
+# Fewer visible landmarks than this means the track is lost
+ROI_MIN_LANDMARKS = 4
 
 
 class PoseTracker:
-    """Wraps MediaPipe Pose to return normalized body keypoints with pixel coordinates."""
+    """Wraps MediaPipe Pose to return normalized body keypoints with pixel coordinates.
+
+    With roi=True, each frame is cropped to the previous frame's landmark bounding box (plus
+    roi_margin on every side, at the frame's aspect ratio) and downscaled to at most
+    roi_input_width before conversion and inference; landmarks are mapped back to full-frame
+    pixels. The ROI only moves when the player gets close to its edge or shrinks well inside it,
+    so MediaPipe's own tracking sees a steady input. When nobody is found in the ROI the same
+    frame is retried on the full frame.
+
+    input_scale < 1 downscales the inference input (full frame or ROI), as does max_input_width
+    for the full frame; landmarks are still returned in full-frame pixels. input_scale can be
+    changed between frames. Cropping, downscaling and colour conversion reuse the buffers of a
+    FramePreprocessor.
+
+    mirror=True returns landmarks as if the frame had been flipped horizontally (selfie view),
+    without flipping any pixels; the ROI itself stays in camera-frame coordinates.
+
+    mediapipe is imported on construction, not with this module, so importing the package stays
+    cheap. MediaPipe also defers most graph setup to the first process() call; warm_up() pays that
+    cost up front on a blank frame.
+    """
 
     def __init__(self,
                  model_complexity: int = 1,
                  min_detection_confidence: float = 0.6,
-                 min_tracking_confidence: float = 0.6):
+                 min_tracking_confidence: float = 0.6,
+                 static_image_mode: bool = False,
+                 smooth_landmarks: bool = True,
+                 roi: bool = False,
+                 roi_margin: float = 0.25,
+                 roi_min_size: float = 0.3,
+                 roi_input_width: int = 320,
+                 input_scale: float = 1.0,
+                 max_input_width: Optional[int] = None,
+                 mirror: bool = False):
+        import mediapipe as mp
+
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
+            static_image_mode=static_image_mode,
             model_complexity=model_complexity,
+            smooth_landmarks=smooth_landmarks,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
             enable_segmentation=False,
         )
+        self.roi_enabled = roi
+        self.roi_margin = roi_margin
+        self.roi_min_size = roi_min_size
+        self.roi_input_width = roi_input_width
+        self.input_scale = input_scale
+        self.max_input_width = max_input_width
+        self.mirror = mirror
+        self.preprocessor = FramePreprocessor()
+        # Current (x0, y0, x1, y1) crop in full-frame pixels; None = full frame
+        self.roi: Optional[Tuple[int, int, int, int]] = None
+        self.roi_frames = 0
+        self.full_frames = 0
+
+    def warm_up(self, width: int = 640, height: int = 480):
+        """Run one inference on a blank frame so the first real frame does not pay for graph setup.
+
+        Nobody is found on a blank frame, so no tracking state carries over into detect().
+        """
+        with tracer.span('pose.warm_up'):
+            self.pose.process(np.zeros((height, width, 3), dtype=np.uint8))
 
     def detect(self, bgr_frame) -> PoseData:
-        rgb = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB)
-        results = self.pose.process(rgb)
         h, w = bgr_frame.shape[:2]
+        landmarks = None
+        if self.roi is not None:
+            self.roi_frames += 1
+            landmarks = self._detect_region(bgr_frame, self.roi)
+        if landmarks is None:
+            # No ROI yet, or the player left it: search the whole frame
+            self.full_frames += 1
+            landmarks = self._detect_region(bgr_frame, None)
+        if self.roi_enabled:
+            self.roi = self._next_roi(landmarks, w, h)
+        if self.mirror and landmarks is not None:
+            landmarks = mirror_landmarks(landmarks, w)
+        return PoseData(width=w, height=h, landmarks=landmarks)
+
+    def _detect_region(self, bgr_frame, roi) -> Optional[np.ndarray]:
+        h, w = bgr_frame.shape[:2]
+        x0, y0, x1, y1 = roi if roi is not None else (0, 0, w, h)
+        crop_w, crop_h = x1 - x0, y1 - y0
+        with tracer.span('preprocess'):
+            max_width = self.roi_input_width if roi is not None else self.max_input_width
+            rgb = self.preprocessor.prepare(bgr_frame, roi, self.input_scale, max_width)
+        with tracer.span('pose.process'):
+            results = self.pose.process(rgb)
+        if not results.pose_landmarks:
+            return None
+
+        lm = results.pose_landmarks.landmark
+        # All 33 landmarks in one pass into a single array; pixel coordinates stay float
+        landmarks = np.fromiter((v for p in lm for v in (p.x, p.y, p.z, p.visibility)),
+                                dtype=np.float64, count=len(lm) * 4).reshape(len(lm), 4)
+        landmarks[:, X] = landmarks[:, X] * crop_w + x0
+        landmarks[:, Y] = landmarks[:, Y] * crop_h + y0
+        if roi is not None:
+            # MediaPipe z is on the scale of the input width
+            landmarks[:, Z] *= crop_w / w
+        return landmarks
+
+    def _next_roi(self, landmarks: Optional[np.ndarray], w: int, h: int) -> Optional[Tuple[int, int, int, int]]:
+        if landmarks is None:
+            return None
+        visible = landmarks[landmarks[:, VISIBILITY] >= ROI_VISIBILITY]
+        if len(visible) < ROI_MIN_LANDMARKS:
+            return None
+        bx0, by0 = np.clip(visible[:, X].min(), 0, w), np.clip(visible[:, Y].min(), 0, h)
+        bx1, by1 = np.clip(visible[:, X].max(), 0, w), np.clip(visible[:, Y].max(), 0, h)
+        bw, bh = bx1 - bx0, by1 - by0
+
+        # Grow the margin-padded box to the frame's aspect ratio (and the minimum size)
+        aspect = w / h
+        box_w = max(bw * (1 + 2 * self.roi_margin), w * self.roi_min_size)
+        box_h = max(bh * (1 + 2 * self.roi_margin), h * self.roi_min_size)
+        box_w = max(box_w, box_h * aspect)
+        box_h = box_w / aspect
+        if box_w >= w or box_h >= h:
+            return None
+
+        if self.roi is not None:
+            # Hysteresis: keep the current ROI while the box plus half the margin still fits inside
+            # it and the ROI has not become much larger than needed
+            x0, y0, x1, y1 = self.roi
+            pad_x, pad_y = bw * self.roi_margin / 2, bh * self.roi_margin / 2
+            inside = (bx0 - pad_x >= x0 or x0 == 0) and (by0 - pad_y >= y0 or y0 == 0) and \
+                     (bx1 + pad_x <= x1 or x1 == w) and (by1 + pad_y <= y1 or y1 == h)
+            if inside and (x1 - x0) <= 1.5 * box_w:
+                return self.roi
 
-        points: Dict[str, PosePoint] = {}
-        if results.pose_landmarks:
-            lm = results.pose_landmarks.landmark
-
-            def add_point(name, idx):
-                landmark = lm[idx]
-                points[name] = PosePoint(
-                    name=name,
-                    x=int(landmark.x * w),
-                    y=int(landmark.y * h),
-                    z=float(landmark.z),
-                    visibility=float(landmark.visibility),
-                )
-
-            # Key points: shoulders, elbows, wrists, hips, nose
-            add_point('left_shoulder', self.mp_pose.PoseLandmark.LEFT_SHOULDER)
-            add_point('right_shoulder', self.mp_pose.PoseLandmark.RIGHT_SHOULDER)
-            add_point('left_elbow', self.mp_pose.PoseLandmark.LEFT_ELBOW)
-            add_point('right_elbow', self.mp_pose.PoseLandmark.RIGHT_ELBOW)
-            add_point('left_wrist', self.mp_pose.PoseLandmark.LEFT_WRIST)
-            add_point('right_wrist', self.mp_pose.PoseLandmark.RIGHT_WRIST)
-            add_point('left_hip', self.mp_pose.PoseLandmark.LEFT_HIP)
-            add_point('right_hip', self.mp_pose.PoseLandmark.RIGHT_HIP)
-            add_point('nose', self.mp_pose.PoseLandmark.NOSE)
-
-        return PoseData(width=w, height=h, points=points)
+        cx, cy = (bx0 + bx1) / 2, (by0 + by1) / 2
+        x0 = int(np.clip(cx - box_w / 2, 0, w - box_w))
+        y0 = int(np.clip(cy - box_h / 2, 0, h - box_h))
+        return x0, y0, min(w, x0 + int(round(box_w))), min(h, y0 + int(round(box_h)))
 
     def close(self):
-        self.pose.close()
\ No newline at end of file
+        self.pose.close()
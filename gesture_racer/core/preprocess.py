@@ -0,0 +1,77 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from gesture_racer.utils.types import MIRROR_INDEX, X
+
+
+class FramePreprocessor:
+    """Turns a BGR camera frame into the RGB model input without per-frame allocations.
+
+    prepare() crops (a view, no copy), downsamples with INTER_LINEAR and converts to RGB in that
+    order, so the colour conversion only touches the downsampled pixels. INTER_AREA looks slightly
+    better but is 8-10x slower at non-2x ratios (562us vs 68us for 1280x720 -> 320). Both steps write into
+    buffers owned by the preprocessor; they are carved out of flat arrays that only ever grow, so
+    ROI crops of varying size reuse the same memory. The returned array is overwritten by the
+    next prepare() call: consume it (e.g. MediaPipe process(), which copies its input) first.
+
+    Mirroring is not done here: detect on the camera frame as-is and mirror the landmarks
+    (mirror_landmarks), which costs 33 rows instead of a full-frame flip.
+    """
+
+    def __init__(self):
+        self._resize_store = np.empty(0, dtype=np.uint8)
+        self._rgb_store = np.empty(0, dtype=np.uint8)
+        # Number of times a buffer had to grow; stays flat once the largest input has been seen
+        self.allocations = 0
+
+    @staticmethod
+    def input_size(crop_w: int, crop_h: int, scale: float = 1.0, max_width: Optional[int] = None) -> Tuple[int, int]:
+        """(width, height) of the model input for a crop_w x crop_h region; never upscales."""
+        input_w = crop_w * scale
+        if max_width is not None:
+            input_w = min(input_w, max_width)
+        if input_w >= crop_w:
+            return crop_w, crop_h
+        # Uniform scale, so normalized landmarks map back through the crop size alone
+        input_w = max(1, int(round(input_w)))
+        return input_w, max(1, round(crop_h * input_w / crop_w))
+
+    def _buffer(self, name: str, shape: Tuple[int, int, int]) -> np.ndarray:
+        store = getattr(self, name)
+        size = shape[0] * shape[1] * shape[2]
+        if store.size < size:
+            store = np.empty(size, dtype=np.uint8)
+            setattr(self, name, store)
+            self.allocations += 1
+        return store[:size].reshape(shape)
+
+    def prepare(self, bgr_frame: np.ndarray, roi: Optional[Tuple[int, int, int, int]] = None,
+                scale: float = 1.0, max_width: Optional[int] = None) -> np.ndarray:
+        """Crop to roi (x0, y0, x1, y1; None = whole frame), downsample and convert to RGB."""
+        if roi is None:
+            image = bgr_frame
+        else:
+            x0, y0, x1, y1 = roi
+            image = bgr_frame[y0:y1, x0:x1]
+        crop_h, crop_w = image.shape[:2]
+        input_w, input_h = self.input_size(crop_w, crop_h, scale, max_width)
+        if input_w < crop_w:
+            resized = self._buffer('_resize_store', (input_h, input_w, 3))
+            cv2.resize(image, (input_w, input_h), dst=resized, interpolation=cv2.INTER_LINEAR)
+            image = resized
+        rgb = self._buffer('_rgb_store', (input_h, input_w, 3))
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=rgb)
+        return rgb
+
+
+def mirror_landmarks(landmarks: np.ndarray, width: int) -> np.ndarray:
+    """Landmarks as they would be detected on the horizontally flipped frame (cv2.flip(frame, 1)).
+
+    x becomes width - x and every left landmark swaps places with its right twin, matching how
+    MediaPipe labels a mirrored person. Returns a new array.
+    """
+    mirrored = landmarks[MIRROR_INDEX]
+    mirrored[:, X] = width - mirrored[:, X]
+    return mirrored
@@ -0,0 +1,203 @@
+import multiprocessing as mp
+import os
+import queue
+import traceback
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Dict, List, Optional, Union
+
+import cv2
+
+from gesture_racer.core.pose_tracking import PoseTracker
+from gesture_racer.core.sources import PACING_REALTIME, open_source
+from gesture_racer.gestures.presets import build_strategy
+from gesture_racer.input.base import parse_key_map
+from gesture_racer.input.factory import build_sink
+from gesture_racer.utils.stats import percentile
+
+
+@dataclass
+class SessionConfig:
+    """One player: a frame source, a strategy stack and an output sink."""
+    name: str
+    # Camera index, video file or image directory
+    source: Union[int, str] = 0
+    pacing: str = PACING_REALTIME
+    loop: bool = False
+    width: int = 640
+    height: int = 480
+    model_complexity: int = 1
+    # Crop inference input to the tracked player (see PoseTracker roi)
+    roi: bool = False
+    mirror: bool = True
+    # List of {'type': ..., **kwargs}; None uses the default app stack
+    strategies: Optional[List[dict]] = None
+    # 'null' or 'pynput'
+    sink: str = 'null'
+    # Key profile ('wasd', 'arrows') or intent=key pairs, see parse_key_map
+    keys: str = 'wasd'
+    # CPU ids to pin the session to; None lets the server assign them
+    cpus: Optional[List[int]] = None
+
+
+@dataclass
+class SessionStats:
+    name: str
+    frames: int = 0
+    fps: float = 0.0
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    frames_dropped: int = 0
+    cpus: List[int] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _pin_to_cpus(cpus: List[int]):
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cpus)
+    # One OpenCV worker per pinned core keeps sessions from oversubscribing each other
+    cv2.setNumThreads(max(1, len(cpus)) if cpus else 1)
+
+
+def run_session(config: SessionConfig, stats_queue, stop_event, report_interval_sec: float = 1.0):
+    """Session process entry point: capture -> track -> gestures -> sink until stop_event is set."""
+    stats = SessionStats(name=config.name, cpus=list(config.cpus or []))
+    cam = tracker = sink = None
+    try:
+        _pin_to_cpus(config.cpus)
+        cam = open_source(config.source, width=config.width, height=config.height,
+                          pacing=config.pacing, loop=config.loop)
+        if cam is None:
+            raise RuntimeError(f'Could not open source {config.source!r}')
+        tracker = PoseTracker(model_complexity=config.model_complexity, roi=config.roi, mirror=config.mirror)
+        strategy = build_strategy(config.strategies)
+        sink = build_sink(config.sink, key_map=parse_key_map(config.keys))
+
+        latencies = []
+        window_start = monotonic()
+        window_frames = 0
+
+        def report(now: float):
+            stats.fps = window_frames / (now - window_start) if now > window_start else 0.0
+            stats.latency_p50_ms = percentile(latencies, 50)
+            stats.latency_p95_ms = percentile(latencies, 95)
+            stats.frames_dropped = cam.frames_dropped
+            stats_queue.put(stats)
+
+        while not stop_event.is_set():
+            ok, frame, frame_time = cam.read_stamped()
+            if not ok:
+                if cam.finished:
+                    break
+                continue
+            ts = frame_time if cam.monotonic_clock else monotonic()
+            pose = tracker.detect(frame)
+            pose.timestamp = frame_time
+            sink.set_state(strategy.evaluate(pose), now=frame_time)
+
+            now = monotonic()
+            latencies.append((now - ts) * 1000.0)
+            window_frames += 1
+            stats.frames += 1
+            if now - window_start >= report_interval_sec:
+                report(now)
+                latencies = []
+                window_frames = 0
+                window_start = now
+        if window_frames:
+            # The partial last window, so clips shorter than one interval still report
+            report(monotonic())
+    except Exception:
+        stats.error = traceback.format_exc()
+        stats_queue.put(stats)
+    finally:
+        if sink is not None:
+            sink.release_all()
+        if tracker is not None:
+            tracker.close()
+        if cam is not None:
+            cam.release()
+
+
+def assign_cpus(num_sessions: int, available: Optional[List[int]] = None) -> List[List[int]]:
+    """Split the available cores into contiguous, disjoint groups, one per session.
+
+    Leftover cores go one each to the first sessions. With more sessions than cores, sessions
+    share cores round-robin.
+    """
+    if available is None:
+        available = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else list(range(os.cpu_count() or 1))
+    if num_sessions <= 0:
+        return []
+    if num_sessions >= len(available):
+        return [[available[i % len(available)]] for i in range(num_sessions)]
+    per_session, extra = divmod(len(available), num_sessions)
+    groups = []
+    start = 0
+    for i in range(num_sessions):
+        end = start + per_session + (1 if i < extra else 0)
+        groups.append(available[start:end])
+        start = end
+    return groups
+
+
+class SessionServer:
+    """Hosts N independent sessions in one server, one pinned worker process per session.
+
+    On platforms with fork, session processes inherit the already-imported MediaPipe and
+    OpenCV modules instead of paying their import cost once per copy of the app.
+    """
+
+    def __init__(self, configs: List[SessionConfig], report_interval_sec: float = 1.0,
+                 start_method: Optional[str] = None):
+        names = [c.name for c in configs]
+        if len(set(names)) != len(names):
+            raise ValueError('Session names must be unique')
+        self.configs = configs
+        self.report_interval_sec = report_interval_sec
+        if start_method is None:
+            start_method = 'fork' if 'fork' in mp.get_all_start_methods() else 'spawn'
+        self._ctx = mp.get_context(start_method)
+        self._stats_queue = self._ctx.Queue()
+        self._stop_event = self._ctx.Event()
+        self._processes: Dict[str, mp.Process] = {}
+        self.stats: Dict[str, SessionStats] = {c.name: SessionStats(name=c.name) for c in configs}
+
+    def start(self):
+        if self._ctx.get_start_method() == 'fork':
+            # Load MediaPipe once here so forked sessions inherit it (PoseTracker itself only
+            # imports it on construction, and importing this module should stay cheap)
+            import mediapipe  # noqa: F401
+        groups = assign_cpus(len(self.configs))
+        for config, cpus in zip(self.configs, groups):
+            if config.cpus is None:
+                config.cpus = cpus
+            proc = self._ctx.Process(target=run_session,
+                                     args=(config, self._stats_queue, self._stop_event, self.report_interval_sec),
+                                     name=f'session-{config.name}', daemon=True)
+            proc.start()
+            self._processes[config.name] = proc
+
+    def poll(self, timeout: float = 0.0) -> Dict[str, SessionStats]:
+        """Collect pending stats reports and return the latest report per session."""
+        block = timeout > 0
+        while True:
+            try:
+                report = self._stats_queue.get(block=block, timeout=timeout if block else None)
+            except queue.Empty:
+                break
+            self.stats[report.name] = report
+            block = False
+        return self.stats
+
+    def alive(self) -> List[str]:
+        return [name for name, p in self._processes.items() if p.is_alive()]
+
+    def stop(self, timeout: float = 3.0):
+        self._stop_event.set()
+        for proc in self._processes.values():
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        self.poll()
+        self._processes = {}
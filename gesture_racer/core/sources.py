@@ -0,0 +1,170 @@
+import os
+from abc import ABC, abstractmethod
+from time import monotonic, sleep
+from typing import List, Optional, Union
+
+import cv2
+
+# Pacing modes for recorded sources
+PACING_REALTIME = 'realtime'  # deliver frames at their recorded timestamps
+PACING_FAST = 'fast'          # deliver frames as fast as the consumer reads them
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp')
+
+
+class FrameSource(ABC):
+    """A source of BGR frames stamped with a frame time in seconds.
+
+    - live sources (cameras, real-time playback) may drop frames under load
+    - recorded sources in fast pacing are lossless and deterministic
+    """
+
+    live: bool = True
+    # True when frame_time is a monotonic() capture timestamp (usable for latency)
+    monotonic_clock: bool = False
+
+    @abstractmethod
+    def open(self) -> bool:
+        pass
+
+    @abstractmethod
+    def read_stamped(self):
+        """Return (ok, frame, frame_time)."""
+        pass
+
+    @abstractmethod
+    def release(self):
+        pass
+
+    @property
+    def finished(self) -> bool:
+        """True once a finite source has delivered its last frame."""
+        return False
+
+    @property
+    def frames_dropped(self) -> int:
+        return 0
+
+    def read(self):
+        ok, frame, _ = self.read_stamped()
+        return ok, frame
+
+
+class _PacedSource(FrameSource):
+    def __init__(self, pacing: str):
+        if pacing not in (PACING_REALTIME, PACING_FAST):
+            raise ValueError(f'Unknown pacing: {pacing}')
+        self.pacing = pacing
+        self.live = pacing == PACING_REALTIME
+        self._wall_start: Optional[float] = None
+        self._done = False
+
+    @property
+    def finished(self) -> bool:
+        return self._done
+
+    def _pace(self, frame_time: float):
+        if self.pacing != PACING_REALTIME:
+            return
+        now = monotonic()
+        if self._wall_start is None:
+            self._wall_start = now - frame_time
+        delay = self._wall_start + frame_time - now
+        if delay > 0:
+            sleep(delay)
+
+
+class VideoFileSource(_PacedSource):
+    """Plays a recorded video file, honouring its timestamps in real-time pacing."""
+
+    def __init__(self, path: str, pacing: str = PACING_REALTIME, loop: bool = False):
+        super().__init__(pacing)
+        self.path = path
+        self.loop = loop
+        self.cap = None
+        self.fps = 0.0
+        self._index = 0
+        self._last_time = -1.0
+        self._loop_offset = 0.0
+
+    def open(self) -> bool:
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            return False
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        return True
+
+    def read_stamped(self):
+        if self.cap is None or self._done:
+            return False, None, 0.0
+        ok, frame = self.cap.read()
+        if not ok and self.loop and self._index > 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._loop_offset = self._last_time + 1.0 / self.fps
+            ok, frame = self.cap.read()
+        if not ok:
+            self._done = True
+            return False, None, 0.0
+        media_time = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0 + self._loop_offset
+        if media_time <= self._last_time:
+            # Backend does not report timestamps; fall back to the nominal frame rate
+            media_time = self._index / self.fps
+        self._index += 1
+        self._last_time = media_time
+        self._pace(media_time)
+        return True, frame, media_time
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class ImageSequenceSource(_PacedSource):
+    """Plays a directory of images in filename order at a fixed frame rate."""
+
+    def __init__(self, directory: str, fps: float = 30.0, pacing: str = PACING_REALTIME, loop: bool = False):
+        super().__init__(pacing)
+        self.directory = directory
+        self.fps = fps
+        self.loop = loop
+        self.files: List[str] = []
+        self._index = 0
+
+    def open(self) -> bool:
+        if not os.path.isdir(self.directory):
+            return False
+        self.files = sorted(os.path.join(self.directory, f) for f in os.listdir(self.directory)
+                            if f.lower().endswith(IMAGE_EXTENSIONS))
+        return bool(self.files)
+
+    def read_stamped(self):
+        if self._done or not self.files:
+            return False, None, 0.0
+        if self._index >= len(self.files):
+            if not self.loop:
+                self._done = True
+                return False, None, 0.0
+        frame_time = self._index / self.fps
+        frame = cv2.imread(self.files[self._index % len(self.files)])
+        self._index += 1
+        if frame is None:
+            return False, None, frame_time
+        self._pace(frame_time)
+        return True, frame, frame_time
+
+    def release(self):
+        self.files = []
+
+
+def open_source(spec: Union[int, str], width: int = 640, height: int = 480,
+                pacing: str = PACING_REALTIME, loop: bool = False) -> Optional[FrameSource]:
+    """Open a camera index, image directory or video file; returns None if it cannot be opened."""
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit()):
+        from gesture_racer.core.camera import Camera
+        source = Camera(device_index=int(spec), width=width, height=height, threaded=True)
+    elif os.path.isdir(spec):
+        source = ImageSequenceSource(spec, pacing=pacing, loop=loop)
+    else:
+        source = VideoFileSource(spec, pacing=pacing, loop=loop)
+    return source if source.open() else None
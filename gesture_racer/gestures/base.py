@@ -1,9 +1,73 @@
 from abc import ABC, abstractmethod
-from gesture_racer.utils.types import PoseData, Command
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from gesture_racer.utils.types import COMMAND_DTYPE, LANDMARK_INDEX, VISIBILITY, X, Y, Z, PoseData, Command
+
+
+class BatchPoint(NamedTuple):
+    """One landmark across a batch of frames: a presence mask plus float64 coordinate columns."""
+    present: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    visibility: np.ndarray
+
+
+def batch_point(landmarks: np.ndarray, name: str) -> BatchPoint:
+    """Extract a named landmark from a (frames x landmarks x 4) array.
+
+    A landmark is present where its x is not NaN, matching pose.points.get() on the per-frame path.
+    """
+    cols = np.asarray(landmarks[:, LANDMARK_INDEX[name], :], dtype=np.float64)
+    x = cols[:, X]
+    return BatchPoint(present=~np.isnan(x), x=x, y=cols[:, Y], z=cols[:, Z], visibility=cols[:, VISIBILITY])
+
+
+def empty_commands(n: int) -> np.ndarray:
+    return np.zeros(n, dtype=COMMAND_DTYPE)
 
 
 class GestureStrategy(ABC):
+    """Maps a pose to a Command.
+
+    The class attributes describe a strategy to CompositeStrategy:
+    - landmark_inputs: names of the landmarks evaluate() reads (besides pose width/height);
+      None means it may read anything
+    - stateless: evaluate() depends on the current pose only, so with declared inputs the
+      composite may reuse the last result while those inputs have not moved
+    - priority: composite evaluation order, highest first (ties keep list order)
+    - exclusive: while this strategy returns a non-empty Command, lower-priority strategies are
+      skipped and only the commands evaluated so far count
+    """
+
+    landmark_inputs: Optional[Tuple[str, ...]] = None
+    stateless: bool = False
+    priority: int = 0
+    exclusive: bool = False
+
     @abstractmethod
     def evaluate(self, pose: PoseData) -> Command:
         """Return a Command based on the incoming pose data."""
-        pass
\ No newline at end of file
+        pass
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int,
+                       timestamps: Optional[np.ndarray] = None) -> np.ndarray:
+        """Evaluate a whole recording at once.
+
+        landmarks is a (frames x landmarks x 4) array as stored by the landmark log (frames without
+        a person are all-NaN); returns one COMMAND_DTYPE row per frame. Results and the strategy's
+        state afterwards are identical to calling evaluate() frame by frame. This default does
+        exactly that; built-in strategies override it with vectorized versions.
+        """
+        out = empty_commands(len(landmarks))
+        for i in range(len(landmarks)):
+            block = landmarks[i]
+            lm = None if np.isnan(block[:, X]).all() else np.asarray(block, dtype=np.float64)
+            ts = None
+            if timestamps is not None and not np.isnan(timestamps[i]):
+                ts = float(timestamps[i])
+            cmd = self.evaluate(PoseData(width=width, height=height, landmarks=lm, timestamp=ts))
+            out[i] = cmd.as_row()
+        return out
@@ -1,5 +1,7 @@
+import numpy as np
+
 from gesture_racer.utils.types import PoseData, Command
-from gesture_racer.gestures.base import GestureStrategy
+from gesture_racer.gestures.base import GestureStrategy, batch_point, empty_commands
 
 
 class BendMotionStrategy(GestureStrategy):
@@ -11,20 +13,19 @@ class BendMotionStrategy(GestureStrategy):
     Note: MediaPipe z is approximately meters toward camera (negative values are closer).
     """
 
+    landmark_inputs = ('left_shoulder', 'right_shoulder', 'left_hip', 'right_hip')
+    stateless = True
+
     def __init__(self, lean_threshold: float = 0.10):
         self.lean_threshold = lean_threshold
 
     def evaluate(self, pose: PoseData) -> Command:
-        pts = pose.points
-        ls = pts.get('left_shoulder')
-        rs = pts.get('right_shoulder')
-        lh = pts.get('left_hip')
-        rh = pts.get('right_hip')
+        features = pose.features
+        shoulders_z = features['shoulder_z']
+        hips_z = features['hip_z']
 
         cmd = Command()
-        if all([ls, rs, lh, rh]):
-            shoulders_z = (ls.z + rs.z) / 2.0
-            hips_z = (lh.z + rh.z) / 2.0
+        if shoulders_z is not None and hips_z is not None:
             # More negative -> closer to camera
             delta = shoulders_z - hips_z
 
@@ -33,4 +34,19 @@ class BendMotionStrategy(GestureStrategy):
             elif delta > self.lean_threshold:
                 cmd.backward = True
 
-        return cmd
\ No newline at end of file
+        return cmd
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int, timestamps=None) -> np.ndarray:
+        out = empty_commands(len(landmarks))
+        ls = batch_point(landmarks, 'left_shoulder')
+        rs = batch_point(landmarks, 'right_shoulder')
+        lh = batch_point(landmarks, 'left_hip')
+        rh = batch_point(landmarks, 'right_hip')
+        valid = ls.present & rs.present & lh.present & rh.present
+
+        with np.errstate(invalid='ignore'):
+            delta = (ls.z + rs.z) / 2.0 - (lh.z + rh.z) / 2.0
+            forward = valid & (delta < -self.lean_threshold)
+            out['forward'] = forward
+            out['backward'] = valid & ~forward & (delta > self.lean_threshold)
+        return out
\ No newline at end of file
@@ -1,26 +1,195 @@
-from typing import List
-from gesture_racer.utils.types import PoseData, Command
-from gesture_racer.gestures.base import GestureStrategy
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from gesture_racer.utils.types import COMMAND_FIELDS, LANDMARK_INDEX, X, Z, PoseData, Command
+from gesture_racer.gestures.base import GestureStrategy, empty_commands
+from gesture_racer.utils.tracing import tracer
+
+_BOOL_FIELDS = COMMAND_FIELDS[:6]
+_MOUSE_FIELDS = COMMAND_FIELDS[6:]
+
+
+def _is_active(cmd: Command) -> bool:
+    return (cmd.intents != 0
+            or cmd.mouse_dx != 0.0 or cmd.mouse_dy != 0.0 or cmd.mouse_vx != 0.0 or cmd.mouse_vy != 0.0)
+
+
+def _active_rows(rows: np.ndarray) -> np.ndarray:
+    active = np.zeros(len(rows), dtype=bool)
+    for name in _BOOL_FIELDS:
+        active |= rows[name]
+    for name in _MOUSE_FIELDS:
+        active |= rows[name] != 0.0
+    return active
+
+
+class _InputWatch:
+    """The pose a stateless strategy was last evaluated on, and what it returned.
+
+    Inputs are the strategy's landmark rows (x, y, and z scaled by the frame width so all three
+    are in pixels) plus the frame size. With epsilon 0 only identical inputs count as unchanged.
+    The last landmark array is kept by reference, not copied: like everywhere else in the
+    pipeline, a PoseData's landmarks are never modified once it has been evaluated.
+    """
+
+    __slots__ = ('index', 'first', 'epsilon', 'width', 'height', 'ref', 'cmd')
+
+    def __init__(self, names, epsilon: float):
+        self.index = np.array([LANDMARK_INDEX[name] for name in names])
+        self.first = int(self.index[0])
+        self.epsilon = epsilon
+        self.width = self.height = None
+        self.ref: Optional[np.ndarray] = None
+        self.cmd: Optional[Command] = None
+
+    def _same(self, landmarks: np.ndarray, ref: np.ndarray, width: int) -> bool:
+        index = self.index
+        if self.epsilon == 0.0:
+            # Early out for the common case of a moving pose (NaN also lands here; that only
+            # costs a re-evaluation)
+            first = self.first
+            if landmarks[first, X] != ref[first, X]:
+                return False
+            return landmarks[index, X:Z + 1].tobytes() == ref[index, X:Z + 1].tobytes()
+        delta = landmarks[index, X:Z + 1] - ref[index, X:Z + 1]
+        delta[:, Z - X] *= width
+        missing = np.isnan(landmarks[index, X:Z + 1])
+        if not np.array_equal(missing, np.isnan(ref[index, X:Z + 1])):
+            return False
+        return bool(np.all(np.abs(delta[~missing]) <= self.epsilon))
+
+    def update(self, landmarks: Optional[np.ndarray], width: int, height: int) -> bool:
+        """Return True if the inputs changed (and remember them), False if the last result still holds.
+
+        The first call always returns True; the caller then stores the new result in cmd.
+        """
+        if width == self.width and height == self.height:
+            ref = self.ref
+            if landmarks is ref:
+                return False
+            if landmarks is not None and ref is not None and self._same(landmarks, ref, width):
+                return False
+        self.width = width
+        self.height = height
+        self.ref = landmarks
+        return True
 
 
 class CompositeStrategy(GestureStrategy):
-    """Combines multiple strategies. Later strategies can override fields if desired."""
+    """Combines multiple strategies: booleans are ORed, mouse motion is summed.
+
+    Strategies run in priority order (highest first, ties in list order). When an exclusive
+    strategy (e.g. panic) returns a non-empty Command, the lower-priority ones are skipped for that
+    frame, so their state does not advance either.
 
-    def __init__(self, strategies: List[GestureStrategy]):
+    A stateless strategy with declared landmark_inputs is only re-evaluated when one of those
+    landmarks (or the frame size) changed by more than epsilon pixels (z scaled by frame width);
+    otherwise its last Command is reused. The default epsilon 0 reuses results only for identical
+    inputs (e.g. poses repeated by the inference gate), so outputs never change.
+
+    calls, skipped_unchanged and skipped_override count per strategy; see counters().
+    """
+
+    def __init__(self, strategies: List[GestureStrategy], epsilon: float = 0.0):
         self.strategies = strategies
+        self.epsilon = epsilon
+        self._span_names = [f'strategy.{type(s).__name__}' for s in strategies]
+        self._order = sorted(range(len(strategies)), key=lambda i: -strategies[i].priority)
+        self._watches: List[Optional[_InputWatch]] = [
+            _InputWatch(s.landmark_inputs, epsilon) if s.stateless and s.landmark_inputs is not None else None
+            for s in strategies
+        ]
+        # (index, strategy, watch, span name) in evaluation order
+        self._plan = [(i, strategies[i], self._watches[i], self._span_names[i]) for i in self._order]
+        self.calls = [0] * len(strategies)
+        self.skipped_unchanged = [0] * len(strategies)
+        self.skipped_override = [0] * len(strategies)
+
+    def counters(self) -> Dict[str, dict]:
+        """Per-strategy call and skip counts, keyed by class name (suffixed with the index if repeated)."""
+        names = [type(s).__name__ for s in self.strategies]
+        out = {}
+        for i, name in enumerate(names):
+            key = name if names.count(name) == 1 else f'{name}[{i}]'
+            out[key] = {'calls': self.calls[i], 'skipped_unchanged': self.skipped_unchanged[i],
+                        'skipped_override': self.skipped_override[i]}
+        return out
 
     def evaluate(self, pose: PoseData) -> Command:
         cmd = Command()
-        for strat in self.strategies:
-            sub = strat.evaluate(pose)
+        for pos, (i, strat, watch, span_name) in enumerate(self._plan):
+            if watch is not None and not watch.update(pose.landmarks, pose.width, pose.height):
+                self.skipped_unchanged[i] += 1
+                sub = watch.cmd
+            else:
+                with tracer.span(span_name):
+                    sub = strat.evaluate(pose)
+                self.calls[i] += 1
+                if watch is not None:
+                    watch.cmd = sub
             # Merge by OR for booleans
-            cmd.forward = cmd.forward or sub.forward
-            cmd.backward = cmd.backward or sub.backward
-            cmd.left = cmd.left or sub.left
-            cmd.right = cmd.right or sub.right
-            cmd.brake = cmd.brake or sub.brake
-            cmd.fire = cmd.fire or sub.fire
+            cmd.intents |= sub.intents
             # Accumulate mouse motion deltas
             cmd.mouse_dx += sub.mouse_dx
             cmd.mouse_dy += sub.mouse_dy
-        return cmd
\ No newline at end of file
+            cmd.mouse_vx += sub.mouse_vx
+            cmd.mouse_vy += sub.mouse_vy
+            if strat.exclusive and _is_active(sub):
+                for j in self._order[pos + 1:]:
+                    self.skipped_override[j] += 1
+                break
+        return cmd
+
+    def _evaluate_watched(self, i: int, landmarks: np.ndarray, width: int, height: int, timestamps) -> np.ndarray:
+        """Batch counterpart of the unchanged-input reuse in evaluate(): same frames, same results."""
+        strat, watch = self.strategies[i], self._watches[i]
+        n = len(landmarks)
+        fresh = np.zeros(n, dtype=bool)
+        for f in range(n):
+            block = landmarks[f]
+            lm = None if np.isnan(block[:, X]).all() else np.asarray(block, dtype=np.float64)
+            fresh[f] = watch.update(lm, width, height)
+        sub = strat.evaluate_batch(landmarks[fresh], width, height,
+                                   timestamps[fresh] if timestamps is not None else None)
+        # Frames with unchanged inputs repeat the latest evaluated row (or the result carried over
+        # from before this batch)
+        latest = np.cumsum(fresh) - 1
+        out = empty_commands(n)
+        carried = latest < 0
+        if carried.any():
+            prev = watch.cmd
+            out[carried] = prev.as_row()
+        out[~carried] = sub[latest[~carried]]
+        if len(sub):
+            watch.cmd = Command(*sub[-1].tolist())
+        self.calls[i] += int(np.count_nonzero(fresh))
+        self.skipped_unchanged[i] += n - int(np.count_nonzero(fresh))
+        return out
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int, timestamps=None) -> np.ndarray:
+        """Vectorized evaluate(): each strategy only sees the frames no exclusive strategy overrode."""
+        n = len(landmarks)
+        out = empty_commands(n)
+        remaining = np.ones(n, dtype=bool)
+        for i in self._order:
+            strat = self.strategies[i]
+            frames = np.flatnonzero(remaining)
+            self.skipped_override[i] += n - len(frames)
+            if not len(frames):
+                continue
+            # Compress to the frames this strategy actually runs on, as the per-frame path does
+            lm = landmarks if len(frames) == n else landmarks[frames]
+            ts = timestamps if timestamps is None or len(frames) == n else np.asarray(timestamps)[frames]
+            if self._watches[i] is not None:
+                sub = self._evaluate_watched(i, lm, width, height, ts)
+            else:
+                sub = strat.evaluate_batch(lm, width, height, ts)
+                self.calls[i] += len(frames)
+            for name in _BOOL_FIELDS:
+                out[name][frames] |= sub[name]
+            for name in _MOUSE_FIELDS:
+                out[name][frames] += sub[name]
+            if strat.exclusive:
+                remaining[frames[_active_rows(sub)]] = False
+        return out
@@ -0,0 +1,249 @@
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from gesture_racer.utils.types import LANDMARK_INDEX, LANDMARK_NAMES, PoseData, PosePoint
+
+# Feature name -> (compute(pose, *dependency values), dependency names)
+FEATURES: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {}
+
+_MISSING = object()
+
+
+def feature(name: str, *depends: str):
+    """Register fn(pose, *values of depends) as the feature name.
+
+    Values are None when the inputs are missing; features that depend on a None value should
+    return None too.
+    """
+    def register(fn):
+        if name in FEATURES:
+            raise ValueError(f'Feature already registered: {name}')
+        FEATURES[name] = (fn, depends)
+        return fn
+    return register
+
+
+class FeatureStore:
+    """Derived per-frame features of one PoseData, each computed at most once, on first access.
+
+    Use pose.features['wrist_mid'] rather than constructing one: the store is memoized on the
+    PoseData, so every strategy evaluating that pose shares the results. Dependencies are
+    resolved through the same store.
+    """
+
+    __slots__ = ('pose', 'landmarks', '_values')
+
+    def __init__(self, pose: PoseData):
+        self.pose = pose
+        # The array the values were computed from; PoseData.features rebuilds the store if it changes
+        self.landmarks = pose.landmarks
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str):
+        values = self._values
+        value = values.get(name, _MISSING)
+        if value is _MISSING:
+            try:
+                fn, depends = FEATURES[name]
+            except KeyError:
+                raise KeyError(f'Unknown feature: {name}') from None
+            if depends:
+                value = fn(self.pose, *[self[dep] for dep in depends])
+            else:
+                value = fn(self.pose)
+            values[name] = value
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        """True if name has already been computed for this frame."""
+        return name in self._values
+
+
+def _register_point(name: str):
+    index = LANDMARK_INDEX[name]
+
+    def point(pose: PoseData) -> Optional[PosePoint]:
+        lm = pose.landmarks
+        if lm is None:
+            return None
+        x, y, z, vis = lm[index].tolist()
+        if x != x:  # NaN
+            return None
+        return PosePoint(name, x, y, z, vis)
+
+    feature(name)(point)
+
+
+# Every landmark is a feature too: pose.features['left_wrist'] is a PosePoint or None
+for _name in LANDMARK_NAMES:
+    _register_point(_name)
+
+
+def angle(a: PosePoint, b: PosePoint, c: PosePoint) -> Optional[float]:
+    """Angle at point b formed by points a-b-c in degrees."""
+    if not a or not b or not c:
+        return None
+    v1 = (a.x - b.x, a.y - b.y)
+    v2 = (c.x - b.x, c.y - b.y)
+    dot = v1[0] * v2[0] + v1[1] * v2[1]
+    mag1 = math.sqrt(v1[0] ** 2 + v1[1] ** 2)
+    mag2 = math.sqrt(v2[0] ** 2 + v2[1] ** 2)
+    if mag1 == 0 or mag2 == 0:
+        return None
+    cosang = max(-1.0, min(1.0, dot / (mag1 * mag2)))
+    return math.degrees(math.acos(cosang))
+
+
+# Landmarks gathered by the 'body' feature, in this row order
+_BODY_NAMES = ('left_shoulder', 'right_shoulder', 'left_elbow', 'right_elbow',
+               'left_wrist', 'right_wrist', 'left_hip', 'right_hip', 'nose')
+_BODY_INDEX = np.array([LANDMARK_INDEX[name] for name in _BODY_NAMES])
+
+
+@feature('body')
+def body(pose) -> Optional[list]:
+    """x, y, z of every landmark in _BODY_NAMES, in one fancy-indexed gather: 9 [x, y, z] lists.
+
+    None if any of them is missing; the features below then fall back to the scalar versions on
+    the individual points, which handle a missing landmark one at a time. Past the gather the
+    arithmetic stays on Python floats: with two arms or two wrists per frame, NumPy's per-call
+    overhead costs more than the math.
+    """
+    lm = pose.landmarks
+    if lm is None:
+        return None
+    rows = lm[_BODY_INDEX, :3]
+    total = float(rows.sum())
+    if total != total:  # NaN
+        return None
+    return rows.tolist()
+
+
+def _elbow_angle(shoulder, elbow, wrist) -> Optional[float]:
+    """angle() on [x, y, z] rows."""
+    v1x, v1y = shoulder[0] - elbow[0], shoulder[1] - elbow[1]
+    v2x, v2y = wrist[0] - elbow[0], wrist[1] - elbow[1]
+    mag1 = math.sqrt(v1x ** 2 + v1y ** 2)
+    mag2 = math.sqrt(v2x ** 2 + v2y ** 2)
+    if mag1 == 0 or mag2 == 0:
+        return None
+    cosang = max(-1.0, min(1.0, (v1x * v2x + v1y * v2y) / (mag1 * mag2)))
+    return math.degrees(math.acos(cosang))
+
+
+@feature('left_elbow_angle', 'body')
+def left_elbow_angle(pose, rows) -> Optional[float]:
+    if rows is not None:
+        return _elbow_angle(rows[0], rows[2], rows[4])
+    features = pose.features
+    return angle(features['left_shoulder'], features['left_elbow'], features['left_wrist'])
+
+
+@feature('right_elbow_angle', 'body')
+def right_elbow_angle(pose, rows) -> Optional[float]:
+    if rows is not None:
+        return _elbow_angle(rows[1], rows[3], rows[5])
+    features = pose.features
+    return angle(features['right_shoulder'], features['right_elbow'], features['right_wrist'])
+
+
+@feature('wrist_mid', 'body')
+def wrist_mid(pose, rows) -> Optional[Tuple[float, float]]:
+    """(x, y) average of the visible wrists; a single visible wrist is used as is."""
+    if rows is not None:
+        lw, rw = rows[4], rows[5]
+        return (lw[0] + rw[0]) / 2, (lw[1] + rw[1]) / 2
+    features = pose.features
+    lw, rw = features['left_wrist'], features['right_wrist']
+    xs, ys = [], []
+    if lw:
+        xs.append(lw.x)
+        ys.append(lw.y)
+    if rw:
+        xs.append(rw.x)
+        ys.append(rw.y)
+    if not xs:
+        return None
+    return sum(xs) / len(xs), sum(ys) / len(ys)
+
+
+@feature('wrist_distance', 'body')
+def wrist_distance(pose, rows) -> Optional[float]:
+    if rows is not None:
+        (lx, ly, _), (rx, ry, _) = rows[4], rows[5]
+    else:
+        features = pose.features
+        lw, rw = features['left_wrist'], features['right_wrist']
+        if not (lw and rw):
+            return None
+        lx, ly, rx, ry = lw.x, lw.y, rw.x, rw.y
+    dx = lx - rx
+    dy = ly - ry
+    return math.sqrt(dx * dx + dy * dy)
+
+
+@feature('wrists_above_nose', 'body')
+def wrists_above_nose(pose, rows) -> Optional[bool]:
+    if rows is not None:
+        nose_y = rows[8][1]
+        return (rows[4][1] < nose_y) and (rows[5][1] < nose_y)
+    features = pose.features
+    lw, rw, nose = features['left_wrist'], features['right_wrist'], features['nose']
+    if not (lw and rw and nose):
+        return None
+    return (lw.y < nose.y) and (rw.y < nose.y)
+
+
+@feature('shoulder_z', 'body')
+def shoulder_z(pose, rows) -> Optional[float]:
+    """Mean shoulder depth (MediaPipe z, negative is closer to the camera)."""
+    if rows is not None:
+        return (rows[0][2] + rows[1][2]) / 2.0
+    features = pose.features
+    ls, rs = features['left_shoulder'], features['right_shoulder']
+    if not (ls and rs):
+        return None
+    return (ls.z + rs.z) / 2.0
+
+
+@feature('hip_z', 'body')
+def hip_z(pose, rows) -> Optional[float]:
+    if rows is not None:
+        return (rows[6][2] + rows[7][2]) / 2.0
+    features = pose.features
+    lh, rh = features['left_hip'], features['right_hip']
+    if not (lh and rh):
+        return None
+    return (lh.z + rh.z) / 2.0
+
+
+@feature('shoulder_depth_delta', 'body')
+def shoulder_depth_delta(pose, rows) -> Optional[float]:
+    """right z - left z: positive when the right shoulder is farther back."""
+    if rows is not None:
+        return rows[1][2] - rows[0][2]
+    features = pose.features
+    ls, rs = features['left_shoulder'], features['right_shoulder']
+    if not (ls and rs):
+        return None
+    return rs.z - ls.z
+
+
+@feature('torso_scale', 'body')
+def torso_scale(pose, rows) -> Optional[float]:
+    """Shoulder-midpoint to hip-midpoint distance in pixels, for distance-independent thresholds."""
+    if rows is not None:
+        (lsx, lsy, _), (rsx, rsy, _), (lhx, lhy, _), (rhx, rhy, _) = rows[0], rows[1], rows[6], rows[7]
+    else:
+        features = pose.features
+        ls, rs = features['left_shoulder'], features['right_shoulder']
+        lh, rh = features['left_hip'], features['right_hip']
+        if not (ls and rs and lh and rh):
+            return None
+        lsx, lsy, rsx, rsy = ls.x, ls.y, rs.x, rs.y
+        lhx, lhy, rhx, rhy = lh.x, lh.y, rh.x, rh.y
+    dx = (lsx + rsx) / 2.0 - (lhx + rhx) / 2.0
+    dy = (lsy + rsy) / 2.0 - (lhy + rhy) / 2.0
+    return math.sqrt(dx * dx + dy * dy)
@@ -1,22 +1,22 @@
-import math
-from typing import Optional
-from gesture_racer.utils.types import PoseData, Command, PosePoint
-from gesture_racer.gestures.base import GestureStrategy
+import numpy as np
 
+from gesture_racer.utils.types import PoseData, Command
+from gesture_racer.gestures.base import BatchPoint, GestureStrategy, batch_point, empty_commands
+from gesture_racer.gestures.features import angle  # noqa: F401  (re-exported)
 
-def angle(a: PosePoint, b: PosePoint, c: PosePoint) -> Optional[float]:
-    """Angle at point b formed by points a-b-c in degrees."""
-    if not a or not b or not c:
-        return None
-    v1 = (a.x - b.x, a.y - b.y)
-    v2 = (c.x - b.x, c.y - b.y)
-    dot = v1[0] * v2[0] + v1[1] * v2[1]
-    mag1 = math.sqrt(v1[0] ** 2 + v1[1] ** 2)
-    mag2 = math.sqrt(v2[0] ** 2 + v2[1] ** 2)
-    if mag1 == 0 or mag2 == 0:
-        return None
-    cosang = max(-1.0, min(1.0, dot / (mag1 * mag2)))
-    return math.degrees(math.acos(cosang))
+
+def angle_batch(a: BatchPoint, b: BatchPoint, c: BatchPoint) -> np.ndarray:
+    """Vectorized angle(); NaN where angle() would return None."""
+    v1x, v1y = a.x - b.x, a.y - b.y
+    v2x, v2y = c.x - b.x, c.y - b.y
+    dot = v1x * v2x + v1y * v2y
+    mag1 = np.sqrt(v1x ** 2 + v1y ** 2)
+    mag2 = np.sqrt(v2x ** 2 + v2y ** 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cosang = np.minimum(1.0, np.maximum(-1.0, dot / (mag1 * mag2)))
+        deg = np.degrees(np.arccos(cosang))
+    deg[(mag1 == 0) | (mag2 == 0) | ~(a.present & b.present & c.present)] = np.nan
+    return deg
 
 
 class GunPoseStrategy(GestureStrategy):
@@ -28,39 +28,49 @@ class GunPoseStrategy(GestureStrategy):
     These are simple, robust cues for "holding up and aiming" in 2D.
     """
 
+    landmark_inputs = ('left_shoulder', 'right_shoulder', 'left_elbow', 'right_elbow', 'left_wrist', 'right_wrist')
+    stateless = True
+
     def __init__(self, elbow_bent_threshold_deg: float = 70.0, wrist_distance_px: int = 120):
         self.elbow_bent_threshold_deg = elbow_bent_threshold_deg
         self.wrist_distance_px = wrist_distance_px
 
     def evaluate(self, pose: PoseData) -> Command:
-        pts = pose.points
-        ls = pts.get('left_shoulder')
-        rs = pts.get('right_shoulder')
-        le = pts.get('left_elbow')
-        re = pts.get('right_elbow')
-        lw = pts.get('left_wrist')
-        rw = pts.get('right_wrist')
-
+        features = pose.features
         cmd = Command()
 
-        if all([ls, rs, le, re, lw, rw]):
-            # Elbow bend angles
-            left_angle = angle(ls, le, lw)
-            right_angle = angle(rs, re, rw)
-
-            # Distance between wrists
-            dx = lw.x - rw.x
-            dy = lw.y - rw.y
-            wrist_dist = math.sqrt(dx * dx + dy * dy)
+        # Elbow bend angles; None unless shoulder, elbow and wrist are all visible
+        left_angle = features['left_elbow_angle']
+        right_angle = features['right_elbow_angle']
+        if left_angle is not None and right_angle is not None:
+            elbows_bent = (left_angle < self.elbow_bent_threshold_deg) and (
+                right_angle < self.elbow_bent_threshold_deg)
 
-            elbows_bent = False
-            if left_angle is not None and right_angle is not None:
-                elbows_bent = (left_angle < self.elbow_bent_threshold_deg) and (
-                    right_angle < self.elbow_bent_threshold_deg)
-
-            hands_together = wrist_dist < self.wrist_distance_px
+            # Distance between wrists (both are visible whenever both angles are)
+            hands_together = features['wrist_distance'] < self.wrist_distance_px
 
             if elbows_bent and hands_together:
                 cmd.fire = True
 
-        return cmd
\ No newline at end of file
+        return cmd
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int, timestamps=None) -> np.ndarray:
+        out = empty_commands(len(landmarks))
+        ls = batch_point(landmarks, 'left_shoulder')
+        rs = batch_point(landmarks, 'right_shoulder')
+        le = batch_point(landmarks, 'left_elbow')
+        re = batch_point(landmarks, 'right_elbow')
+        lw = batch_point(landmarks, 'left_wrist')
+        rw = batch_point(landmarks, 'right_wrist')
+        valid = ls.present & rs.present & le.present & re.present & lw.present & rw.present
+
+        left_angle = angle_batch(ls, le, lw)
+        right_angle = angle_batch(rs, re, rw)
+        dx = lw.x - rw.x
+        dy = lw.y - rw.y
+        with np.errstate(invalid='ignore'):
+            wrist_dist = np.sqrt(dx * dx + dy * dy)
+            # NaN angles (None on the per-frame path) compare False, i.e. elbows not bent
+            elbows_bent = (left_angle < self.elbow_bent_threshold_deg) & (right_angle < self.elbow_bent_threshold_deg)
+            out['fire'] = valid & elbows_bent & (wrist_dist < self.wrist_distance_px)
+        return out
\ No newline at end of file
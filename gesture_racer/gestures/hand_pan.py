@@ -1,5 +1,8 @@
+import numpy as np
+
 from gesture_racer.utils.types import PoseData, Command
-from gesture_racer.gestures.base import GestureStrategy
+from gesture_racer.gestures.base import GestureStrategy, batch_point, empty_commands
+from gesture_racer.gestures.hand_turn import wrist_average_batch
 from gesture_racer.utils.filters import EmaFilter
 
 
@@ -10,8 +13,12 @@ class HandPanStrategy(GestureStrategy):
     - Maps horizontal and vertical offsets to mouse_dx/dy per frame.
     - Applies a pixel dead-zone to reduce jitter and clamps max movement per frame.
     - Optional invert_y to match subjective camera feel.
+    - Also emits the pan as a velocity (mouse_vx/vy in px/s): the per-frame delta at reference_fps,
+      so the speed no longer depends on the camera frame rate when HighRateOutput applies it.
     """
 
+    landmark_inputs = ('left_wrist', 'right_wrist')
+
     def __init__(self,
                  sensitivity: float = 1.2,
                  dead_zone_px: int = 25,
@@ -19,7 +26,8 @@ class HandPanStrategy(GestureStrategy):
                  invert_y: bool = False,
                  use_velocity: bool = False,
                  ema_alpha: float = 0.3,
-                 neutral_center: bool = True):
+                 neutral_center: bool = True,
+                 reference_fps: float = 30.0):
         self.sensitivity = sensitivity
         self.dead_zone_px = dead_zone_px
         self.max_px_per_frame = max_px_per_frame
@@ -28,6 +36,7 @@ class HandPanStrategy(GestureStrategy):
         self._ema_dx = EmaFilter(alpha=ema_alpha)
         self._ema_dy = EmaFilter(alpha=ema_alpha)
         self.neutral_center = neutral_center
+        self.reference_fps = reference_fps
         self._neutral_x = None
         self._neutral_y = None
         self._last_avg_x = None
@@ -35,24 +44,12 @@ class HandPanStrategy(GestureStrategy):
 
     def evaluate(self, pose: PoseData) -> Command:
         cmd = Command()
-        lw = pose.points.get('left_wrist')
-        rw = pose.points.get('right_wrist')
-
-        # Choose average of available wrists
-        xs = []
-        ys = []
-        if lw:
-            xs.append(lw.x)
-            ys.append(lw.y)
-        if rw:
-            xs.append(rw.x)
-            ys.append(rw.y)
-
-        if not xs:
+        # Average of available wrists
+        mid = pose.features['wrist_mid']
+        if mid is None:
             return cmd
 
-        avg_x = sum(xs) / len(xs)
-        avg_y = sum(ys) / len(ys)
+        avg_x, avg_y = mid
 
         # Neutral center calibration: first frame sets neutral unless disabled
         if self._neutral_x is None or self._neutral_y is None:
@@ -109,8 +106,57 @@ class HandPanStrategy(GestureStrategy):
 
         cmd.mouse_dx = dx
         cmd.mouse_dy = dy
+        cmd.mouse_vx = dx * self.reference_fps
+        cmd.mouse_vy = dy * self.reference_fps
 
         # Save last positions for velocity mode
         self._last_avg_x = avg_x
         self._last_avg_y = avg_y
-        return cmd
\ No newline at end of file
+        return cmd
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int, timestamps=None) -> np.ndarray:
+        """Vectorized position mode; the EMA runs over the moving frames only, as in evaluate().
+
+        Velocity mode depends on the previous non-dead-zone frame and falls back to the
+        per-frame path.
+        """
+        if self.use_velocity:
+            return super().evaluate_batch(landmarks, width, height, timestamps)
+        n = len(landmarks)
+        out = empty_commands(n)
+        lw = batch_point(landmarks, 'left_wrist')
+        rw = batch_point(landmarks, 'right_wrist')
+        valid = lw.present | rw.present
+        if not valid.any():
+            return out
+        avg_x = wrist_average_batch(lw, rw, 'x')
+        avg_y = wrist_average_batch(lw, rw, 'y')
+
+        if self._neutral_x is None or self._neutral_y is None:
+            self._neutral_x = width / 2.0
+            self._neutral_y = height / 2.0
+        offset_x = avg_x - self._neutral_x
+        offset_y = avg_y - self._neutral_y
+
+        with np.errstate(invalid='ignore'):
+            moving = valid & ~((np.abs(offset_x) <= self.dead_zone_px) & (np.abs(offset_y) <= self.dead_zone_px))
+        gain = self.max_px_per_frame * self.sensitivity
+        dx = (offset_x[moving] / (width / 2.0)) * gain
+        dy = (offset_y[moving] / (height / 2.0)) * gain
+        if self.invert_y:
+            dy = -dy
+
+        # The EMA recurrence is inherently sequential; run the same filter objects over the
+        # compacted moving frames so the state and rounding match evaluate() exactly
+        dx = np.array([self._ema_dx.update(v) for v in dx.tolist()])
+        dy = np.array([self._ema_dy.update(v) for v in dy.tolist()])
+
+        out['mouse_dx'][moving] = np.clip(dx, -self.max_px_per_frame, self.max_px_per_frame)
+        out['mouse_dy'][moving] = np.clip(dy, -self.max_px_per_frame, self.max_px_per_frame)
+        out['mouse_vx'][moving] = out['mouse_dx'][moving] * self.reference_fps
+        out['mouse_vy'][moving] = out['mouse_dy'][moving] * self.reference_fps
+        if moving.any():
+            last = np.flatnonzero(moving)[-1]
+            self._last_avg_x = float(avg_x[last])
+            self._last_avg_y = float(avg_y[last])
+        return out
\ No newline at end of file
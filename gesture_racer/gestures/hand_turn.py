@@ -1,5 +1,14 @@
+import numpy as np
+
 from gesture_racer.utils.types import PoseData, Command
-from gesture_racer.gestures.base import GestureStrategy
+from gesture_racer.gestures.base import BatchPoint, GestureStrategy, batch_point, empty_commands
+
+
+def wrist_average_batch(lw: BatchPoint, rw: BatchPoint, coord: str) -> np.ndarray:
+    """Vectorized sum(xs) / len(xs) over the available wrists; NaN where neither is present."""
+    a, b = getattr(lw, coord), getattr(rw, coord)
+    both = lw.present & rw.present
+    return np.where(both, (a + b) / 2, np.where(lw.present, a, np.where(rw.present, b, np.nan)))
 
 
 class HandTurnStrategy(GestureStrategy):
@@ -11,6 +20,8 @@ class HandTurnStrategy(GestureStrategy):
     - Optional invert_x to flip left/right mapping if needed.
     """
 
+    landmark_inputs = ('left_wrist', 'right_wrist')
+
     def __init__(self, dead_zone_px: int = 40, invert_x: bool = False, hysteresis_px: int = 20):
         self.dead_zone_px = dead_zone_px
         self.invert_x = invert_x
@@ -20,19 +31,11 @@ class HandTurnStrategy(GestureStrategy):
 
     def evaluate(self, pose: PoseData) -> Command:
         cmd = Command()
-        lw = pose.points.get('left_wrist')
-        rw = pose.points.get('right_wrist')
-
-        xs = []
-        if lw:
-            xs.append(lw.x)
-        if rw:
-            xs.append(rw.x)
-
-        if not xs:
+        mid = pose.features['wrist_mid']
+        if mid is None:
             return cmd
 
-        avg_x = sum(xs) / len(xs)
+        avg_x = mid[0]
         center_x = pose.width / 2.0
         offset_x = avg_x - center_x
 
@@ -62,4 +65,46 @@ class HandTurnStrategy(GestureStrategy):
         self._current_right = go_right
         cmd.left = go_left
         cmd.right = go_right
-        return cmd
\ No newline at end of file
+        return cmd
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int, timestamps=None) -> np.ndarray:
+        """Vectorized hysteresis: the held state is a forward-fill of the last frame that set it.
+
+        With invert_x, every frame inside the hysteresis band re-applies the swap to the held
+        state, exactly as evaluate() does, so the state is toggled by the parity of band frames.
+        """
+        n = len(landmarks)
+        out = empty_commands(n)
+        lw = batch_point(landmarks, 'left_wrist')
+        rw = batch_point(landmarks, 'right_wrist')
+        valid = lw.present | rw.present
+        offset_x = wrist_average_batch(lw, rw, 'x') - width / 2.0
+
+        with np.errstate(invalid='ignore'):
+            moving = valid & ~(np.abs(offset_x) <= self.dead_zone_px)
+            set_right = moving & (offset_x > (self.dead_zone_px + self.hysteresis_px))
+            set_left = moving & ~set_right & (offset_x < -(self.dead_zone_px + self.hysteresis_px))
+        band = moving & ~set_right & ~set_left
+
+        # State codes: 0 = none, 1 = left, 2 = right
+        code = np.zeros(n, dtype=np.int8)
+        code[set_left] = 2 if self.invert_x else 1
+        code[set_right] = 1 if self.invert_x else 2
+        initial = 1 if self._current_left else (2 if self._current_right else 0)
+
+        idx = np.arange(n)
+        is_set = set_left | set_right
+        last_set = np.maximum.accumulate(np.where(is_set, idx, -1)) if n else idx
+        state = np.where(last_set >= 0, code[np.maximum(last_set, 0)], initial).astype(np.int8)
+        if self.invert_x:
+            band_count = np.cumsum(band)
+            since_set = band_count - np.where(last_set >= 0, band_count[np.maximum(last_set, 0)], 0)
+            flip = (since_set % 2 == 1) & (state != 0)
+            state[flip] = 3 - state[flip]
+
+        out['left'] = valid & (state == 1)
+        out['right'] = valid & (state == 2)
+        if n:
+            self._current_left = bool(state[-1] == 1)
+            self._current_right = bool(state[-1] == 2)
+        return out
\ No newline at end of file
@@ -1,6 +1,9 @@
 from time import time
+
+import numpy as np
+
 from gesture_racer.utils.types import PoseData, Command
-from gesture_racer.gestures.base import GestureStrategy
+from gesture_racer.gestures.base import GestureStrategy, batch_point, empty_commands
 
 
 class PanicGestureStrategy(GestureStrategy):
@@ -8,24 +11,27 @@ class PanicGestureStrategy(GestureStrategy):
 
     - This acts as a safety/kill-switch gesture.
     - duration_sec controls how long the gesture must be held before engaging.
+    - Exclusive and highest priority: while engaged, CompositeStrategy skips every other strategy,
+      so the brake is the only output.
     """
 
+    landmark_inputs = ('left_wrist', 'right_wrist', 'nose')
+    priority = 100
+    exclusive = True
+
     def __init__(self, duration_sec: float = 0.8):
         self.duration_sec = duration_sec
         self._start_ts = None
 
     def evaluate(self, pose: PoseData) -> Command:
         cmd = Command()
-        lw = pose.points.get('left_wrist')
-        rw = pose.points.get('right_wrist')
-        nose = pose.points.get('nose')
+        both_above_head = pose.features['wrists_above_nose']
 
-        if not (lw and rw and nose):
+        if both_above_head is None:
             self._start_ts = None
             return cmd
 
-        both_above_head = (lw.y < nose.y) and (rw.y < nose.y)
-        now = time()
+        now = pose.timestamp if pose.timestamp is not None else time()
 
         if both_above_head:
             if self._start_ts is None:
@@ -35,7 +41,34 @@ class PanicGestureStrategy(GestureStrategy):
                 cmd.brake = True
                 cmd.mouse_dx = 0.0
                 cmd.mouse_dy = 0.0
+                cmd.mouse_vx = 0.0
+                cmd.mouse_vy = 0.0
         else:
             self._start_ts = None
 
-        return cmd
\ No newline at end of file
+        return cmd
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int, timestamps=None) -> np.ndarray:
+        """Vectorized hold timer: each run of above-head frames is timed from its first frame."""
+        if timestamps is None:
+            raise ValueError('PanicGestureStrategy.evaluate_batch needs per-frame timestamps')
+        n = len(landmarks)
+        out = empty_commands(n)
+        if n == 0:
+            return out
+        ts = np.asarray(timestamps, dtype=np.float64)
+        lw = batch_point(landmarks, 'left_wrist')
+        rw = batch_point(landmarks, 'right_wrist')
+        nose = batch_point(landmarks, 'nose')
+        with np.errstate(invalid='ignore'):
+            held = lw.present & rw.present & nose.present & (lw.y < nose.y) & (rw.y < nose.y)
+
+        # A run carried over from before this batch keeps its original start time
+        prev_held = np.concatenate(([self._start_ts is not None], held[:-1]))
+        run_start = np.maximum.accumulate(np.where(held & ~prev_held, np.arange(n), -1))
+        carried = self._start_ts if self._start_ts is not None else np.nan
+        start_ts = np.where(run_start >= 0, ts[np.maximum(run_start, 0)], carried)
+
+        out['brake'] = held & ((ts - start_ts) >= self.duration_sec)
+        self._start_ts = float(start_ts[-1]) if held[-1] else None
+        return out
\ No newline at end of file
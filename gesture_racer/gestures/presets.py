@@ -0,0 +1,52 @@
+from importlib import import_module
+from typing import Dict, List, Optional, Type
+
+from gesture_racer.gestures.base import GestureStrategy
+from gesture_racer.gestures.composite import CompositeStrategy
+
+# Strategy name -> 'module:Class'; modules are only imported when a stack uses them
+STRATEGY_TYPES: Dict[str, str] = {
+    'bend_motion': 'gesture_racer.gestures.bend_motion:BendMotionStrategy',
+    'gun_pose': 'gesture_racer.gestures.gun_pose:GunPoseStrategy',
+    'hand_turn': 'gesture_racer.gestures.hand_turn:HandTurnStrategy',
+    'hand_pan': 'gesture_racer.gestures.hand_pan:HandPanStrategy',
+    'panic': 'gesture_racer.gestures.panic:PanicGestureStrategy',
+    'shoulder_pan': 'gesture_racer.gestures.shoulder_pan:ShoulderPanStrategy',
+}
+_loaded: Dict[str, Type[GestureStrategy]] = {}
+
+# The stack app.py has always shipped with
+DEFAULT_STACK: List[dict] = [
+    {'type': 'bend_motion', 'lean_threshold': 0.10},
+    {'type': 'gun_pose', 'elbow_bent_threshold_deg': 70.0, 'wrist_distance_px': 120},
+    {'type': 'hand_turn', 'dead_zone_px': 40, 'invert_x': False, 'hysteresis_px': 20},
+    {'type': 'panic', 'duration_sec': 0.8},
+    {'type': 'hand_pan', 'sensitivity': 0.6, 'dead_zone_px': 25, 'max_px_per_frame': 30.0, 'invert_y': False,
+     'use_velocity': False, 'ema_alpha': 0.35, 'neutral_center': True},
+]
+
+
+def strategy_class(name: str) -> Type[GestureStrategy]:
+    """Resolve a STRATEGY_TYPES name to its class, importing the module on first use."""
+    cls = _loaded.get(name)
+    if cls is None:
+        if name not in STRATEGY_TYPES:
+            raise ValueError(f'Unknown strategy type: {name}')
+        module, _, attr = STRATEGY_TYPES[name].partition(':')
+        cls = _loaded[name] = getattr(import_module(module), attr)
+    return cls
+
+
+def build_strategy(spec: Optional[List[dict]] = None, epsilon: float = 0.0) -> CompositeStrategy:
+    """Build a CompositeStrategy from a list of {'type': name, **kwargs} entries.
+
+    Defaults to DEFAULT_STACK. Every call returns fresh strategy instances, so stateful
+    strategies are never shared between sessions. epsilon is the composite's unchanged-input
+    tolerance in pixels.
+    """
+    strategies = []
+    for entry in (spec if spec is not None else DEFAULT_STACK):
+        kwargs = dict(entry)
+        name = kwargs.pop('type')
+        strategies.append(strategy_class(name)(**kwargs))
+    return CompositeStrategy(strategies, epsilon=epsilon)
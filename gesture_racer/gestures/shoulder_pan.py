@@ -1,5 +1,7 @@
+import numpy as np
+
 from gesture_racer.utils.types import PoseData, Command
-from gesture_racer.gestures.base import GestureStrategy
+from gesture_racer.gestures.base import GestureStrategy, batch_point, empty_commands
 
 
 class ShoulderPanStrategy(GestureStrategy):
@@ -11,24 +13,26 @@ class ShoulderPanStrategy(GestureStrategy):
 
     MediaPipe Pose z note: more negative is closer to camera; more positive is farther (back).
     We use the delta_z = rs.z - ls.z and map it to mouse_dx with a dead-zone and clamp.
+    mouse_vx is the same pan as a velocity, assuming reference_fps frames per second.
     """
 
+    landmark_inputs = ('left_shoulder', 'right_shoulder')
+    stateless = True
+
     def __init__(self, z_sensitivity_px_per_unit: float = 400.0, dead_zone_z: float = 0.03,
-                 max_px_per_frame: float = 30.0):
+                 max_px_per_frame: float = 30.0, reference_fps: float = 30.0):
         # How many pixels to move per unit of z difference
         self.z_sensitivity = z_sensitivity_px_per_unit
         self.dead_zone_z = dead_zone_z
         self.max_px_per_frame = max_px_per_frame
+        self.reference_fps = reference_fps
 
     def evaluate(self, pose: PoseData) -> Command:
         cmd = Command()
-        ls = pose.points.get('left_shoulder')
-        rs = pose.points.get('right_shoulder')
-        if not (ls and rs):
+        delta_z = pose.features['shoulder_depth_delta']  # positive => right shoulder farther back => pan right
+        if delta_z is None:
             return cmd
 
-        delta_z = rs.z - ls.z  # positive => right shoulder farther back => pan right
-
         # Dead-zone to avoid jitter
         if abs(delta_z) <= self.dead_zone_z:
             return cmd
@@ -43,4 +47,17 @@ class ShoulderPanStrategy(GestureStrategy):
 
         cmd.mouse_dx = dx
         cmd.mouse_dy = 0.0
-        return cmd
\ No newline at end of file
+        cmd.mouse_vx = dx * self.reference_fps
+        return cmd
+
+    def evaluate_batch(self, landmarks: np.ndarray, width: int, height: int, timestamps=None) -> np.ndarray:
+        out = empty_commands(len(landmarks))
+        ls = batch_point(landmarks, 'left_shoulder')
+        rs = batch_point(landmarks, 'right_shoulder')
+        with np.errstate(invalid='ignore'):
+            delta_z = rs.z - ls.z
+            active = ls.present & rs.present & ~(np.abs(delta_z) <= self.dead_zone_z)
+        dx = np.clip(delta_z[active] * self.z_sensitivity, -self.max_px_per_frame, self.max_px_per_frame)
+        out['mouse_dx'][active] = dx
+        out['mouse_vx'][active] = dx * self.reference_fps
+        return out
\ No newline at end of file
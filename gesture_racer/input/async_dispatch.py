@@ -0,0 +1,118 @@
+import threading
+import traceback
+from collections import deque
+from time import perf_counter
+from typing import Dict, Optional
+
+from gesture_racer.input.base import KeyboardMouseInput
+from gesture_racer.utils.stats import percentile
+
+_PRESS, _RELEASE, _CLICK, _MOVE = 'press', 'release', 'click_mouse', 'move_mouse'
+
+
+class AsyncInput(KeyboardMouseInput):
+    """Runs another backend's calls on a dedicated worker thread.
+
+    press/release/click_mouse/move_mouse only append to a deque (atomic in CPython, no lock) and
+    wake the worker, so the caller never waits on the display server. The worker replays events
+    in order; consecutive moves still queued are merged into one move_mouse call.
+
+    Counters: enqueued, dispatched, coalesced, failures per call type, last_error, and call
+    latency (enqueue to completion) percentiles via stats(). The wrapped backend should raise
+    on failure (PynputInput(suppress_errors=False)) so failures are counted instead of hidden.
+    """
+
+    def __init__(self, backend: KeyboardMouseInput, latency_window: int = 1024):
+        # Set first: the base class checks its default key table against the wrapped backend
+        self.backend = backend
+        super().__init__()
+        self.enqueued = 0
+        self.dispatched = 0
+        self.coalesced = 0
+        self.failures: Dict[str, int] = {_PRESS: 0, _RELEASE: 0, _CLICK: 0, _MOVE: 0}
+        self.last_error: Optional[str] = None
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._events: deque = deque()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='input-dispatch', daemon=True)
+        self._thread.start()
+
+    def _enqueue(self, kind: str, *args):
+        if self._closed:
+            return
+        self.enqueued += 1
+        self._events.append((kind, args, perf_counter()))
+        self._wake.set()
+
+    def check_key(self, key: str):
+        self.backend.check_key(key)
+
+    def press(self, key: str):
+        self._enqueue(_PRESS, key)
+
+    def release(self, key: str):
+        self._enqueue(_RELEASE, key)
+
+    def click_mouse(self, button: str = 'left'):
+        self._enqueue(_CLICK, button)
+
+    def move_mouse(self, dx: float, dy: float):
+        self._enqueue(_MOVE, dx, dy)
+
+    def _run(self):
+        events = self._events
+        while True:
+            self._wake.wait()
+            # Clear before draining so an event appended mid-drain re-arms the wait
+            self._wake.clear()
+            while events:
+                item = events.popleft()
+                if item is None:
+                    return
+                kind, args, queued_at = item
+                if kind == _MOVE:
+                    dx, dy = args
+                    while events and events[0] is not None and events[0][0] == _MOVE:
+                        _, (more_x, more_y), _ = events.popleft()
+                        dx += more_x
+                        dy += more_y
+                        self.coalesced += 1
+                    args = (dx, dy)
+                self._dispatch(kind, args, queued_at)
+
+    def _dispatch(self, kind: str, args: tuple, queued_at: float):
+        try:
+            getattr(self.backend, kind)(*args)
+        except Exception:
+            self.failures[kind] += 1
+            self.last_error = traceback.format_exc(limit=1)
+        self.dispatched += 1
+        self._latencies.append((perf_counter() - queued_at) * 1000.0)
+
+    @property
+    def pending(self) -> int:
+        return len(self._events)
+
+    def stats(self) -> dict:
+        latencies = list(self._latencies)
+        return {
+            'enqueued': self.enqueued,
+            'dispatched': self.dispatched,
+            'coalesced': self.coalesced,
+            'pending': self.pending,
+            'failures': dict(self.failures),
+            'latency_p50_ms': percentile(latencies, 50),
+            'latency_p95_ms': percentile(latencies, 95),
+            'latency_max_ms': max(latencies) if latencies else 0.0,
+        }
+
+    def close(self):
+        """Deliver everything already queued, then stop the worker and close the backend."""
+        if self._closed:
+            return
+        self._closed = True
+        self._events.append(None)
+        self._wake.set()
+        self._thread.join()
+        self.backend.close()
@@ -1,7 +1,37 @@
 from abc import ABC, abstractmethod
 from time import time
-from typing import Optional
-from gesture_racer.utils.types import Command
+from typing import Dict, Mapping, Optional, Tuple
+from gesture_racer.utils.types import MOVEMENT_INTENTS, Command, Intent
+
+# Intent -> key tables. Key names are whatever the backend's press()/release() accept; PynputInput
+# takes single characters and pynput Key names such as 'up' or 'space'. FIRE is a mouse click.
+KEY_PROFILES: Dict[str, Dict[Intent, str]] = {
+    'wasd': {Intent.FORWARD: 'w', Intent.BACKWARD: 's', Intent.LEFT: 'a', Intent.RIGHT: 'd'},
+    'arrows': {Intent.FORWARD: 'up', Intent.BACKWARD: 'down', Intent.LEFT: 'left', Intent.RIGHT: 'right'},
+}
+DEFAULT_KEY_MAP = KEY_PROFILES['wasd']
+
+_FIRE = int(Intent.FIRE)
+_BRAKE = int(Intent.BRAKE)
+
+
+def parse_key_map(spec: str) -> Dict[Intent, str]:
+    """A KEY_PROFILES name, or intent=key pairs like 'forward=up,backward=down,brake=space'.
+
+    Intents not listed in pairs get no key.
+    """
+    if spec in KEY_PROFILES:
+        return dict(KEY_PROFILES[spec])
+    key_map = {}
+    for item in spec.split(','):
+        intent, sep, key = item.partition('=')
+        if not sep or not key.strip():
+            raise ValueError(f'Expected a profile ({", ".join(KEY_PROFILES)}) or intent=key pairs, got {spec!r}')
+        try:
+            key_map[Intent[intent.strip().upper()]] = key.strip()
+        except KeyError:
+            raise ValueError(f'Unknown intent: {intent.strip()}') from None
+    return key_map
 
 
 class KeyboardMouseInput(ABC):
@@ -22,54 +52,79 @@ class KeyboardMouseInput(ABC):
         """Move mouse by delta in pixels."""
         pass
 
-    def __init__(self):
-        self._last_cmd: Optional[Command] = None
-        self._last_fire_time: float = 0.0
+    def __init__(self, key_map: Optional[Mapping[Intent, str]] = None):
+        # Intent bits whose keys are currently pressed, and the intents of the last Command
+        self._held = 0
+        self._last_intents = 0
+        self._last_fire_time: float = float('-inf')
         self._fire_cooldown_sec: float = 0.5
+        self.set_key_map(DEFAULT_KEY_MAP if key_map is None else key_map)
+
+    def set_key_map(self, key_map: Mapping[Intent, str]):
+        """Switch the intent -> key table, e.g. to a per-game profile; held keys are released first."""
+        if Intent.FIRE in key_map:
+            raise ValueError('FIRE is a mouse click and cannot be bound to a key')
+        keys = list(key_map.values())
+        if len(set(keys)) != len(keys):
+            raise ValueError(f'Each key can only be bound to one intent: {dict(key_map)}')
+        for key in keys:
+            self.check_key(key)
+        self.release_all()
+        self._key_table: Tuple[Tuple[int, str], ...] = tuple((int(intent), key) for intent, key in key_map.items())
+        self._key_mask = 0
+        for bit, _ in self._key_table:
+            self._key_mask |= bit
+
+    def check_key(self, key: str):
+        """Raise ValueError if the backend cannot press key; set_key_map() checks every key up front."""
+
+    @property
+    def key_map(self) -> Dict[Intent, str]:
+        return {Intent(bit): key for bit, key in self._key_table}
+
+    @property
+    def held_keys(self) -> Tuple[str, ...]:
+        return tuple(key for bit, key in self._key_table if self._held & bit)
+
+    def release_all(self):
+        """Release every key set_state() is holding, e.g. before shutting down."""
+        if self._held:
+            for bit, key in self._key_table:
+                if self._held & bit:
+                    self.release(key)
+            self._held = 0
+
+    def close(self):
+        """Release any resources held by the backend."""
+        pass
 
-    def set_state(self, cmd: Command):
-        """Apply state changes relative to last command to reduce jitter.
+    def set_state(self, cmd: Command, now: Optional[float] = None):
+        """Apply state changes relative to the keys currently held to reduce jitter.
 
-        - Holds movement keys while the intent is active
+        - Holds each mapped intent's key (see key_map) while the intent is active; only keys
+          whose state actually changes are pressed or released, releases first
+        - Brake releases the movement keys and keeps them up while it lasts
         - Triggers a mouse click when fire is newly activated with cooldown
+        - now: clock for the fire cooldown (defaults to wall time; pass frame time for replays)
         """
-        now = time()
-
-        # Movement: forward/backward
-        if not self._last_cmd or self._last_cmd.forward != cmd.forward:
-            if cmd.forward:
-                self.press('w')
-            else:
-                self.release('w')
-
-        if not self._last_cmd or self._last_cmd.backward != cmd.backward:
-            if cmd.backward:
-                self.press('s')
-            else:
-                self.release('s')
-
-        # Optional: left/right
-        if not self._last_cmd or self._last_cmd.left != cmd.left:
-            if cmd.left:
-                self.press('a')
-            else:
-                self.release('a')
-
-        if not self._last_cmd or self._last_cmd.right != cmd.right:
-            if cmd.right:
-                self.press('d')
-            else:
-                self.release('d')
-
-        # Brake just releases movement keys (optional mapping)
-        if cmd.brake:
-            self.release('w')
-            self.release('s')
-            self.release('a')
-            self.release('d')
+        intents = cmd.intents
+        wanted = intents & self._key_mask
+        if intents & _BRAKE:
+            wanted &= ~MOVEMENT_INTENTS
+        changed = wanted ^ self._held
+        if changed:
+            for bit, key in self._key_table:
+                if changed & bit and not wanted & bit:
+                    self.release(key)
+            for bit, key in self._key_table:
+                if changed & wanted & bit:
+                    self.press(key)
+            self._held = wanted
 
         # Fire: click with cooldown on rising edge
-        if cmd.fire and (not self._last_cmd or not self._last_cmd.fire):
+        if intents & _FIRE and not self._last_intents & _FIRE:
+            if now is None:
+                now = time()
             if now - self._last_fire_time >= self._fire_cooldown_sec:
                 self.click_mouse('left')
                 self._last_fire_time = now
@@ -78,4 +133,4 @@ class KeyboardMouseInput(ABC):
         if abs(cmd.mouse_dx) > 0.01 or abs(cmd.mouse_dy) > 0.01:
             self.move_mouse(cmd.mouse_dx, cmd.mouse_dy)
 
-        self._last_cmd = cmd
\ No newline at end of file
+        self._last_intents = intents
\ No newline at end of file
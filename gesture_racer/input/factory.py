@@ -0,0 +1,29 @@
+from typing import Mapping, Optional
+
+from gesture_racer.input.base import KeyboardMouseInput
+from gesture_racer.utils.types import Intent
+
+
+def build_sink(name: str, async_dispatch: bool = False,
+               key_map: Optional[Mapping[Intent, str]] = None) -> KeyboardMouseInput:
+    """Create an input backend by name. Backends are imported lazily (pynput needs a display).
+
+    async_dispatch wraps the backend in AsyncInput so slow injection never blocks the caller.
+    key_map is the intent -> key table (see parse_key_map); None keeps the WASD default.
+    """
+    if name == 'null':
+        from gesture_racer.input.null_backend import NullInput
+        backend = NullInput()
+    elif name == 'pynput':
+        from gesture_racer.input.pynput_backend import PynputInput
+        # Let failures reach AsyncInput's counters instead of being swallowed
+        backend = PynputInput(suppress_errors=not async_dispatch)
+    else:
+        raise ValueError(f'Unknown sink: {name}')
+    if async_dispatch:
+        from gesture_racer.input.async_dispatch import AsyncInput
+        backend = AsyncInput(backend)
+    if key_map is not None:
+        # Applied to the outermost sink: that is where set_state() diffs the keys
+        backend.set_key_map(key_map)
+    return backend
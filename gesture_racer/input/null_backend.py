@@ -0,0 +1,17 @@
+from gesture_racer.input.base import KeyboardMouseInput
+
+
+class NullInput(KeyboardMouseInput):
+    """Discards all input events. Useful for headless sessions and measurements."""
+
+    def press(self, key: str):
+        pass
+
+    def release(self, key: str):
+        pass
+
+    def click_mouse(self, button: str = 'left'):
+        pass
+
+    def move_mouse(self, dx: float, dy: float):
+        pass
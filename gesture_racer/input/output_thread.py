@@ -0,0 +1,106 @@
+import threading
+from dataclasses import replace
+from time import monotonic, perf_counter, sleep
+from typing import Optional
+
+from gesture_racer.input.base import KeyboardMouseInput
+from gesture_racer.utils.types import Command
+
+
+class HighRateOutput:
+    """Applies Commands to a backend with mouse motion integrated on its own fixed-rate thread.
+
+    submit() forwards key and fire changes to the backend immediately (mouse deltas stripped) and
+    stores the command's mouse velocity (mouse_vx/vy, px/s). The output thread ticks at rate_hz,
+    integrates that velocity over the actual tick interval and moves the mouse by whole pixels,
+    carrying the sub-pixel remainder to the next tick, so pan speed and smoothness no longer
+    depend on the camera frame rate.
+
+    If no command arrives for stale_after_sec (the pipeline stalled or the source ended), the
+    velocity ramps to zero over decay_sec instead of panning on indefinitely.
+    """
+
+    def __init__(self,
+                 backend: KeyboardMouseInput,
+                 rate_hz: float = 500.0,
+                 stale_after_sec: float = 0.15,
+                 decay_sec: float = 0.1):
+        self.backend = backend
+        self.rate_hz = rate_hz
+        self.stale_after_sec = stale_after_sec
+        self.decay_sec = decay_sec
+        self.ticks = 0
+        self.moves = 0
+
+        # The backend is called from both the submitting thread and the output thread
+        self._lock = threading.Lock()
+        self._vx = 0.0
+        self._vy = 0.0
+        self._received_at = 0.0
+        self._residual_x = 0.0
+        self._residual_y = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='input-output', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, cmd: Command, now: Optional[float] = None):
+        """Apply keys/fire now and hand the mouse velocity to the output thread.
+
+        now is the fire-cooldown clock passed through to backend.set_state().
+        """
+        keys_only = replace(cmd, mouse_dx=0.0, mouse_dy=0.0)
+        with self._lock:
+            self.backend.set_state(keys_only, now=now)
+            self._vx = cmd.mouse_vx
+            self._vy = cmd.mouse_vy
+            self._received_at = monotonic()
+
+    def _velocity_scale(self, now: float) -> float:
+        age = now - self._received_at
+        if age <= self.stale_after_sec:
+            return 1.0
+        if self.decay_sec <= 0:
+            return 0.0
+        return max(0.0, 1.0 - (age - self.stale_after_sec) / self.decay_sec)
+
+    def _run(self):
+        period = 1.0 / self.rate_hz
+        last = perf_counter()
+        next_tick = last + period
+        while not self._stop.is_set():
+            delay = next_tick - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            now = perf_counter()
+            # Stay on the fixed grid, but never try to catch up on ticks missed during a stall
+            next_tick = max(next_tick + period, now)
+            dt = now - last
+            last = now
+            self._tick(dt)
+
+    def _tick(self, dt: float):
+        self.ticks += 1
+        with self._lock:
+            scale = self._velocity_scale(monotonic())
+            if scale == 0.0:
+                self._residual_x = self._residual_y = 0.0
+                return
+            self._residual_x += self._vx * scale * dt
+            self._residual_y += self._vy * scale * dt
+            step_x = int(self._residual_x)
+            step_y = int(self._residual_y)
+            if step_x or step_y:
+                self._residual_x -= step_x
+                self._residual_y -= step_y
+                self.backend.move_mouse(step_x, step_y)
+                self.moves += 1
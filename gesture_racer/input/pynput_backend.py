@@ -6,32 +6,65 @@ from gesture_racer.input.base import KeyboardMouseInput
 
 
 class PynputInput(KeyboardMouseInput):
-    def __init__(self):
+    """Injects keys and mouse events with pynput.
+
+    With suppress_errors (the default) failed calls are counted in errors and otherwise ignored;
+    without it they raise, e.g. so AsyncInput can count them per call type.
+    """
+
+    def __init__(self, suppress_errors: bool = True):
+        # Resolved key names; needed by check_key() while the base class installs the default table
+        self._keys = {}
         super().__init__()
         self.keyboard = KeyboardController()
         self.mouse = MouseController()
+        self.suppress_errors = suppress_errors
+        self.errors = 0
+
+    def _key(self, key: str):
+        """Single characters as-is, longer names ('up', 'space', 'shift') as pynput Keys."""
+        resolved = self._keys.get(key)
+        if resolved is None:
+            if len(key) == 1:
+                resolved = key
+            else:
+                try:
+                    resolved = Key[key]
+                except KeyError:
+                    raise ValueError(f'Unknown pynput key name: {key!r}') from None
+            self._keys[key] = resolved
+        return resolved
+
+    def check_key(self, key: str):
+        self._key(key)
+
+    def _failed(self, exc: Exception):
+        """Count a failed pynput call; re-raise exc unless errors are suppressed."""
+        self.errors += 1
+        if not self.suppress_errors:
+            raise exc
 
     def press(self, key: str):
         try:
-            self.keyboard.press(key)
-        except Exception:
-            pass
+            self.keyboard.press(self._key(key))
+        except Exception as exc:
+            self._failed(exc)
 
     def release(self, key: str):
         try:
-            self.keyboard.release(key)
-        except Exception:
-            pass
+            self.keyboard.release(self._key(key))
+        except Exception as exc:
+            self._failed(exc)
 
     def click_mouse(self, button: str = 'left'):
         try:
             btn = Button.left if button == 'left' else Button.right
             self.mouse.click(btn)
-        except Exception:
-            pass
+        except Exception as exc:
+            self._failed(exc)
 
     def move_mouse(self, dx: float, dy: float):
         try:
             self.mouse.move(dx, dy)
-        except Exception:
-            pass
\ No newline at end of file
+        except Exception as exc:
+            self._failed(exc)
\ No newline at end of file
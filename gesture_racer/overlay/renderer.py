@@ -0,0 +1,61 @@
+from time import monotonic, sleep
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from gesture_racer.core.controls import CALIBRATE, QUIT, Controls
+from gesture_racer.utils.tracing import tracer
+
+
+class OverlayRenderer:
+    """Rate-limited debug preview, decoupled from the control path.
+
+    run() is meant for the main thread (some platforms only allow GUI calls there). At most
+    max_fps times a second it asks latest() for the newest finished packet, draws it with
+    draw(frame, packet) and shows it; frames that arrived in between are never drawn. The
+    window's 'q' and 'c' keys become Controls requests, so the pipeline never waits on the GUI.
+
+    With mirror=True the camera frame is flipped into the renderer's own buffer before drawing,
+    so only displayed frames are flipped and packets are never modified; draw() then gets the
+    flipped copy and should use mirrored landmarks (PoseTracker(mirror=True)).
+    """
+
+    def __init__(self, window_name: str, draw: Callable, max_fps: float = 15.0, mirror: bool = False):
+        self.window_name = window_name
+        self.draw = draw
+        self.max_fps = max_fps
+        self.mirror = mirror
+        self.rendered = 0
+        self._flipped: Optional[np.ndarray] = None
+
+    def run(self, latest: Callable[[], Optional[object]], controls: Controls, running: Callable[[], bool]):
+        period = 1.0 / self.max_fps if self.max_fps > 0 else 0.0
+        next_tick = monotonic()
+        while running() and not controls.quit_requested:
+            pkt = latest()
+            if pkt is not None:
+                frame = self._flip(pkt.frame) if self.mirror else pkt.frame
+                self.draw(frame, pkt)
+            # Showing the frame and pumping GUI events is the preview's main cost besides drawing
+            with tracer.span('display', pkt.seq if pkt is not None else None):
+                if pkt is not None:
+                    cv2.imshow(self.window_name, frame)
+                    self.rendered += 1
+                key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
+                controls.request(QUIT)
+            elif key == ord('c'):
+                controls.request(CALIBRATE)
+            next_tick = max(next_tick + period, monotonic())
+            delay = next_tick - monotonic()
+            if delay > 0:
+                sleep(delay)
+
+    def _flip(self, frame: np.ndarray) -> np.ndarray:
+        if self._flipped is None or self._flipped.shape != frame.shape:
+            self._flipped = np.empty_like(frame)
+        return cv2.flip(frame, 1, dst=self._flipped)
+
+    def close(self):
+        cv2.destroyWindow(self.window_name)
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+
+class TextSprite:
+    """Pre-rendered text as two uint8 layers: color * alpha, and 255 - alpha.
+
+    Blending is frame * inverse / 255 + premultiplied, two saturating OpenCV calls.
+    dx, dy is the offset of the sprite's top-left corner from the putText origin.
+    """
+
+    __slots__ = ('premultiplied', 'inverse', 'dx', 'dy')
+
+    def __init__(self, premultiplied: np.ndarray, inverse: np.ndarray, dx: int, dy: int):
+        self.premultiplied = premultiplied
+        self.inverse = inverse
+        self.dx = dx
+        self.dy = dy
+
+
+class TextSpriteCache:
+    """LRU cache of rasterized text, alpha-blended into frames instead of re-running putText.
+
+    put_text() takes the same arguments as cv2.putText and places the text at the same
+    position; the first call for a given (text, font, scale, color, thickness, line type)
+    rasterizes it once, later calls are a small blend. Meant for static or slowly changing
+    labels; text that changes every frame (e.g. numbers) is cheaper with cv2.putText.
+    Not thread-safe: use one cache per rendering thread.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._sprites: 'OrderedDict[tuple, TextSprite]' = OrderedDict()
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def sprite(self, text: str, font: int, scale: float, color: Tuple[int, int, int],
+               thickness: int = 1, line_type: int = cv2.LINE_AA) -> TextSprite:
+        key = (text, font, scale, tuple(color), thickness, line_type)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = self._render(text, font, scale, color, thickness, line_type)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    @staticmethod
+    def _render(text, font, scale, color, thickness, line_type) -> TextSprite:
+        (tw, th), baseline = cv2.getTextSize(text, font, scale, thickness)
+        pad = thickness + 1
+        mask = np.zeros((th + baseline + 2 * pad, tw + 2 * pad), dtype=np.uint8)
+        cv2.putText(mask, text, (pad, pad + th), font, scale, 255, thickness, line_type)
+        alpha = mask.astype(np.float32)[:, :, None] / 255.0
+        premultiplied = np.clip(alpha * np.asarray(color, dtype=np.float32) + 0.5, 0, 255).astype(np.uint8)
+        inverse = cv2.merge([255 - mask] * 3)
+        return TextSprite(premultiplied, inverse, -pad, -(pad + th))
+
+    def put_text(self, frame: np.ndarray, text: str, org: Tuple[int, int], font: int, scale: float,
+                 color: Tuple[int, int, int], thickness: int = 1, line_type: int = cv2.LINE_AA):
+        """Drop-in for cv2.putText(frame, text, org, font, scale, color, thickness, line_type)."""
+        sprite = self.sprite(text, font, scale, color, thickness, line_type)
+        h, w = sprite.inverse.shape[:2]
+        x0, y0 = int(org[0]) + sprite.dx, int(org[1]) + sprite.dy
+        inverse, premultiplied = sprite.inverse, sprite.premultiplied
+        if x0 < 0 or y0 < 0 or x0 + w > frame.shape[1] or y0 + h > frame.shape[0]:
+            # Clip to the frame
+            fx0, fy0 = max(x0, 0), max(y0, 0)
+            fx1, fy1 = min(x0 + w, frame.shape[1]), min(y0 + h, frame.shape[0])
+            if fx0 >= fx1 or fy0 >= fy1:
+                return
+            sl = (slice(fy0 - y0, fy1 - y0), slice(fx0 - x0, fx1 - x0))
+            inverse, premultiplied = inverse[sl], premultiplied[sl]
+            x0, y0, w, h = fx0, fy0, fx1 - fx0, fy1 - fy0
+        roi = frame[y0:y0 + h, x0:x0 + w]
+        cv2.add(cv2.multiply(roi, inverse, scale=1.0 / 255.0), premultiplied, dst=roi)
+
+
+# Shared cache for the overlay drawn on the rendering thread
+text_cache = TextSpriteCache()
@@ -1,4 +1,5 @@
 import cv2
+from gesture_racer.overlay.sprites import text_cache
 from gesture_racer.utils.types import PoseData
 
 
@@ -13,8 +14,9 @@ def draw_pose(frame, pose: PoseData):
         p = pose.points.get(name)
         if p and p.visibility > 0.5:
             color = (0, 255, 255)
-            cv2.circle(frame, (p.x, p.y), 6, color, -1)
-            cv2.putText(frame, name, (p.x + 5, p.y - 5), font, 0.4, color, 1, cv2.LINE_AA)
+            x, y = int(p.x), int(p.y)
+            cv2.circle(frame, (x, y), 6, color, -1)
+            text_cache.put_text(frame, name, (x + 5, y - 5), font, 0.4, color, 1, cv2.LINE_AA)
 
     # Center text area
-    cv2.putText(frame, 'Gesture Racer Body Mode', (20, 30), font, 0.8, (0, 255, 0), 2, cv2.LINE_AA)
\ No newline at end of file
+    text_cache.put_text(frame, 'Gesture Racer Body Mode', (20, 30), font, 0.8, (0, 255, 0), 2, cv2.LINE_AA)
\ No newline at end of file
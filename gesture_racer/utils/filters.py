@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class EmaFilter:
     """Simple exponential moving average (EMA) filter for smoothing scalar signals.
 
@@ -18,4 +21,58 @@ class EmaFilter:
         else:
             a = self.alpha
             self._y = a * x + (1.0 - a) * self._y
-        return self._y
\ No newline at end of file
+        return self._y
+
+
+class OneEuroFilterBank:
+    """One Euro filter (Casiez et al., CHI 2012) over every element of an array in one pass.
+
+    Each element is low-passed with a cutoff that rises with its own smoothed speed:
+        cutoff = min_cutoff + beta * |dx/dt|
+    so slow, jittery motion is smoothed hard while fast motion passes with little lag.
+    min_cutoff and d_cutoff are in Hz and beta in 1/(units of x); they may be scalars or arrays
+    broadcastable to x (e.g. per-column settings for pixel x/y versus normalized z).
+
+    NaN elements pass through as NaN and restart from their next value.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.01, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._x = None
+        self._dx = None
+        self._t = None
+
+    def reset(self):
+        self._x = None
+        self._dx = None
+        self._t = None
+
+    @staticmethod
+    def _alpha(cutoff, dt: float):
+        tau = 1.0 / (2.0 * np.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def update(self, x: np.ndarray, t: float) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        if self._x is None or self._x.shape != x.shape:
+            self._x = x.copy()
+            self._dx = np.where(np.isnan(x), np.nan, 0.0)
+            self._t = t
+            return self._x.copy()
+        if t <= self._t:
+            # Same (or older) timestamp: no time has passed to filter over
+            return self._x.copy()
+
+        dt = t - self._t
+        self._t = t
+        fresh = np.isnan(self._x)
+        dx = (x - self._x) / dt
+        dx_hat = self._dx + self._alpha(self.d_cutoff, dt) * (dx - self._dx)
+        a = self._alpha(self.min_cutoff + self.beta * np.abs(dx_hat), dt)
+        x_hat = self._x + a * (x - self._x)
+        # Elements without history start at their raw value
+        self._x = np.where(fresh, x, x_hat)
+        self._dx = np.where(fresh & ~np.isnan(x), 0.0, dx_hat)
+        return self._x.copy()
@@ -0,0 +1,191 @@
+import math
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+
+from gesture_racer.utils.types import NUM_LANDMARKS, VISIBILITY, X, Z
+
+CONSTANT_VELOCITY = 'cv'
+CONSTANT_ACCELERATION = 'ca'
+
+
+class LandmarkKalman:
+    """Bank of independent 1-D Kalman filters over every landmark coordinate (x, y, z).
+
+    All NUM_LANDMARKS x 3 filters advance in a handful of NumPy calls per frame. The motion model
+    is constant velocity (state: position, velocity) or constant acceleration (adds acceleration),
+    driven by white noise of spectral density process_noise (px^2/s^3 for CV, px^2/s^5 for CA;
+    None picks a default suited to hand motion at 30 fps for the chosen model).
+    z shares the model with its noise scaled by (measurement_std_z / measurement_std_px)^2.
+
+    - update(landmarks, t) folds in one frame and returns filtered landmarks at t. Landmarks that
+      are NaN (or below min_visibility) are predicted instead, for up to max_dropout_sec; after that
+      they are NaN again and re-initialise on their next measurement. min_visibility defaults to 0,
+      so strategies keep receiving every landmark the tracker reported, as without prediction.
+    - predict_at(t) extrapolates the current estimate to a later time without changing it.
+    - error_stats() reports innovation RMS and, for forecast_horizon_sec, the RMS error of
+      forecasts against the measurement that later arrived (versus simply holding the old
+      measurement), so the horizon and noise settings can be tuned against recorded sessions.
+    """
+
+    def __init__(self,
+                 model: str = CONSTANT_VELOCITY,
+                 process_noise: Optional[float] = None,
+                 measurement_std_px: float = 3.0,
+                 measurement_std_z: float = 0.02,
+                 min_visibility: float = 0.0,
+                 max_dropout_sec: float = 0.1,
+                 forecast_horizon_sec: Optional[float] = None,
+                 num_landmarks: int = NUM_LANDMARKS):
+        if model not in (CONSTANT_VELOCITY, CONSTANT_ACCELERATION):
+            raise ValueError(f'Unknown motion model: {model}')
+        self.model = model
+        self.order = 2 if model == CONSTANT_VELOCITY else 3
+        if process_noise is None:
+            process_noise = 1e5 if model == CONSTANT_VELOCITY else 1e7
+        self.process_noise = process_noise
+        self.min_visibility = min_visibility
+        self.max_dropout_sec = max_dropout_sec
+        self.forecast_horizon_sec = forecast_horizon_sec
+        self.num_landmarks = num_landmarks
+
+        # Coordinates are flattened landmark-major: index 3 * landmark + axis
+        n = num_landmarks * 3
+        scale = np.tile([1.0, 1.0, (measurement_std_z / measurement_std_px) ** 2], num_landmarks)
+        self._noise_scale = scale
+        self._r = measurement_std_px ** 2 * scale
+        self._x = np.zeros((n, self.order))
+        self._p = np.zeros((n, self.order, self.order))
+        self._active = np.zeros(n, dtype=bool)
+        self._last_measured = np.full(num_landmarks, -math.inf)
+        self._visibility = np.zeros(num_landmarks)
+        self._t: Optional[float] = None
+
+        self._innovation_sq = 0.0
+        self._innovation_count = 0
+        self._forecasts: deque = deque()
+        self._forecast_sq = 0.0
+        self._hold_sq = 0.0
+        self._forecast_count = 0
+
+    def reset(self):
+        self._active[:] = False
+        self._last_measured[:] = -math.inf
+        self._t = None
+        self._forecasts.clear()
+
+    def _transition(self, dt: float) -> np.ndarray:
+        if self.order == 2:
+            return np.array([[1.0, dt], [0.0, 1.0]])
+        return np.array([[1.0, dt, dt * dt / 2], [0.0, 1.0, dt], [0.0, 0.0, 1.0]])
+
+    def _process_cov(self, dt: float) -> np.ndarray:
+        if self.order == 2:
+            q = np.array([[dt ** 3 / 3, dt ** 2 / 2], [dt ** 2 / 2, dt]])
+        else:
+            q = np.array([[dt ** 5 / 20, dt ** 4 / 8, dt ** 3 / 6],
+                          [dt ** 4 / 8, dt ** 3 / 3, dt ** 2 / 2],
+                          [dt ** 3 / 6, dt ** 2 / 2, dt]])
+        return self.process_noise * self._noise_scale[:, None, None] * q
+
+    def _predict(self, t: float):
+        if self._t is not None and t > self._t:
+            f = self._transition(t - self._t)
+            self._x = self._x @ f.T
+            self._p = f @ self._p @ f.T + self._process_cov(t - self._t)
+        self._t = t if self._t is None else max(self._t, t)
+
+    def update(self, landmarks: Optional[np.ndarray], t: float) -> Optional[np.ndarray]:
+        """Fold in one frame's (landmarks x 4) array (None = nobody detected) captured at t."""
+        self._predict(t)
+
+        if landmarks is None:
+            measured = np.zeros(self.num_landmarks, dtype=bool)
+            z = np.full(self.num_landmarks * 3, np.nan)
+        else:
+            measured = ~np.isnan(landmarks[:, X]) & (landmarks[:, VISIBILITY] >= self.min_visibility)
+            z = np.asarray(landmarks[:, X:Z + 1], dtype=np.float64).reshape(-1)
+            self._visibility[measured] = landmarks[measured, VISIBILITY]
+            self._score_forecasts(z, measured, t)
+        coord_measured = np.repeat(measured, 3)
+
+        # Kalman update for tracked coordinates (H picks the position)
+        upd = coord_measured & self._active
+        if upd.any():
+            p = self._p[upd]
+            s = p[:, 0, 0] + self._r[upd]
+            k = p[:, :, 0] / s[:, None]
+            innovation = z[upd] - self._x[upd, 0]
+            self._x[upd] += k * innovation[:, None]
+            self._p[upd] = p - k[:, :, None] * p[:, 0, None, :]
+            xy = np.tile([True, True, False], self.num_landmarks)[upd]
+            self._innovation_sq += float(np.sum(innovation[xy] ** 2))
+            self._innovation_count += int(xy.sum())
+
+        # (Re)start coordinates measured for the first time or after a long dropout
+        init = coord_measured & ~self._active
+        if init.any():
+            self._x[init] = 0.0
+            self._x[init, 0] = z[init]
+            self._p[init] = np.diag([1.0] + [1e6] * (self.order - 1))
+            self._p[init, 0, 0] = self._r[init]
+            self._active[init] = True
+
+        self._last_measured[measured] = t
+        expired = t - self._last_measured > self.max_dropout_sec
+        self._active[np.repeat(expired, 3)] = False
+
+        if self.forecast_horizon_sec is not None and landmarks is not None:
+            self._forecasts.append((t, self._x.copy(), self._active.copy(), z.copy(), coord_measured.copy()))
+        return self._output(self._x[:, 0])
+
+    def predict_at(self, t: float) -> Optional[np.ndarray]:
+        """Extrapolate the current estimate to time t (>= the last update) as a (landmarks x 4) array."""
+        if self._t is None:
+            return None
+        return self._output(self._extrapolate(self._x, max(0.0, t - self._t)))
+
+    def _extrapolate(self, x: np.ndarray, dt: float) -> np.ndarray:
+        pos = x[:, 0] + x[:, 1] * dt
+        if self.order == 3:
+            pos = pos + x[:, 2] * (dt * dt / 2)
+        return pos
+
+    def _output(self, positions: np.ndarray) -> Optional[np.ndarray]:
+        active = self._active.reshape(self.num_landmarks, 3)[:, 0]
+        if not active.any():
+            return None
+        out = np.full((self.num_landmarks, 4), np.nan)
+        out[:, X:Z + 1] = positions.reshape(self.num_landmarks, 3)
+        out[:, VISIBILITY] = self._visibility
+        out[~active] = np.nan
+        return out
+
+    def _score_forecasts(self, z: np.ndarray, measured: np.ndarray, t: float):
+        """Compare forecasts made forecast_horizon_sec ago with this frame's measurement."""
+        horizon = self.forecast_horizon_sec
+        if horizon is None:
+            return
+        xy_measured = np.repeat(measured, 3) & np.tile([True, True, False], self.num_landmarks)
+        while self._forecasts and t - self._forecasts[0][0] >= horizon:
+            made_at, x, active, z_then, measured_then = self._forecasts.popleft()
+            ok = xy_measured & active & measured_then
+            if t - made_at > 2 * horizon or not ok.any():
+                continue
+            forecast = self._extrapolate(x, t - made_at)
+            self._forecast_sq += float(np.sum((forecast[ok] - z[ok]) ** 2))
+            self._hold_sq += float(np.sum((z_then[ok] - z[ok]) ** 2))
+            self._forecast_count += int(ok.sum())
+
+    def error_stats(self) -> Dict[str, float]:
+        """Innovation RMS and horizon forecast RMS (x/y, pixels), with the hold-last-value baseline."""
+        def rms(total, count):
+            return math.sqrt(total / count) if count else 0.0
+        return {
+            'innovation_rms_px': rms(self._innovation_sq, self._innovation_count),
+            'innovation_samples': self._innovation_count,
+            'forecast_rms_px': rms(self._forecast_sq, self._forecast_count),
+            'hold_rms_px': rms(self._hold_sq, self._forecast_count),
+            'forecast_samples': self._forecast_count,
+        }
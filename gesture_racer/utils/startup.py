@@ -0,0 +1,64 @@
+import json
+import threading
+from contextlib import contextmanager
+from time import monotonic, time
+from typing import Dict, List, Optional, Tuple
+
+
+class StartupTimeline:
+    """Records when each startup step began and ended, relative to creation of the timeline.
+
+    mark(name) records an instant once; later marks with the same name are ignored, so the
+    per-frame 'first_frame' / 'first_command' checks cost one dict lookup. span(name) records a
+    step's duration. Both may be called from any thread (list.append and dict stores are atomic).
+    """
+
+    def __init__(self):
+        self.origin = monotonic()
+        # Wall-clock time of the origin, so another process can line the timeline up with its own clock
+        self.origin_wall = time()
+        self._events: List[Tuple[str, float, float, str]] = []
+        self._marks: Dict[str, float] = {}
+
+    def seen(self, name: str) -> bool:
+        return name in self._marks
+
+    def mark(self, name: str):
+        if name in self._marks:
+            return
+        now = monotonic()
+        self._marks[name] = now
+        self._events.append((name, now, now, threading.current_thread().name))
+
+    @contextmanager
+    def span(self, name: str):
+        start = monotonic()
+        try:
+            yield
+        finally:
+            self._events.append((name, start, monotonic(), threading.current_thread().name))
+
+    def elapsed_ms(self, name: str) -> Optional[float]:
+        """Milliseconds from the origin to mark name, or None if it has not happened."""
+        at = self._marks.get(name)
+        return None if at is None else (at - self.origin) * 1000.0
+
+    def events(self) -> List[dict]:
+        return [{'name': name, 'start_ms': (start - self.origin) * 1000.0,
+                 'duration_ms': (end - start) * 1000.0, 'thread': thread}
+                for name, start, end, thread in sorted(self._events, key=lambda e: e[1])]
+
+    def format_report(self) -> str:
+        lines = ['Startup timeline:']
+        for ev in self.events():
+            duration = f" ({ev['duration_ms']:.1f}ms)" if ev['duration_ms'] > 0 else ''
+            lines.append(f"  {ev['start_ms']:8.1f}ms  {ev['name']}{duration}  [{ev['thread']}]")
+        return '\n'.join(lines)
+
+    def export_json(self, path: str):
+        with open(path, 'w') as f:
+            json.dump({'origin_wall': self.origin_wall, 'events': self.events()}, f, indent=2)
+
+
+# Process-wide timeline; its origin is the first import of this module
+timeline = StartupTimeline()
@@ -0,0 +1,158 @@
+import json
+import os
+import threading
+from collections import deque
+from time import monotonic
+from typing import Dict, List, Optional
+
+from gesture_racer.utils.stats import percentile
+
+
+class _NullSpan:
+    """Shared no-op context manager returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+# Frames kept by default: about 5.5 minutes at 30 fps
+DEFAULT_MAX_FRAMES = 10000
+# Span budget per kept frame; the app records about 20 (one per strategy included)
+_EVENTS_PER_FRAME = 32
+
+
+class _Span:
+    __slots__ = ('_tracer', '_name', '_frame', '_start')
+
+    def __init__(self, tracer: 'Tracer', name: str, frame: Optional[int]):
+        self._tracer = tracer
+        self._name = name
+        self._frame = frame
+
+    def __enter__(self):
+        self._start = monotonic()
+        return self
+
+    def __exit__(self, *exc):
+        self._tracer.record(self._name, self._start, monotonic(), self._frame)
+        return False
+
+
+class Tracer:
+    """Opt-in per-frame stage tracer with Chrome/Perfetto trace export.
+
+    Disabled (the default), span() returns a shared no-op context manager, so instrumentation
+    can stay in the hot path. Enabled, every span is stored with its thread and frame id.
+    Spans without an explicit frame use the frame set by set_frame() on the current thread.
+    Storage is bounded: only spans and latencies of about the last max_frames frames are kept,
+    so a long session does not grow without limit.
+    """
+
+    def __init__(self, enabled: bool = False, max_frames: int = DEFAULT_MAX_FRAMES):
+        self.enabled = enabled
+        self.max_frames = max_frames
+        self._events: deque = deque(maxlen=max_frames * _EVENTS_PER_FRAME)
+        self._latencies: deque = deque(maxlen=max_frames)
+        self._thread_names: Dict[int, str] = {}
+        self._local = threading.local()
+
+    def set_frame(self, frame: Optional[int]):
+        if self.enabled:
+            self._local.frame = frame
+
+    def span(self, name: str, frame: Optional[int] = None):
+        if not self.enabled:
+            return _NULL_SPAN
+        if frame is None:
+            frame = getattr(self._local, 'frame', None)
+        return _Span(self, name, frame)
+
+    def record(self, name: str, start: float, end: float, frame: Optional[int] = None):
+        """Store a completed span (monotonic seconds). deque.append is atomic, so no lock is needed."""
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        self._events.append((name, start, end, tid, frame))
+
+    def frame_done(self, frame: int, captured_at: float):
+        """Mark a frame's commands as dispatched; records capture-to-input latency."""
+        if not self.enabled:
+            return
+        now = monotonic()
+        self._latencies.append((now - captured_at) * 1000.0)
+        self.record('frame', captured_at, now, frame)
+
+    def clear(self):
+        self._events = deque(maxlen=self.max_frames * _EVENTS_PER_FRAME)
+        self._latencies = deque(maxlen=self.max_frames)
+
+    def stage_durations(self) -> Dict[str, List[float]]:
+        """Span durations in milliseconds grouped by stage name (excluding whole-frame spans)."""
+        grouped: Dict[str, List[float]] = {}
+        # Copy first: other threads may still append while this iterates
+        for name, start, end, _, _ in list(self._events):
+            if name != 'frame':
+                grouped.setdefault(name, []).append((end - start) * 1000.0)
+        return grouped
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage count, mean, p50, p95 and p99 in milliseconds, plus capture_to_input latency."""
+        rows = dict(self.stage_durations())
+        if self._latencies:
+            rows['capture_to_input'] = list(self._latencies)
+        return {
+            name: {
+                'count': len(values),
+                'mean_ms': sum(values) / len(values),
+                'p50_ms': percentile(values, 50),
+                'p95_ms': percentile(values, 95),
+                'p99_ms': percentile(values, 99),
+            }
+            for name, values in rows.items()
+        }
+
+    def format_summary(self) -> str:
+        lines = [f"{'stage':<28}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}  (ms)"]
+        for name, row in self.summary().items():
+            lines.append(f"{name:<28}{row['count']:>8}{row['mean_ms']:>10.2f}{row['p50_ms']:>10.2f}"
+                         f"{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}")
+        return '\n'.join(lines)
+
+    def export_chrome(self, path: str):
+        """Write a Chrome trace-event JSON file (open in chrome://tracing or ui.perfetto.dev).
+
+        Stage spans are complete ('X') events per thread; each frame's capture-to-input lifetime
+        is an async ('b'/'e') event keyed by frame id so frames show up as their own tracks.
+        """
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': tname}}
+                  for tid, tname in self._thread_names.items()]
+        for name, start, end, tid, frame in list(self._events):
+            args = {'frame': frame} if frame is not None else {}
+            if name == 'frame':
+                common = {'name': 'frame', 'cat': 'latency', 'id': frame, 'pid': pid, 'tid': tid, 'args': args}
+                events.append({**common, 'ph': 'b', 'ts': start * 1e6})
+                events.append({**common, 'ph': 'e', 'ts': end * 1e6})
+            else:
+                events.append({'name': name, 'cat': 'stage', 'ph': 'X', 'ts': start * 1e6,
+                               'dur': (end - start) * 1e6, 'pid': pid, 'tid': tid, 'args': args})
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+# Process-wide tracer; instrumented modules call tracer.span(...) unconditionally
+tracer = Tracer(enabled=False)
+
+
+def enable_tracing(max_frames: int = DEFAULT_MAX_FRAMES) -> Tracer:
+    tracer.max_frames = max_frames
+    tracer.clear()
+    tracer.enabled = True
+    return tracer
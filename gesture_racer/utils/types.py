@@ -1,8 +1,43 @@
-from dataclasses import dataclass
-from typing import Optional, Dict
+from dataclasses import dataclass, field
+from enum import IntEnum, IntFlag
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+
+class Intent(IntFlag):
+    """Boolean Command intents, as bits of Command.intents."""
+    FORWARD = 1
+    BACKWARD = 2
+    LEFT = 4
+    RIGHT = 8
+    BRAKE = 16
+    FIRE = 32
+
+
+# Plain ints for hot paths (IntFlag operators are slow)
+_FORWARD, _BACKWARD, _LEFT, _RIGHT, _BRAKE, _FIRE = (int(i) for i in Intent)
+MOVEMENT_INTENTS = _FORWARD | _BACKWARD | _LEFT | _RIGHT
+
+# Command fields in COMMAND_DTYPE order
+COMMAND_FIELDS = ('forward', 'backward', 'left', 'right', 'brake', 'fire',
+                  'mouse_dx', 'mouse_dy', 'mouse_vx', 'mouse_vy')
+
+
+def _intent_property(bit: int, doc: str) -> property:
+    def get(self) -> bool:
+        return self.intents & bit != 0
+
+    def set(self, value: bool):
+        if value:
+            self.intents |= bit
+        else:
+            self.intents &= ~bit
+
+    return property(get, set, doc=doc)
+
+
+@dataclass(init=False)
 class Command:
     """Represents high-level control intents.
 
@@ -10,29 +45,193 @@ class Command:
     - left/right: optional turning intents
     - brake: stop intent
     - fire: trigger a firing action (mouse click)
+
+    The boolean intents are stored as one bitmask, intents (an int of Intent bits), so merging
+    and diffing Commands is a single integer operation. The named attributes read and write
+    those bits as bools, and Command(forward=True, ...) works as it always did.
     """
-    forward: bool = False
-    backward: bool = False
-    left: bool = False
-    right: bool = False
-    brake: bool = False
-    fire: bool = False
+    intents: int = 0
     # Mouse movement deltas (pixels per frame)
     mouse_dx: float = 0.0
     mouse_dy: float = 0.0
+    # Mouse velocity (pixels per second), independent of the camera frame rate
+    mouse_vx: float = 0.0
+    mouse_vy: float = 0.0
+
+    def __init__(self, forward: bool = False, backward: bool = False, left: bool = False, right: bool = False,
+                 brake: bool = False, fire: bool = False, mouse_dx: float = 0.0, mouse_dy: float = 0.0,
+                 mouse_vx: float = 0.0, mouse_vy: float = 0.0, intents: int = 0):
+        intents = int(intents)
+        if forward:
+            intents |= _FORWARD
+        if backward:
+            intents |= _BACKWARD
+        if left:
+            intents |= _LEFT
+        if right:
+            intents |= _RIGHT
+        if brake:
+            intents |= _BRAKE
+        if fire:
+            intents |= _FIRE
+        self.intents = intents
+        self.mouse_dx = mouse_dx
+        self.mouse_dy = mouse_dy
+        self.mouse_vx = mouse_vx
+        self.mouse_vy = mouse_vy
+
+    forward = _intent_property(_FORWARD, 'Movement: forward')
+    backward = _intent_property(_BACKWARD, 'Movement: backward')
+    left = _intent_property(_LEFT, 'Turn left')
+    right = _intent_property(_RIGHT, 'Turn right')
+    brake = _intent_property(_BRAKE, 'Stop: releases the movement keys')
+    fire = _intent_property(_FIRE, 'Fire (mouse click)')
+
+    def as_row(self) -> Tuple:
+        """Values in COMMAND_DTYPE / COMMAND_FIELDS order."""
+        intents = self.intents
+        return (intents & _FORWARD != 0, intents & _BACKWARD != 0, intents & _LEFT != 0,
+                intents & _RIGHT != 0, intents & _BRAKE != 0, intents & _FIRE != 0,
+                self.mouse_dx, self.mouse_dy, self.mouse_vx, self.mouse_vy)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Field name -> value with one bool per intent, e.g. for JSON command logs."""
+        return dict(zip(COMMAND_FIELDS, self.as_row()))
+
+
+# Structured dtype for batches of Commands (one row per frame), see GestureStrategy.evaluate_batch
+COMMAND_DTYPE = np.dtype([(name, '?') for name in COMMAND_FIELDS[:6]] +
+                         [(name, '<f8') for name in COMMAND_FIELDS[6:]])
+
+
+# MediaPipe Pose landmark names, in landmark index order
+LANDMARK_NAMES = (
+    'nose', 'left_eye_inner', 'left_eye', 'left_eye_outer', 'right_eye_inner', 'right_eye', 'right_eye_outer',
+    'left_ear', 'right_ear', 'mouth_left', 'mouth_right', 'left_shoulder', 'right_shoulder', 'left_elbow',
+    'right_elbow', 'left_wrist', 'right_wrist', 'left_pinky', 'right_pinky', 'left_index', 'right_index',
+    'left_thumb', 'right_thumb', 'left_hip', 'right_hip', 'left_knee', 'right_knee', 'left_ankle', 'right_ankle',
+    'left_heel', 'right_heel', 'left_foot_index', 'right_foot_index',
+)
+LANDMARK_INDEX = {name: i for i, name in enumerate(LANDMARK_NAMES)}
+NUM_LANDMARKS = len(LANDMARK_NAMES)
+
+# Landmark order after a horizontal mirror: each left landmark trades places with its right twin
+MIRROR_INDEX = np.array([
+    LANDMARK_INDEX[name.replace('left', '#').replace('right', 'left').replace('#', 'right')]
+    for name in LANDMARK_NAMES
+])
+
+# Integer landmark indices, e.g. pose.landmarks[Landmark.LEFT_WRIST]
+Landmark = IntEnum('Landmark', [(name.upper(), i) for i, name in enumerate(LANDMARK_NAMES)])
+
+# Columns of a PoseData.landmarks row
+X, Y, Z, VISIBILITY = 0, 1, 2, 3
 
 
 @dataclass
 class PosePoint:
     name: str
-    x: int
-    y: int
+    x: float
+    y: float
     z: float
     visibility: float
 
 
+class PosePoints(Mapping[str, PosePoint]):
+    """Read-only name -> PosePoint view over a landmark array, for dict-style strategies.
+
+    Landmarks stored as NaN (not detected) are absent from the view.
+    """
+
+    __slots__ = ('_landmarks',)
+
+    def __init__(self, landmarks: Optional[np.ndarray]):
+        self._landmarks = landmarks
+
+    def __getitem__(self, name: str) -> PosePoint:
+        lm = self._landmarks
+        idx = LANDMARK_INDEX[name]
+        if lm is None:
+            raise KeyError(name)
+        x, y, z, vis = lm[idx].tolist()
+        if x != x:  # NaN
+            raise KeyError(name)
+        return PosePoint(name=name, x=x, y=y, z=z, visibility=vis)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._landmarks is None:
+            return iter(())
+        present = ~np.isnan(self._landmarks[:, X])
+        return (LANDMARK_NAMES[i] for i in np.flatnonzero(present))
+
+    def __len__(self) -> int:
+        if self._landmarks is None:
+            return 0
+        return int(np.count_nonzero(~np.isnan(self._landmarks[:, X])))
+
+
+# gesture_racer.gestures.features.FeatureStore, imported on first use (that module imports this one)
+_FeatureStore = None
+
+
+def _feature_store(pose: 'PoseData'):
+    global _FeatureStore
+    if _FeatureStore is None:
+        from gesture_racer.gestures.features import FeatureStore as _FeatureStore
+    return _FeatureStore(pose)
+
+
 @dataclass
 class PoseData:
+    """Pose for one frame.
+
+    landmarks is a (NUM_LANDMARKS, 4) float64 array of (x_px, y_px, z, visibility) indexed by
+    Landmark, or None when no person was detected. points is a dict-like view over it, features
+    the memoized derived features (gesture_racer.gestures.features).
+    """
     width: int
     height: int
-    points: Dict[str, PosePoint]
\ No newline at end of file
+    landmarks: Optional[np.ndarray] = None
+    # Frame time in seconds (capture clock for cameras, media time for recordings)
+    timestamp: Optional[float] = None
+    # FeatureStore behind the features property; not an init field, so dataclasses.replace()
+    # never carries it over to a pose with different landmarks
+    _features: Any = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def points(self) -> PosePoints:
+        return PosePoints(self.landmarks)
+
+    @property
+    def features(self):
+        """Derived features (wrist_mid, elbow angles, ...), each computed once per frame on first use."""
+        store = self._features
+        if store is None or store.landmarks is not self.landmarks:
+            store = self._features = _feature_store(self)
+        return store
+
+    @classmethod
+    def from_points(cls, width: int, height: int, points: Dict[str, PosePoint],
+                    timestamp: Optional[float] = None) -> 'PoseData':
+        """Build a PoseData from named points; landmarks not given are stored as NaN."""
+        landmarks = None
+        if points:
+            landmarks = np.full((NUM_LANDMARKS, 4), np.nan)
+            for name, p in points.items():
+                landmarks[LANDMARK_INDEX[name]] = (p.x, p.y, p.z, p.visibility)
+        return cls(width=width, height=height, landmarks=landmarks, timestamp=timestamp)
+
+
+@dataclass
+class FramePacket:
+    """A frame travelling through the pipeline, annotated by each stage as it goes.
+
+    timestamp is the monotonic wall time the frame was read (for latency), frame_time is the
+    source's own clock (for time-based gestures; media time when replaying recordings).
+    """
+    seq: int
+    timestamp: float
+    frame: Any
+    frame_time: float = 0.0
+    pose: Optional[PoseData] = None
+    cmd: Optional[Command] = None
\ No newline at end of file
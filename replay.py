@@ -0,0 +1,73 @@
+import argparse
+import json
+from dataclasses import replace
+from time import perf_counter
+
+from gesture_racer.core.landmark_log import LandmarkLogReader
+from gesture_racer.gestures.presets import build_strategy
+from gesture_racer.utils.kalman import CONSTANT_ACCELERATION, CONSTANT_VELOCITY, LandmarkKalman
+
+
+def predict(predictor: LandmarkKalman, pose, horizon_sec: float):
+    if pose.timestamp is None:
+        return pose.landmarks
+    predictor.update(pose.landmarks, pose.timestamp)
+    return predictor.predict_at(pose.timestamp + horizon_sec)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Re-evaluate gesture strategies over a recorded landmark log')
+    parser.add_argument('log', help='Landmark log written by app.py --record')
+    parser.add_argument('--log-commands', metavar='PATH',
+                        help='Write one JSON line per frame with the evaluated Command')
+    parser.add_argument('--batch', action='store_true',
+                        help='Evaluate the whole log at once with the vectorized evaluate_batch path')
+    parser.add_argument('--predict-ms', type=float, default=None,
+                        help='Evaluate on Kalman-predicted landmarks this far ahead and report forecast error')
+    parser.add_argument('--predict-model', default=CONSTANT_VELOCITY, choices=(CONSTANT_VELOCITY, CONSTANT_ACCELERATION))
+    args = parser.parse_args(argv)
+    if args.batch and args.predict_ms is not None:
+        parser.error('--predict-ms runs frame by frame and cannot be combined with --batch')
+
+    reader = LandmarkLogReader(args.log)
+    strategy = build_strategy()
+    out = open(args.log_commands, 'w') if args.log_commands else None
+    counts = {}
+    predictor = None
+    if args.predict_ms is not None:
+        predictor = LandmarkKalman(model=args.predict_model, forecast_horizon_sec=args.predict_ms / 1000.0)
+    start = perf_counter()
+    try:
+        if args.batch:
+            commands = strategy.evaluate_batch(reader.landmarks, reader.width, reader.height, reader.timestamps)
+            rows = (dict(zip(commands.dtype.names, row)) for row in commands.tolist())
+            times = (None if t != t else t for t in reader.timestamps.tolist())
+        else:
+            poses = list(reader)
+            if predictor is not None:
+                poses = [replace(pose, landmarks=predict(predictor, pose, args.predict_ms / 1000.0)) for pose in poses]
+            rows = (strategy.evaluate(pose).as_dict() for pose in poses)
+            times = (pose.timestamp for pose in poses)
+        for seq, (fields, ts) in enumerate(zip(rows, times)):
+            for name, value in fields.items():
+                if value is True:
+                    counts[name] = counts.get(name, 0) + 1
+            if out is not None:
+                out.write(json.dumps({'seq': seq, 'time': ts, **fields}) + '\n')
+    finally:
+        if out is not None:
+            out.close()
+    elapsed = perf_counter() - start
+    print(f'{len(reader)} frames ({reader.width}x{reader.height}) evaluated in {elapsed:.2f}s')
+    for name, n in sorted(counts.items()):
+        print(f'  {name:<9} active in {n} frames')
+    if predictor is not None:
+        stats = predictor.error_stats()
+        print(f"Prediction ({args.predict_model}, {args.predict_ms:.0f} ms): innovation rms "
+              f"{stats['innovation_rms_px']:.2f}px, forecast rms {stats['forecast_rms_px']:.2f}px "
+              f"vs {stats['hold_rms_px']:.2f}px holding the last pose ({stats['forecast_samples']} samples)")
+    reader.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import json
+import time
+
+from gesture_racer.core.session import SessionConfig, SessionServer
+
+
+def load_configs(args) -> list:
+    if args.config:
+        with open(args.config) as f:
+            entries = json.load(f)
+        return [SessionConfig(**entry) for entry in entries]
+    return [SessionConfig(name=f'player{i}', source=src, sink=args.sink, model_complexity=args.model_complexity)
+            for i, src in enumerate(args.sources)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gesture Racer multi-session server')
+    parser.add_argument('--config', help='JSON list of SessionConfig entries')
+    parser.add_argument('--sources', nargs='+', type=lambda s: int(s) if s.isdigit() else s, default=[0],
+                        help='Camera indices or video paths, one session each (ignored with --config)')
+    parser.add_argument('--sink', default='null', choices=('null', 'pynput'))
+    parser.add_argument('--model-complexity', type=int, default=1, choices=(0, 1, 2))
+    parser.add_argument('--report-interval', type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    server = SessionServer(load_configs(args), report_interval_sec=args.report_interval)
+    server.start()
+    # Sessions whose error has been printed; poll() keeps returning their last report
+    failed = set()
+    try:
+        while server.alive():
+            stats = server.poll(timeout=args.report_interval)
+            for s in stats.values():
+                if s.name in failed:
+                    continue
+                if s.error:
+                    print(f'[{s.name}] error:\n{s.error}')
+                    failed.add(s.name)
+                    continue
+                print(f'[{s.name}] cpus={s.cpus} fps={s.fps:.1f} latency p50={s.latency_p50_ms:.1f}ms '
+                      f'p95={s.latency_p95_ms:.1f}ms frames={s.frames} dropped={s.frames_dropped}')
+            time.sleep(0.01)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()